@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Benchmark company typeahead lookups at keystroke rate on synthetic data
+
+Usage: python scripts/benchmarks/company_autocomplete.py [--companies 300000]
+"""
+
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.backend.services.company_service.company_autocomplete import CompanyAutocomplete
+
+SYLLABLES = ["ac", "al", "an", "ar", "ba", "be", "co", "da", "de", "el", "en", "fi", "ga", "go",
+             "in", "ka", "la", "li", "ma", "mi", "na", "no", "or", "pa", "ra", "ri", "sa", "si",
+             "ta", "te", "to", "tr", "ve", "vi", "xo", "ze"]
+WORDS = ["Technologies", "Systems", "Labs", "Health", "Capital", "Bank", "Foods", "Energy",
+         "Analytics", "Software", "Group", "Partners", "Media", "Robotics", "Logistics"]
+SUFFIXES = ["", "", "Inc", "LLC", "Ltd", "Corp"]
+
+
+def company_name(rng: random.Random) -> str:
+    brand = "".join(rng.choice(SYLLABLES) for _ in range(rng.randint(2, 4))).title()
+    return " ".join(part for part in (brand, rng.choice(WORDS), rng.choice(SUFFIXES)) if part)
+
+
+def typo(rng: random.Random, text: str) -> str:
+    position = rng.randrange(1, len(text))
+    return text[:position] + text[position + 1:]
+
+
+def measure(index: CompanyAutocomplete, queries):
+    timings = []
+    for query in queries:
+        start = time.perf_counter()
+        index.search(query, limit=10)
+        timings.append((time.perf_counter() - start) * 1e6)
+    timings.sort()
+    return {
+        "p50": timings[len(timings) // 2],
+        "p99": timings[int(len(timings) * 0.99)],
+        "mean": statistics.fmean(timings),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--companies", type=int, default=300_000)
+    parser.add_argument("--queries", type=int, default=2_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    names = [company_name(rng) for _ in range(args.companies)]
+    counts = {company_id: int(rng.paretovariate(1.2) * 10) for company_id in range(1, args.companies + 1)}
+
+    index = CompanyAutocomplete()
+    start = time.perf_counter()
+    index.bulk_load(enumerate(names, start=1), employee_counts=counts)
+    print(f"Indexed {args.companies:,} companies in {time.perf_counter() - start:.1f}s")
+
+    targets = [rng.choice(names) for _ in range(args.queries)]
+    keystrokes = [name[:length] for name in targets for length in range(1, min(len(name), 12) + 1)]
+    infix = [name.split()[1][:6] for name in targets]
+    typos = [typo(rng, name.split()[0]) for name in targets if len(name.split()[0]) > 4]
+
+    print(f"{'workload':<28}{'queries':>10}{'p50 us':>10}{'p99 us':>10}{'mean us':>10}")
+    for label, queries in (
+        ("keystrokes (cold)", keystrokes),
+        ("keystrokes (warm)", keystrokes),
+        ("infix word", infix),
+        ("typo (one char dropped)", typos),
+    ):
+        result = measure(index, queries)
+        print(f"{label:<28}{len(queries):>10,}{result['p50']:>10.1f}{result['p99']:>10.1f}{result['mean']:>10.1f}")
+
+    start = time.perf_counter()
+    for company_id in range(args.companies + 1, args.companies + 1001):
+        index.add(company_id, company_name(rng))
+    print(f"1,000 incremental adds in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+#!/usr/bin/env python3
+"""
+Benchmark hot read paths with the large JSON/Text columns deferred versus eagerly loaded
+
+Seeds resumes (raw text and parsed data), profiles (raw LinkedIn data) and
+company employees (profile data) with realistic payload sizes, then times
+each query with the default deferred loading and with every column undeferred,
+reporting the bytes fetched from the database per query.
+
+Usage: python scripts/benchmarks/deferred_columns.py [--database-url sqlite:///bench.db] [--users 2000]
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker, undefer
+
+from src.backend.shared.database import Base
+from src.backend.shared.models import User, UserProfile, Resume, Company, CompanyEmployee
+
+WORDS = ["python", "engineer", "team", "lead", "built", "scalable", "systems", "data", "product",
+         "customers", "designed", "improved", "latency", "pipeline", "services", "cloud", "metrics"]
+
+
+def text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def seed(session, users: int, resumes_per_user: int, employees: int, rng: random.Random):
+    session.add_all(User(id=user_id, email=f"user{user_id}@example.com", hashed_password="x") for user_id in range(1, users + 1))
+    session.add_all(
+        UserProfile(
+            user_id=user_id,
+            first_name="Test",
+            last_name=f"User {user_id}",
+            headline=text(rng, 8),
+            skills=rng.sample(WORDS, 6),
+            linkedin_profile_data={"raw": text(rng, 1500), "positions": [{"description": text(rng, 200)} for _ in range(5)]},
+        )
+        for user_id in range(1, users + 1)
+    )
+    for user_id in range(1, users + 1):
+        for _ in range(resumes_per_user):
+            raw_text = text(rng, 1200)
+            session.add(Resume(
+                user_id=user_id,
+                filename="resume.pdf",
+                s3_key=f"resumes/{user_id}/resume.pdf",
+                file_size=120000,
+                file_type="PDF",
+                processing_status="completed",
+                raw_text=raw_text,
+                parsed_data={"raw_text": raw_text, "skills": rng.sample(WORDS, 8), "summary": text(rng, 60)},
+                extracted_skills=rng.sample(WORDS, 8),
+            ))
+    session.add(Company(id=1, name="Example Corp", industry="Software"))
+    session.add_all(
+        CompanyEmployee(
+            company_id=1,
+            linkedin_profile_id=f"employee-{employee_id}",
+            name=f"Employee {employee_id}",
+            position="Software Engineer",
+            skills=rng.sample(WORDS, 6),
+            profile_data={"about": text(rng, 400), "location": "Seattle"},
+        )
+        for employee_id in range(1, employees + 1)
+    )
+    session.commit()
+
+
+def value_bytes(value) -> int:
+    if isinstance(value, (str, bytes)):
+        return len(value)
+    if isinstance(value, (dict, list)):
+        return len(json.dumps(value))
+    return 8
+
+
+def fetched_bytes(session, query) -> int:
+    """Approximate bytes of column data the query pulls from the database"""
+    return sum(value_bytes(value) for row in session.connection().execute(query.statement) for value in row)
+
+
+def measure(Session, label: str, build_query, fetch, repeat: int):
+    results = {}
+    for mode in ("deferred", "eager"):
+        session = Session()
+        start = time.perf_counter()
+        for _ in range(repeat):
+            fetch(build_query(session, mode == "eager"))
+            session.expunge_all()
+        elapsed = (time.perf_counter() - start) / repeat
+        results[mode] = (elapsed, fetched_bytes(session, build_query(session, mode == "eager")))
+        session.close()
+
+    deferred, eager = results["deferred"], results["eager"]
+    print(
+        f"  {label:<36} {eager[0] * 1000:8.2f} ms {eager[1] / 1024:10.1f} KB   ->  "
+        f"{deferred[0] * 1000:8.2f} ms {deferred[1] / 1024:10.1f} KB   ({eager[0] / max(deferred[0], 1e-9):.1f}x faster)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--database-url", default="sqlite://")
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--resumes-per-user", type=int, default=5)
+    parser.add_argument("--employees", type=int, default=5000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine)
+
+    print("Seeding...")
+    session = Session()
+    seed(session, args.users, args.resumes_per_user, args.employees, random.Random(42))
+    session.close()
+
+    user_id = args.users // 2
+    resume_id = args.resumes_per_user * (user_id - 1) + 1
+
+    def query(model, *criteria):
+        return lambda session, eager: session.query(model).options(
+            *([undefer("*")] if eager else [])
+        ).filter(*criteria)
+
+    first = lambda query: query.first()
+    every = lambda query: query.all()
+
+    print(f"\n  {'query':<36} {'eager':>11} {'fetched':>13}       {'deferred':>8} {'fetched':>13}")
+    measure(Session, "get_my_profile (UserProfile)", query(UserProfile, UserProfile.user_id == user_id), first, args.repeat * 10)
+    measure(Session, "autofill lookup (Resume by id)", query(Resume, Resume.id == resume_id), first, args.repeat * 10)
+    measure(Session, "all user resumes (Resume)", query(Resume, Resume.user_id == user_id), every, args.repeat * 10)
+    measure(Session, "company employees (CompanyEmployee)", query(CompanyEmployee, CompanyEmployee.company_id == 1), every, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+"""
+Benchmark the in-process employee inverted index on synthetic data
+
+Usage: python scripts/benchmarks/employee_index.py [--employees 1000000]
+"""
+
+import argparse
+import itertools
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.backend.services.recommendation_service.employee_index import EmployeeIndex
+
+SKILLS = [
+    "Python", "Java", "JavaScript", "TypeScript", "React", "Node.js", "SQL", "PostgreSQL",
+    "AWS", "Azure", "GCP", "Docker", "Kubernetes", "Go", "Rust", "C++", "Machine Learning",
+    "Data Analysis", "Product Management", "Sales", "Marketing", "Finance", "Recruiting",
+    "Figma", "UX Research", "Excel", "Tableau", "Spark", "Kafka", "Terraform",
+] + [f"Skill {i}" for i in range(2000)]
+SENIORITY = ["", "Junior", "Senior", "Staff", "Principal", "Lead"]
+ROLES = ["Software Engineer", "Data Scientist", "Product Manager", "Designer", "Recruiter",
+         "Account Executive", "Engineering Manager", "Marketing Manager", "Analyst"]
+DEPARTMENTS = ["Engineering", "Data", "Product", "Design", "Sales", "Marketing", "People", "Finance"]
+
+
+def generate_rows(count: int, companies: int, seed: int):
+    """Yield synthetic (id, company_id, skills, position, headline, department) rows"""
+    rng = random.Random(seed)
+    # Zipf-like skill popularity: a few skills are very common
+    cum_weights = list(itertools.accumulate(1.0 / (rank + 1) for rank in range(len(SKILLS))))
+    for employee_id in range(1, count + 1):
+        role = rng.choice(ROLES)
+        position = f"{rng.choice(SENIORITY)} {role}".strip()
+        yield (
+            employee_id,
+            rng.randrange(1, companies + 1),
+            rng.choices(SKILLS, cum_weights=cum_weights, k=rng.randint(3, 12)),
+            position,
+            f"{position} at Company",
+            rng.choice(DEPARTMENTS),
+        )
+
+
+def timed(label: str, func, repeat: int = 1):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = func()
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"  {label:<45} {elapsed * 1000:10.3f} ms")
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--employees", type=int, default=1_000_000)
+    parser.add_argument("--companies", type=int, default=5_000)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    index = EmployeeIndex()
+
+    print(f"Building index over {args.employees:,} employees...")
+    start = time.perf_counter()
+    index.bulk_load(generate_rows(args.employees, args.companies, args.seed))
+    build_seconds = time.perf_counter() - start
+    stats = index.stats()
+    print(f"  built in {build_seconds:.1f}s ({args.employees / build_seconds:,.0f} employees/s)")
+    print(f"  {stats['terms']:,} terms, {stats['postings']:,} postings")
+    print(f"  {stats['posting_bytes'] / 1e6:.1f} MB compressed vs {stats['postings'] * 8 / 1e6:.1f} MB as int64 "
+          f"({stats['posting_bytes'] / max(stats['postings'], 1):.2f} bytes/posting)")
+
+    print("Queries (mean of 20 runs):")
+    company_id = args.companies // 2
+    timed("OR  python|react|go", lambda: index.retrieve(skills=["python", "react", "go"]), 20)
+    timed("AND python&aws&docker", lambda: index.retrieve(skills=["python", "aws", "docker"], match="all"), 20)
+    timed("AND senior software engineer", lambda: index.retrieve(title="Senior Software Engineer", match="all"), 20)
+    timed("OR  skills within one company", lambda: index.retrieve(
+        skills=["python", "sql", "figma"], company_id=company_id), 20)
+    timed("AND title + department within one company", lambda: index.retrieve(
+        title="engineer", departments=["engineering"], company_id=company_id, match="all"), 20)
+
+    print("Incremental updates:")
+    rng = np.random.default_rng(args.seed)
+    updates = 10_000
+    employee_ids = rng.integers(1, args.employees + 1, size=updates).tolist()
+    start = time.perf_counter()
+    for employee_id in employee_ids:
+        index.add(employee_id, company_id=company_id, skills=["Python", "Rust"],
+                  position="Staff Software Engineer", department="Engineering")
+    elapsed = time.perf_counter() - start
+    print(f"  {updates:,} updates in {elapsed * 1000:.1f} ms ({updates / elapsed:,.0f} updates/s)")
+    timed("first query after updates (compaction)", lambda: index.retrieve(skills=["rust"]))
+    timed("same query after compaction", lambda: index.retrieve(skills=["rust"]), 20)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Benchmark per-worker memory of the memory-mapped employee feature store
+
+Builds a synthetic snapshot, then starts several worker processes that each
+score users against every company (touching every page). Memory is read from
+/proc/self/smaps_rollup: with mmap the snapshot pages are shared (Pss falls as
+workers are added and Private stays flat), while --copy loads a private copy
+into every worker.
+
+Usage: python scripts/benchmarks/feature_store.py [--employees 1000000] [--workers 4] [--copy]
+"""
+
+import argparse
+import itertools
+import multiprocessing
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.backend.services.recommendation_service.feature_store import FeatureStore, SnapshotWriter, ROW_ARRAYS
+from src.backend.services.recommendation_service.gazetteer import Gazetteer
+from src.backend.services.recommendation_service.industry_matrix import IndustryMatrix
+from src.backend.services.recommendation_service.scoring import ProfileFeatures, ScoringContext
+from src.backend.services.recommendation_service.skill_embeddings import SkillEmbeddings
+
+SKILLS = [
+    "Python", "Java", "JavaScript", "TypeScript", "React", "Node.js", "SQL", "PostgreSQL",
+    "AWS", "Azure", "GCP", "Docker", "Kubernetes", "Go", "Rust", "C++", "Machine Learning",
+    "Data Analysis", "Product Management", "Sales", "Marketing", "Finance", "Recruiting",
+] + [f"Skill {i}" for i in range(2000)]
+LOCATIONS = ["San Francisco, CA", "New York, NY", "Austin, TX", "Seattle", "London", "Berlin", "Toronto", None]
+INDUSTRIES = ["Software", "Financial Services", "Healthcare", "Retail", "Fintech", None]
+TITLES = ["Software Engineer", "Senior Software Engineer", "Director of Engineering", "Intern",
+          "Product Manager", "VP Sales", "Staff Data Scientist"]
+
+
+def build_context() -> ScoringContext:
+    return ScoringContext(IndustryMatrix.load(), Gazetteer(), SkillEmbeddings.build(SKILLS))
+
+
+def profile_rows(count: int, seed: int):
+    rng = random.Random(seed)
+    cum_weights = list(itertools.accumulate(1.0 / (rank + 1) for rank in range(len(SKILLS))))
+    for row_id in range(1, count + 1):
+        yield {
+            "id": row_id,
+            "industry": rng.choice(INDUSTRIES),
+            "location": rng.choice(LOCATIONS),
+            "experience_years": rng.randint(0, 25),
+            "title": rng.choice(TITLES),
+            "skills": rng.choices(SKILLS, cum_weights=cum_weights, k=rng.randint(3, 12)),
+        }
+
+
+def memory_kb() -> dict:
+    with open("/proc/self/smaps_rollup") as f:
+        fields = dict(line.split(":", 1) for line in f.read().splitlines()[1:])
+    return {key: int(fields[key].split()[0]) for key in ("Rss", "Pss", "Private_Clean", "Private_Dirty")}
+
+
+def worker(root: str, copy: bool, users: int, barrier, results):
+    context = build_context()
+    user_features = ProfileFeatures.build(list(profile_rows(users, seed=99)), context)
+    snapshot = FeatureStore(Path(root)).current
+    if copy:
+        for name in list(ROW_ARRAYS) + ["skill_indices"]:
+            setattr(snapshot, name, np.array(getattr(snapshot, name)))
+
+    started = time.perf_counter()
+    matches = 0
+    for company_id in snapshot.company_keys.tolist():
+        scorer = snapshot.company_scorer(company_id, context)
+        matches += sum(1 for _ in scorer.top_matches(user_features, limit=5))
+    elapsed = time.perf_counter() - started
+
+    # Measure while every worker still holds its snapshot
+    barrier.wait()
+    results.put({"seconds": elapsed, "matches": matches, **memory_kb()})
+    barrier.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--employees", type=int, default=1000000)
+    parser.add_argument("--companies", type=int, default=2000)
+    parser.add_argument("--users", type=int, default=16)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--copy", action="store_true", help="Load a private copy per worker instead of mapping")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as root:
+        print(f"Building snapshot with {args.employees:,} employees...")
+        started = time.perf_counter()
+        context = build_context()
+        rng = random.Random(7)
+        company_ids = sorted(rng.randrange(1, args.companies + 1) for _ in range(args.employees))
+        writer = SnapshotWriter(Path(root), args.employees, context)
+        for company_id, row in zip(company_ids, profile_rows(args.employees, seed=1)):
+            writer.add(row["id"], company_id, row["industry"], row["location"],
+                       row["experience_years"], row["title"], row["skills"])
+        version = writer.publish()
+        snapshot_bytes = sum(path.stat().st_size for path in (Path(root) / f"v{version:06d}").iterdir())
+        print(f"  built v{version} in {time.perf_counter() - started:.1f}s, {snapshot_bytes / 1e6:.1f} MB on disk")
+
+        mode = "private copy" if args.copy else "memory-mapped"
+        print(f"\nScoring {args.users} users against every company in {args.workers} workers ({mode})")
+        spawn = multiprocessing.get_context("spawn")
+        barrier = spawn.Barrier(args.workers)
+        results = spawn.Queue()
+        processes = [
+            spawn.Process(target=worker, args=(root, args.copy, args.users, barrier, results))
+            for _ in range(args.workers)
+        ]
+        for process in processes:
+            process.start()
+        reports = [results.get() for _ in processes]
+        for process in processes:
+            process.join()
+
+    print(f"  {'worker':<8} {'seconds':>8} {'Rss MB':>8} {'Pss MB':>8} {'Private MB':>11}")
+    for index, report in enumerate(reports):
+        private = (report["Private_Clean"] + report["Private_Dirty"]) / 1024
+        print(f"  {index:<8} {report['seconds']:8.2f} {report['Rss'] / 1024:8.1f} {report['Pss'] / 1024:8.1f} {private:11.1f}")
+    print(f"  total Pss {sum(report['Pss'] for report in reports) / 1024:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
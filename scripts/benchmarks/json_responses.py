@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Benchmark response serialization per endpoint, default path versus FAST_JSON_RESPONSES
+
+The default path is FastAPI's own: serialize_response validates the returned
+ORM object against the route's response_model, dumps it and JSONResponse
+encodes it with stdlib json. The fast path is orm_response/trusted_payload
+encoded by ORJSONResponse. Both run on the same realistic ORM instances, so
+only serialization is timed (no database, auth or network), and the decoded
+bodies are checked to be identical.
+
+Usage: python scripts/benchmarks/json_responses.py [--repeat 2000]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from src.backend.shared.models import User, UserProfile, Resume
+from src.backend.shared.schemas import (
+    UserResponse,
+    UserProfileResponse,
+    ResumeUploadResponse,
+    ResumeResponse,
+    ResumeSummary,
+    ResumeListResponse,
+)
+from src.backend.shared.responses import trusted_payload
+
+WORDS = ["python", "engineer", "team", "lead", "built", "scalable", "systems", "data", "product",
+         "customers", "designed", "improved", "latency", "pipeline", "services", "cloud", "metrics"]
+
+
+def text(rng: random.Random, words: int) -> str:
+    return " ".join(rng.choice(WORDS) for _ in range(words))
+
+
+def build_objects(rng: random.Random, skills: int, resumes: int):
+    now = datetime.utcnow()
+    user = User(id=1, email="user@example.com", hashed_password="x", is_active=True, created_at=now, updated_at=now)
+    profile = UserProfile(
+        id=1, user_id=1, first_name="Test", last_name="User", headline=text(rng, 10), summary=text(rng, 200),
+        phone="555-0100", location="Seattle, WA", current_position="Staff Engineer", current_company="Example",
+        industry="Software", years_of_experience=12, education_level="Master's", university="State University",
+        graduation_year=2012, major="Computer Science", grade="3.8", linkedin_url="https://linkedin.com/in/test",
+        linkedin_profile_id="test", skills=[f"{rng.choice(WORDS)} {index}" for index in range(skills)],
+        interests=rng.sample(WORDS, 8), created_at=now, updated_at=now,
+    )
+
+    def resume(resume_id: int) -> Resume:
+        return Resume(
+            id=resume_id, user_id=1, filename="resume.pdf", s3_key=f"resumes/1/{resume_id}.pdf", file_size=120000,
+            file_type="PDF", is_primary=resume_id == 1, processing_status="completed",
+            extracted_name="Test User", extracted_email="user@example.com", extracted_phone="555-0100",
+            extracted_skills=rng.sample(WORDS, 12),
+            extracted_education=[{"degree": "MS", "institution": "State University", "year": "2012"} for _ in range(3)],
+            extracted_experience=[{"title": "Engineer", "company": "Example", "description": text(rng, 120)} for _ in range(8)],
+            parsed_data={"summary": text(rng, 80), "linkedin_url": None},
+            created_at=now, updated_at=now,
+        )
+
+    return user, profile, resume(1), [resume(resume_id) for resume_id in range(1, resumes + 1)]
+
+
+class DefaultPath:
+    """FastAPI's response_model serialization followed by JSONResponse"""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self.fields = {}
+
+    def __call__(self, schema, content):
+        if schema not in self.fields:
+            self.fields[schema] = create_response_field(name=f"Response_{schema.__name__}", type_=schema, mode="serialization")
+        value = self.loop.run_until_complete(
+            serialize_response(field=self.fields[schema], response_content=content, is_coroutine=True)
+        )
+        return JSONResponse(value).body
+
+
+def timed(function, repeat: int) -> float:
+    function()
+    started = time.perf_counter()
+    for _ in range(repeat):
+        function()
+    return (time.perf_counter() - started) / repeat
+
+
+def measure(label: str, default, fast, repeat: int):
+    if json.loads(default()) != json.loads(fast()):
+        print(f"✗ {label}: fast path body differs from the default path")
+        sys.exit(1)
+    before, after = timed(default, repeat), timed(fast, repeat)
+    print(f"  {label:<36} {len(fast()) / 1024:8.1f} KB {before * 1e6:10.1f} us {after * 1e6:10.1f} us   ({before / after:.1f}x)")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--repeat", type=int, default=2000)
+    parser.add_argument("--skills", type=int, default=200, help="Skills on the benchmark profile")
+    parser.add_argument("--resumes", type=int, default=100, help="Resumes in the listing page")
+    args = parser.parse_args()
+
+    user, profile, resume, resumes = build_objects(random.Random(42), args.skills, args.resumes)
+    parsed = {"name": resume.extracted_name, "skills": resume.extracted_skills, "summary": resume.parsed_data["summary"]}
+
+    default = DefaultPath()
+
+    print(f"\n  {'endpoint':<36} {'body':>11} {'default':>13} {'fast':>13}")
+    measure(
+        "POST /api/auth/register",
+        lambda: default(UserResponse, user),
+        lambda: ORJSONResponse(trusted_payload(UserResponse, user)).body,
+        args.repeat,
+    )
+    measure(
+        "GET /api/profile/me",
+        lambda: default(UserProfileResponse, profile),
+        lambda: ORJSONResponse(trusted_payload(UserProfileResponse, profile)).body,
+        args.repeat,
+    )
+    measure(
+        "POST /api/resume/upload",
+        lambda: default(ResumeUploadResponse, resume),
+        lambda: ORJSONResponse(trusted_payload(ResumeUploadResponse, resume)).body,
+        args.repeat,
+    )
+    measure(
+        "GET /api/resume/{id}",
+        lambda: default(ResumeResponse, ResumeResponse.model_validate(resume).model_copy(update={"parsed_data": parsed})),
+        lambda: ORJSONResponse(trusted_payload(ResumeResponse, resume, parsed_data=parsed)).body,
+        args.repeat,
+    )
+    measure(
+        f"GET /api/resume ({args.resumes} items)",
+        lambda: default(ResumeListResponse, ResumeListResponse(
+            items=[ResumeSummary.model_validate(row) for row in resumes], next_cursor="cursor"
+        )),
+        lambda: ORJSONResponse({
+            "items": [trusted_payload(ResumeSummary, row) for row in resumes], "next_cursor": "cursor"
+        }).body,
+        max(1, args.repeat // 10),
+    )
+    default.loop.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Exercise LinkedInClient against the local stub API (scripts/linkedin_stub_server.py)
+
+Starts the stub in-process with simulated latency, throttling and 5xx errors,
+then extracts --profiles profiles concurrently through one pooled, rate
+limited LinkedInClient and, with --compare, through a fresh client per request
+without rate limiting. Then repeats the extractions (served by the profile
+cache) and requests --distinct profiles many times at once through a cold
+cache (coalesced into one upstream call each). Reports throughput, failures
+and what the stub saw: requests, 429s, 503s and distinct connections.
+
+Usage: python scripts/benchmarks/linkedin_client.py [--profiles 300] [--client-rate 40] [--compare]
+"""
+
+import argparse
+import asyncio
+import socket
+import sys
+import threading
+import time
+from pathlib import Path
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import httpx
+import uvicorn
+
+from scripts.linkedin_stub_server import create_app
+from src.backend.services.profile_service.linkedin_client import HTTP2_AVAILABLE, LinkedInClient
+from src.backend.services.profile_service.linkedin_scraper import LinkedInScraper
+
+
+def start_stub(args) -> str:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    app = create_app(args.latency_ms, args.jitter_ms, args.server_rate, args.error_rate)
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return f"http://127.0.0.1:{port}"
+
+
+async def run(label: str, extract, profiles: int, concurrency: int, distinct: int = 0):
+    semaphore = asyncio.Semaphore(concurrency)
+    failures = []
+
+    async def one(index: int):
+        async with semaphore:
+            try:
+                await extract(f"https://www.linkedin.com/in/test-user-{index % distinct if distinct else index}/")
+            except Exception as e:
+                failures.append(str(e))
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(index) for index in range(profiles)))
+    elapsed = time.perf_counter() - started
+    print(f"  {label:<28} {elapsed:7.2f}s {profiles / elapsed:8.1f} profiles/s {profiles - len(failures):6d} ok {len(failures):5d} failed")
+
+
+async def stub_stats(base_url: str) -> dict:
+    async with httpx.AsyncClient() as client:
+        return (await client.get(f"{base_url}/stats")).json()
+
+
+def print_stats(before: dict, after: dict):
+    delta = {key: after.get(key, 0) - before.get(key, 0) for key in ("requests", "ok", "throttled", "errors")}
+    print(f"  {'':<28} stub: {delta['requests']} requests, {delta['throttled']} throttled (429), "
+          f"{delta['errors']} errors (503), {after['connections'] - before.get('connections', 0)} new connections")
+
+
+async def main_async(args):
+    base_url = start_stub(args)
+    print(f"Stub API at {base_url}: {args.latency_ms:g}ms ±{args.jitter_ms:g}ms latency, "
+          f"{args.server_rate:g} req/s limit, {args.error_rate:.0%} errors; HTTP/2 {'on' if HTTP2_AVAILABLE else 'unavailable (install h2)'}")
+
+    if args.compare:
+        # Baseline: a new client, and so a new connection, per request and no rate limiting
+        async def naive(url: str):
+            profile_id = LinkedInScraper()._extract_profile_id(url)
+            async with httpx.AsyncClient(base_url=base_url) as client:
+                response = await client.get(f"/profiles/{profile_id}")
+                response.raise_for_status()
+
+        before = await stub_stats(base_url)
+        await run("client per request", naive, args.profiles, args.concurrency)
+        print_stats(before, await stub_stats(base_url))
+        await asyncio.sleep(1.1)
+
+    client = LinkedInClient(base_url, rate=args.client_rate, burst=args.client_rate / 4, max_retries=args.retries, backoff_base=0.1)
+    scraper = LinkedInScraper(client)
+    before = await stub_stats(base_url)
+    await run("pooled + rate limited", scraper.extract_profile, args.profiles, args.concurrency)
+    print_stats(before, await stub_stats(base_url))
+
+    before = await stub_stats(base_url)
+    await run("repeat (cached)", scraper.extract_profile, args.profiles, args.concurrency)
+    print_stats(before, await stub_stats(base_url))
+    await scraper.aclose()
+
+    # Cold cache, many concurrent requests for few profiles
+    scraper = LinkedInScraper(LinkedInClient(base_url, rate=args.client_rate, burst=args.client_rate / 4, max_retries=args.retries, backoff_base=0.1))
+    before = await stub_stats(base_url)
+    await run(f"{args.distinct} profiles (coalesced)", scraper.extract_profile, args.profiles, args.profiles, distinct=args.distinct)
+    print_stats(before, await stub_stats(base_url))
+    await scraper.aclose()
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--profiles", type=int, default=300)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--latency-ms", type=float, default=80)
+    parser.add_argument("--jitter-ms", type=float, default=40)
+    parser.add_argument("--server-rate", type=float, default=50, help="Stub requests per second before 429")
+    parser.add_argument("--error-rate", type=float, default=0.05)
+    parser.add_argument("--client-rate", type=float, default=40, help="Client token bucket rate, requests per second")
+    parser.add_argument("--retries", type=int, default=4)
+    parser.add_argument("--distinct", type=int, default=10, help="Distinct profiles in the coalescing run")
+    parser.add_argument("--compare", action="store_true", help="Also run a client-per-request baseline")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+"""
+End-to-end load test of the user and profile services
+
+Runs --users scripted journeys, --concurrency at a time. Each journey is a
+new user going through:
+
+    register -> login -> create profile -> upload resume -> autofill
+    -> --reads x GET /api/profile/me
+
+With --launch (the default when no service URLs are given) the script starts
+everything it needs locally: both services as uvicorn processes, an
+in-memory S3 stand-in (scripts/s3_stub_server.py) and the LinkedIn API stub
+(scripts/linkedin_stub_server.py), against --database-url (a fresh SQLite
+file by default; use PostgreSQL for representative numbers). Otherwise it
+drives already running services at --user-url and --profile-url.
+
+Reports requests/s, p50/p95/p99 latency and error rate per endpoint, writes
+them to a JSON report (--output) and, with --baseline, prints the change
+against a previous report.
+
+Usage: python scripts/benchmarks/load_test.py [--users 200] [--concurrency 20] [--reads 20] [--output load_test.json]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import socket
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent.parent
+sys.path.insert(0, str(project_root))
+
+import httpx
+import numpy as np
+import uvicorn
+
+from scripts.linkedin_stub_server import create_app as create_linkedin_stub
+from scripts.s3_stub_server import create_app as create_s3_stub
+
+SKILLS = ["Python", "SQL", "AWS", "Docker", "React", "Java", "Kubernetes", "Machine Learning", "Go", "TypeScript"]
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_in_thread(app) -> str:
+    port = free_port()
+    server = uvicorn.Server(uvicorn.Config(app, host="127.0.0.1", port=port, log_level="warning"))
+    threading.Thread(target=server.run, daemon=True).start()
+    while not server.started:
+        time.sleep(0.05)
+    return f"http://127.0.0.1:{port}"
+
+
+def start_service(module: str, env: dict, workers: int) -> tuple:
+    port = free_port()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", f"src.backend.services.{module}.main:app",
+         "--host", "127.0.0.1", "--port", str(port), "--workers", str(workers), "--log-level", "warning"],
+        cwd=project_root,
+        env=env,
+    )
+    return process, f"http://127.0.0.1:{port}"
+
+
+def wait_healthy(url: str, process: subprocess.Popen, timeout: float = 60.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            raise RuntimeError(f"Service at {url} exited with {process.returncode}")
+        try:
+            if httpx.get(f"{url}/health", timeout=1.0).status_code == 200:
+                return
+        except httpx.TransportError:
+            pass
+        time.sleep(0.2)
+    raise RuntimeError(f"Service at {url} did not become healthy")
+
+
+def launch(args):
+    """Start the stubs and both services; returns (user_url, profile_url, processes)"""
+    s3_url = start_in_thread(create_s3_stub(args.s3_latency_ms))
+    linkedin_url = start_in_thread(create_linkedin_stub(args.linkedin_latency_ms, 0, 1e9, 0.0))
+    database_url = args.database_url or f"sqlite:///{tempfile.mkdtemp(prefix='load_test_')}/load_test.db"
+    env = {
+        **os.environ,
+        "DATABASE_URL": database_url,
+        "S3_ENDPOINT_URL": s3_url,
+        "AWS_ACCESS_KEY_ID": "stub",
+        "AWS_SECRET_ACCESS_KEY": "stub",
+        "LINKEDIN_API_URL": linkedin_url,
+        "LINKEDIN_API_RATE_LIMIT": "1000000",
+        "LINKEDIN_API_WINDOW": "1",
+        "LINKEDIN_API_BURST": "1000",
+    }
+    print(f"Launching services against {database_url.split('@')[-1]} (S3 stub {s3_url}, LinkedIn stub {linkedin_url})")
+
+    # The user service creates the tables; start it first so the two do not race
+    user_process, user_url = start_service("user_service", env, args.workers)
+    processes = [user_process]
+    try:
+        wait_healthy(user_url, user_process)
+        profile_process, profile_url = start_service("profile_service", env, args.workers)
+        processes.append(profile_process)
+        wait_healthy(profile_url, profile_process)
+    except Exception:
+        stop(processes)
+        raise
+    return user_url, profile_url, processes
+
+
+def stop(processes):
+    for process in processes:
+        process.terminate()
+    for process in processes:
+        try:
+            process.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+
+def resume_pdf(lines) -> bytes:
+    """A minimal one-page PDF with ``lines`` of Helvetica text"""
+    text = ["BT", "/F1 11 Tf", "14 TL", "72 740 Td"]
+    for line in lines:
+        escaped = line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+        text.append(f"({escaped}) Tj T*")
+    text.append("ET")
+    stream = "\n".join(text).encode("latin-1", "replace")
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R "
+        b"/Resources << /Font << /F1 5 0 R >> >> >>",
+        b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    pdf = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(pdf)
+
+
+class Recorder:
+    """Latency and outcome of every request, keyed by endpoint"""
+
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.statuses = defaultdict(lambda: defaultdict(int))
+
+    async def request(self, client: httpx.AsyncClient, endpoint: str, method: str, url: str, expected=(200,), **kwargs):
+        started = time.perf_counter()
+        try:
+            response = await client.request(method, url, **kwargs)
+        except httpx.HTTPError as e:
+            self.latencies[endpoint].append(time.perf_counter() - started)
+            self.errors[endpoint] += 1
+            self.statuses[endpoint][type(e).__name__] += 1
+            raise JourneyFailed(f"{endpoint}: {type(e).__name__}") from e
+
+        self.latencies[endpoint].append(time.perf_counter() - started)
+        self.statuses[endpoint][str(response.status_code)] += 1
+        if response.status_code not in expected:
+            self.errors[endpoint] += 1
+            raise JourneyFailed(f"{endpoint}: HTTP {response.status_code}")
+        return response
+
+    def summary(self, elapsed: float) -> dict:
+        endpoints = {}
+        for endpoint, samples in self.latencies.items():
+            milliseconds = np.array(samples) * 1000
+            p50, p95, p99 = np.percentile(milliseconds, [50, 95, 99])
+            endpoints[endpoint] = {
+                "requests": len(samples),
+                "errors": self.errors[endpoint],
+                "error_rate": round(self.errors[endpoint] / len(samples), 4),
+                "rps": round(len(samples) / elapsed, 2),
+                "mean_ms": round(float(milliseconds.mean()), 2),
+                "p50_ms": round(float(p50), 2),
+                "p95_ms": round(float(p95), 2),
+                "p99_ms": round(float(p99), 2),
+                "max_ms": round(float(milliseconds.max()), 2),
+                "statuses": dict(self.statuses[endpoint]),
+            }
+        return endpoints
+
+
+class JourneyFailed(Exception):
+    pass
+
+
+async def journey(index: int, args, recorder: Recorder, client: httpx.AsyncClient, run_id: str):
+    email = f"load-{run_id}-{index}@example.com"
+    password = "load-test-password"
+    first_name, last_name = f"Load{index}", "Tester"
+    skills = [SKILLS[(index + offset) % len(SKILLS)] for offset in range(4)]
+
+    await recorder.request(client, "POST /api/auth/register", "POST", f"{args.user_url}/api/auth/register",
+                           expected=(201,), json={"email": email, "password": password})
+    response = await recorder.request(client, "POST /api/auth/login", "POST", f"{args.user_url}/api/auth/login",
+                                      json={"email": email, "password": password})
+    headers = {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+    await recorder.request(client, "POST /api/profile", "POST", f"{args.user_url}/api/profile", expected=(201,),
+                           headers=headers, json={
+                               "first_name": first_name, "last_name": last_name,
+                               "headline": "Software Engineer", "location": "San Francisco, CA",
+                               "industry": "Computer Software", "skills": skills,
+                           })
+
+    pdf = resume_pdf([
+        f"{first_name} {last_name}", email, "+1 555 010 0000", "SKILLS", ", ".join(skills),
+        "EXPERIENCE", "Software Engineer at Acme (2019 - 2023)", "EDUCATION", "BS Computer Science, MIT, 2018",
+    ])
+    response = await recorder.request(client, "POST /api/resume/upload", "POST", f"{args.profile_url}/api/resume/upload",
+                                      expected=(201,), headers=headers,
+                                      files={"file": (f"resume-{index}.pdf", pdf, "application/pdf")})
+    resume_id = response.json()["id"]
+
+    await recorder.request(client, "POST /api/profile/autofill", "POST", f"{args.profile_url}/api/profile/autofill",
+                           headers=headers, data={
+                               "resume_id": str(resume_id),
+                               "linkedin_url": f"https://www.linkedin.com/in/load-{run_id}-{index}/",
+                           })
+
+    etag = None
+    for _ in range(args.reads):
+        read_headers = {**headers, "If-None-Match": etag} if etag and args.revalidate else headers
+        response = await recorder.request(client, "GET /api/profile/me", "GET", f"{args.user_url}/api/profile/me",
+                                          expected=(200, 304), headers=read_headers)
+        etag = response.headers.get("ETag", etag)
+
+
+async def run_load(args) -> dict:
+    recorder = Recorder()
+    semaphore = asyncio.Semaphore(args.concurrency)
+    failures = defaultdict(int)
+    run_id = f"{int(time.time())}-{os.getpid()}"
+    limits = httpx.Limits(max_connections=args.concurrency * 2, max_keepalive_connections=args.concurrency * 2)
+
+    async with httpx.AsyncClient(timeout=args.timeout, limits=limits) as client:
+        async def one(index: int):
+            async with semaphore:
+                try:
+                    await journey(index, args, recorder, client, run_id)
+                except JourneyFailed as e:
+                    failures[str(e)] += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one(index) for index in range(args.users)))
+        elapsed = time.perf_counter() - started
+
+    endpoints = recorder.summary(elapsed)
+    total = sum(endpoint["requests"] for endpoint in endpoints.values())
+    errors = sum(endpoint["errors"] for endpoint in endpoints.values())
+    return {
+        "generated_at": datetime.utcnow().isoformat() + "Z",
+        "git_commit": git_commit(),
+        "host": {"python": platform.python_version(), "platform": platform.platform(), "cpus": os.cpu_count()},
+        "config": {key: value for key, value in vars(args).items() if key not in ("output", "baseline")},
+        "elapsed_seconds": round(elapsed, 3),
+        "journeys": {"completed": args.users - sum(failures.values()), "failed": dict(failures)},
+        "totals": {"requests": total, "errors": errors, "rps": round(total / elapsed, 2)},
+        "endpoints": dict(sorted(endpoints.items())),
+    }
+
+
+def git_commit():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=project_root,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def print_report(report: dict, baseline: dict = None):
+    print(f"\n{report['journeys']['completed']}/{report['config']['users']} journeys completed in "
+          f"{report['elapsed_seconds']:.1f}s, {report['totals']['requests']:,} requests "
+          f"({report['totals']['rps']:.1f}/s), {report['totals']['errors']} errors")
+    for failure, count in report["journeys"]["failed"].items():
+        print(f"  ✗ {count} journeys failed at {failure}")
+
+    print(f"\n  {'endpoint':<30} {'requests':>8} {'rps':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8} {'errors':>7}")
+    for name, endpoint in report["endpoints"].items():
+        print(f"  {name:<30} {endpoint['requests']:>8} {endpoint['rps']:>8.1f} {endpoint['p50_ms']:>8.1f} "
+              f"{endpoint['p95_ms']:>8.1f} {endpoint['p99_ms']:>8.1f} {endpoint['error_rate']:>7.1%}")
+        previous = (baseline or {}).get("endpoints", {}).get(name)
+        if previous:
+            changes = "  ".join(
+                f"{key[:-3]} {(endpoint[key] - previous[key]) / previous[key]:+.0%}"
+                for key in ("p50_ms", "p95_ms", "p99_ms") if previous[key]
+            )
+            rps = f"rps {(endpoint['rps'] - previous['rps']) / previous['rps']:+.0%}" if previous["rps"] else ""
+            print(f"  {'':<30} vs baseline: {rps}  {changes}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=200, help="Journeys to run")
+    parser.add_argument("--concurrency", type=int, default=20, help="Journeys in flight at once")
+    parser.add_argument("--reads", type=int, default=20, help="GET /api/profile/me per journey")
+    parser.add_argument("--revalidate", action="store_true", help="Send If-None-Match on repeated reads")
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--user-url", help="Running user service; skips --launch")
+    parser.add_argument("--profile-url", help="Running profile service; skips --launch")
+    parser.add_argument("--database-url", help="Database for launched services (default: a fresh SQLite file)")
+    parser.add_argument("--workers", type=int, default=1, help="uvicorn workers per launched service")
+    parser.add_argument("--s3-latency-ms", type=float, default=20)
+    parser.add_argument("--linkedin-latency-ms", type=float, default=80)
+    parser.add_argument("--output", default="load_test_report.json", help="Where to write the JSON report")
+    parser.add_argument("--baseline", help="Previous JSON report to compare against")
+    args = parser.parse_args()
+
+    processes = []
+    if not (args.user_url and args.profile_url):
+        args.user_url, args.profile_url, processes = launch(args)
+    try:
+        report = asyncio.run(run_load(args))
+    finally:
+        stop(processes)
+
+    baseline = json.loads(Path(args.baseline).read_text()) if args.baseline else None
+    print_report(report, baseline)
+    Path(args.output).write_text(json.dumps(report, indent=2) + "\n")
+    print(f"\n✓ Report written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Build and publish a recommendation feature store snapshot
+
+Writes every company employee's scoring features (industry and location IDs,
+coordinates, experience, seniority, skill lists and skill vectors) as
+memory-mapped NumPy arrays under $FEATURE_STORE_DIR/v<version>/, then
+atomically points CURRENT at the new version. Running recommendation service
+workers pick it up within FEATURE_STORE_CHECK_SECONDS.
+
+The manifest records the industry matrix version, gazetteer version and
+skill embedding dimensions and version the features were resolved with;
+workers whose tables differ score from the database instead.
+"""
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+from dotenv import load_dotenv
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+load_dotenv()
+
+# Import after path is set
+from src.backend.shared.database import SessionLocal
+from src.backend.services.recommendation_service.feature_store import build_snapshot, context_versions, DEFAULT_FEATURE_STORE_DIR
+from src.backend.services.recommendation_service.gazetteer import DEFAULT_DATA_DIR
+from src.backend.services.recommendation_service.industry_matrix import DEFAULT_INDUSTRIES_PATH
+from src.backend.services.recommendation_service.scoring import ScoringContext
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--root", default=os.getenv("FEATURE_STORE_DIR", DEFAULT_FEATURE_STORE_DIR))
+    parser.add_argument("--batch-size", type=int, default=int(os.getenv("EMPLOYEE_INDEX_BATCH_SIZE", "10000")))
+    parser.add_argument("--keep", type=int, default=3, help="Snapshot versions to keep on disk")
+    args = parser.parse_args()
+
+    context = ScoringContext.load(
+        os.getenv("INDUSTRY_MATRIX_PATH", DEFAULT_INDUSTRIES_PATH),
+        os.getenv("GAZETTEER_DATA_DIR", DEFAULT_DATA_DIR),
+        os.path.join(os.getenv("ML_MODEL_PATH", "./models/"), "skill_embeddings.npz"),
+    )
+
+    started = time.perf_counter()
+    db = SessionLocal()
+    try:
+        print("Building feature store snapshot...")
+        version = build_snapshot(db, Path(args.root), context, batch_size=args.batch_size, keep=args.keep)
+    except Exception as e:
+        print(f"✗ Snapshot build failed: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+
+    print(f"✓ Published snapshot v{version} to {args.root} in {time.perf_counter() - started:.1f}s")
+    print("  " + ", ".join(f"{key}={value}" for key, value in context_versions(context).items()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""
+Build the skill embedding table used for semantic skill similarity
+
+Collects every distinct skill from company employees, user profiles and parsed
+resumes, embeds each one with character n-gram hashing and writes a contiguous
+float32 matrix to $ML_MODEL_PATH/skill_embeddings.npz.
+"""
+
+import argparse
+import os
+import sys
+from pathlib import Path
+from dotenv import load_dotenv
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+load_dotenv()
+
+# Import after path is set
+from src.backend.shared.database import SessionLocal
+from src.backend.shared.models import CompanyEmployee, UserProfile, Resume
+from src.backend.services.recommendation_service.skill_embeddings import SkillEmbeddings, DEFAULT_DIMENSIONS
+
+
+def collect_skills(db, batch_size: int = 10000):
+    """Distinct skill strings across all tables that store skill lists"""
+    skills = set()
+    for column in (CompanyEmployee.skills, UserProfile.skills, Resume.extracted_skills):
+        for (values,) in db.query(column).filter(column.isnot(None)).yield_per(batch_size):
+            skills.update(value for value in values or [] if isinstance(value, str))
+    return skills
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--dimensions", type=int, default=DEFAULT_DIMENSIONS)
+    parser.add_argument(
+        "--output",
+        default=os.path.join(os.getenv("ML_MODEL_PATH", "./models/"), "skill_embeddings.npz"),
+    )
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        print("Collecting skills...")
+        skills = collect_skills(db)
+    finally:
+        db.close()
+
+    embeddings = SkillEmbeddings.build(skills, dimensions=args.dimensions)
+    Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+    embeddings.save(args.output)
+    print(f"✓ Wrote {len(embeddings):,} skills x {embeddings.dimensions} dimensions to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
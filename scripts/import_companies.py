@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Bulk import companies or company employees from CSV or JSONL
+
+Records are streamed from the file (or stdin with "-"), validated against
+CompanyImportRow / CompanyEmployeeImportRow in batches and merged in chunks
+of --chunk-size rows, each committed on its own. On PostgreSQL every chunk is
+COPYed into a staging table and upserted on linkedin_company_id /
+linkedin_profile_id in one statement; rows whose content is unchanged are
+left untouched. Rerunning an import is safe.
+
+Employees reference their company by linkedin_company_id, so import
+companies first. List columns (specialties, skills) may be JSON arrays or
+semicolon-separated; profile_data is a JSON object. Rejected rows are
+reported, and written with their errors to --rejects as JSONL.
+
+Usage: python scripts/import_companies.py {companies,employees} FILE [--format csv|jsonl] [--chunk-size 50000] [--rejects rejects.jsonl]
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+from dotenv import load_dotenv
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+load_dotenv()
+
+# Import after path is set
+from src.backend.shared.database import SessionLocal
+from src.backend.services.company_service.bulk_import import IMPORT_KINDS, import_records, read_records
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("kind", choices=sorted(IMPORT_KINDS))
+    parser.add_argument("path", help="CSV or JSONL file, or - for stdin")
+    parser.add_argument("--format", choices=["csv", "jsonl"], help="Defaults to the file extension")
+    parser.add_argument("--chunk-size", type=int, default=50000, help="Rows per staged merge and commit")
+    parser.add_argument("--rejects", help="Write rejected rows and their errors to this JSONL file")
+    args = parser.parse_args()
+
+    rejects = open(args.rejects, "w", encoding="utf-8") if args.rejects else None
+    db = SessionLocal()
+    started = time.perf_counter()
+    read = merged = written = rejected = 0
+    try:
+        for result in import_records(db, args.kind, read_records(args.path, args.format), args.chunk_size):
+            read += result.read
+            merged += result.merged
+            written += result.written
+            for reject in result.rejected:
+                rejected += 1
+                if rejects:
+                    rejects.write(json.dumps(reject) + "\n")
+                elif rejected <= 20:
+                    print(f"  ✗ line {reject['line']}: {'; '.join(reject['errors'])}")
+
+            elapsed = time.perf_counter() - started
+            print(
+                f"✓ {read:,} rows read, {merged:,} merged ({written:,} new or changed), {rejected:,} rejected "
+                f"({result.read / max(result.seconds, 1e-9):,.0f} rows/s this chunk, {read / elapsed:,.0f} rows/s overall)"
+            )
+    except Exception as e:
+        print(f"✗ Import failed after {read:,} rows: {e}")
+        sys.exit(1)
+    finally:
+        db.close()
+        if rejects:
+            rejects.close()
+
+    elapsed = time.perf_counter() - started
+    print(f"\n✓ Imported {merged:,} {args.kind} ({written:,} new or changed) in {elapsed:.1f}s ({read / max(elapsed, 1e-9):,.0f} rows/s)")
+    if rejected:
+        print(f"✗ {rejected:,} rows rejected" + (f" (see {args.rejects})" if args.rejects else ""))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Local stub of the LinkedIn profile data API for testing LinkedInClient
+
+Serves GET /profiles/{profile_id} and GET /companies/{company_id} with
+simulated latency, throttles clients above --rate requests per second with
+429 + Retry-After, and fails a fraction of requests with 503. Responses carry
+an ETag and honour If-None-Match with 304; a --change-rate fraction of
+requests first changes the resource. GET /stats reports what it served,
+including how many distinct client connections were used.
+
+Usage: python scripts/linkedin_stub_server.py [--port 9100] [--latency-ms 80] [--rate 50] [--error-rate 0.05] [--change-rate 0.1]
+Then run the profile service with LINKEDIN_API_URL=http://localhost:9100
+"""
+
+import argparse
+import asyncio
+import random
+import time
+from collections import Counter
+
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse, Response
+
+
+def create_app(
+    latency_ms: float = 80,
+    jitter_ms: float = 40,
+    rate: float = 50,
+    error_rate: float = 0.05,
+    seed: int = 0,
+    change_rate: float = 0.0,
+) -> FastAPI:
+    app = FastAPI(title="LinkedIn API stub")
+    rng = random.Random(seed)
+    stats = Counter()
+    connections = set()
+    versions = Counter()
+    # Server-side fixed window: at most `rate` requests per second
+    window = {"second": 0, "count": 0}
+
+    async def serve(key: str, request: Request, body):
+        stats["requests"] += 1
+        connections.add((request.client.host, request.client.port))
+
+        second = int(time.time())
+        if window["second"] != second:
+            window.update(second=second, count=0)
+        window["count"] += 1
+        if window["count"] > rate:
+            stats["throttled"] += 1
+            return JSONResponse({"message": "Too many requests"}, status_code=429, headers={"Retry-After": "1"})
+
+        await asyncio.sleep(max(0.0, latency_ms + rng.uniform(-jitter_ms, jitter_ms)) / 1000)
+        if rng.random() < error_rate:
+            stats["errors"] += 1
+            return JSONResponse({"message": "Service unavailable"}, status_code=503)
+
+        if rng.random() < change_rate:
+            versions[key] += 1
+        etag = f'"{key}-{versions[key]}"'
+        if request.headers.get("If-None-Match") == etag:
+            stats["not_modified"] += 1
+            return Response(status_code=304, headers={"ETag": etag})
+
+        stats["ok"] += 1
+        return JSONResponse(body(versions[key]), headers={"ETag": etag})
+
+    @app.get("/profiles/{profile_id}")
+    async def get_profile(profile_id: str, request: Request):
+        name = profile_id.replace("-", " ").title().split(" ", 1)
+        return await serve(f"profile:{profile_id}", request, lambda version: {
+            "first_name": name[0],
+            "last_name": name[1] if len(name) > 1 else "",
+            "headline": f"Software Engineer{f' (v{version})' if version else ''}",
+            "location": "San Francisco Bay Area",
+            "current_position": "Software Engineer",
+            "current_company": "Tech Company",
+            "industry": "Computer Software",
+            "skills": ["Python", "SQL", "AWS"],
+            "linkedin_profile_id": profile_id,
+        })
+
+    @app.get("/companies/{company_id}")
+    async def get_company(company_id: str, request: Request):
+        return await serve(f"company:{company_id}", request, lambda version: {
+            "name": company_id.replace("-", " ").title(),
+            "industry": "Computer Software",
+            "company_size": "1001-5000",
+            "headquarters": "San Francisco, CA",
+            "description": f"A technology company{f' (revision {version})' if version else ''}",
+            "website": f"https://{company_id}.example.com",
+            "specialties": ["Cloud", "Data"],
+            "linkedin_company_id": company_id,
+        })
+
+    @app.get("/stats")
+    async def get_stats():
+        return {**stats, "connections": len(connections)}
+
+    return app
+
+
+def main():
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=9100)
+    parser.add_argument("--latency-ms", type=float, default=80)
+    parser.add_argument("--jitter-ms", type=float, default=40)
+    parser.add_argument("--rate", type=float, default=50, help="Requests per second before throttling")
+    parser.add_argument("--error-rate", type=float, default=0.05, help="Fraction of requests failing with 503")
+    parser.add_argument("--change-rate", type=float, default=0.0, help="Fraction of requests that first change the resource")
+    args = parser.parse_args()
+
+    app = create_app(args.latency_ms, args.jitter_ms, args.rate, args.error_rate, change_rate=args.change_rate)
+    uvicorn.run(app, host="127.0.0.1", port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Add the unique (user_id, employee_id) constraint to connection_recommendations
+
+The batch recompute (scripts/recompute_recommendations.py) upserts with
+ON CONFLICT (user_id, employee_id), which PostgreSQL rejects unless a unique
+index on exactly those columns exists. create_all does not add it to
+existing tables. This migration:
+
+1. Removes duplicate (user_id, employee_id) rows, keeping one per pair: a
+   row the user acted on (any status but pending) first, then the most
+   recently updated, then the newest.
+2. Builds the unique index. On PostgreSQL it is built CONCURRENTLY, so
+   writes continue, and then attached as
+   uq_connection_recommendations_user_employee.
+
+Safe to rerun: it does nothing once the constraint exists. If duplicates are
+written while the index builds, the build fails, the invalid index is
+dropped, and the migration can simply be run again.
+
+Usage: python scripts/migrate_recommendation_constraint.py [--dry-run]
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from dotenv import load_dotenv
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+load_dotenv()
+
+# Import after path is set
+from sqlalchemy import inspect, text
+from src.backend.shared.database import engine
+from src.backend.shared.models import ConnectionRecommendation
+
+TABLE = ConnectionRecommendation.__tablename__
+CONSTRAINT = "uq_connection_recommendations_user_employee"
+
+# Rows ranked within each (user_id, employee_id); everything past the first is a duplicate
+RANKED_DUPLICATES = f"""
+    SELECT id FROM (
+        SELECT id, ROW_NUMBER() OVER (
+            PARTITION BY user_id, employee_id
+            ORDER BY
+                CASE WHEN status IS NULL OR status = 'pending' THEN 1 ELSE 0 END,
+                CASE WHEN updated_at IS NULL THEN 1 ELSE 0 END,
+                updated_at DESC,
+                id DESC
+        ) AS position
+        FROM {TABLE}
+        WHERE user_id IS NOT NULL AND employee_id IS NOT NULL
+    ) ranked
+    WHERE position > 1
+"""
+
+
+def constraint_exists() -> bool:
+    inspector = inspect(engine)
+    if any(constraint["name"] == CONSTRAINT for constraint in inspector.get_unique_constraints(TABLE)):
+        return True
+    # SQLite (and an earlier run interrupted before attaching) only have the unique index
+    return engine.dialect.name != "postgresql" and any(
+        index["name"] == CONSTRAINT and index["unique"] for index in inspector.get_indexes(TABLE)
+    )
+
+
+def count_duplicates() -> int:
+    with engine.connect() as connection:
+        return connection.execute(text(f"SELECT COUNT(*) FROM ({RANKED_DUPLICATES}) duplicates")).scalar()
+
+
+def remove_duplicates() -> int:
+    with engine.begin() as connection:
+        return connection.execute(text(f"DELETE FROM {TABLE} WHERE id IN ({RANKED_DUPLICATES})")).rowcount
+
+
+def add_constraint():
+    if engine.dialect.name != "postgresql":
+        with engine.begin() as connection:
+            connection.execute(text(f"CREATE UNIQUE INDEX IF NOT EXISTS {CONSTRAINT} ON {TABLE} (user_id, employee_id)"))
+        return
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        valid = connection.execute(
+            text("SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)"), {"name": CONSTRAINT}
+        ).scalar()
+        if valid is False:
+            # Left behind by a failed concurrent build
+            connection.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {CONSTRAINT}"))
+        try:
+            connection.execute(text(
+                f"CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS {CONSTRAINT} ON {TABLE} (user_id, employee_id)"
+            ))
+        except Exception:
+            connection.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {CONSTRAINT}"))
+            raise
+        connection.execute(text(f"ALTER TABLE {TABLE} ADD CONSTRAINT {CONSTRAINT} UNIQUE USING INDEX {CONSTRAINT}"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dry-run", action="store_true", help="Only report how many duplicate rows would be removed")
+    args = parser.parse_args()
+
+    try:
+        if constraint_exists():
+            print(f"✓ {TABLE} already has {CONSTRAINT}")
+            return
+
+        if args.dry_run:
+            print(f"✓ {count_duplicates():,} duplicate recommendations would be removed")
+            return
+
+        removed = remove_duplicates()
+        print(f"✓ Removed {removed:,} duplicate recommendations")
+        add_constraint()
+        print(f"✓ Added {CONSTRAINT}")
+    except Exception as e:
+        print(f"✗ Migration failed: {e}")
+        print("  If rows were duplicated while the index was building, run the migration again.")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
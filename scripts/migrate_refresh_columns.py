@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Add the company data refresh columns to existing databases
+
+companies and company_employees gained source_etag, source_last_modified,
+content_hash and last_fetched_at for the refresh scheduler
+(scripts/refresh_company_data.py). create_all does not alter existing
+tables, and every ORM query on them selects these columns, so databases
+created earlier must run this before the new services start. Only missing
+columns are added (nullable, no default, so no table rewrite on
+PostgreSQL). Safe to rerun.
+
+Usage: python scripts/migrate_refresh_columns.py
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from dotenv import load_dotenv
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+load_dotenv()
+
+# Import after path is set
+from sqlalchemy import inspect, text
+from src.backend.shared.database import engine
+from src.backend.shared.models import Company, CompanyEmployee
+
+REFRESH_COLUMNS = ("source_etag", "source_last_modified", "content_hash", "last_fetched_at")
+
+
+def add_missing_columns(model) -> list:
+    """Add any refresh column ``model``'s table lacks; returns the names added"""
+    table = model.__table__
+    existing = {column["name"] for column in inspect(engine).get_columns(table.name)}
+    missing = [name for name in REFRESH_COLUMNS if name not in existing]
+    with engine.begin() as connection:
+        for name in missing:
+            column_type = table.c[name].type.compile(dialect=engine.dialect)
+            connection.execute(text(f"ALTER TABLE {table.name} ADD COLUMN {name} {column_type}"))
+    return missing
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.parse_args()
+
+    try:
+        for model in (Company, CompanyEmployee):
+            added = add_missing_columns(model)
+            if added:
+                print(f"✓ Added {', '.join(added)} to {model.__tablename__}")
+            else:
+                print(f"✓ {model.__tablename__} already has the refresh columns")
+    except Exception as e:
+        print(f"✗ Migration failed: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
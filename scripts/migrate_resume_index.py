@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Add the (user_id, created_at, id) index to resumes on existing databases
+
+GET /api/resume lists a user's resumes newest first with keyset pagination,
+which relies on ix_resumes_user_id_created_at_id. create_all does not add
+indexes to existing tables. On PostgreSQL the index is built CONCURRENTLY,
+so uploads keep working while it builds. Safe to rerun; an invalid index
+left by an interrupted build is dropped and rebuilt.
+
+Usage: python scripts/migrate_resume_index.py
+"""
+
+import argparse
+import sys
+from pathlib import Path
+from dotenv import load_dotenv
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+load_dotenv()
+
+# Import after path is set
+from sqlalchemy import inspect, text
+from src.backend.shared.database import engine
+from src.backend.shared.models import Resume
+
+TABLE = Resume.__tablename__
+INDEX = "ix_resumes_user_id_created_at_id"
+
+
+def index_exists() -> bool:
+    return any(index["name"] == INDEX for index in inspect(engine).get_indexes(TABLE))
+
+
+def create_index():
+    if engine.dialect.name != "postgresql":
+        with engine.begin() as connection:
+            connection.execute(text(f"CREATE INDEX IF NOT EXISTS {INDEX} ON {TABLE} (user_id, created_at, id)"))
+        return
+
+    # CREATE INDEX CONCURRENTLY cannot run inside a transaction
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        valid = connection.execute(
+            text("SELECT indisvalid FROM pg_index WHERE indexrelid = to_regclass(:name)"), {"name": INDEX}
+        ).scalar()
+        if valid is False:
+            # Left behind by an interrupted concurrent build
+            connection.execute(text(f"DROP INDEX CONCURRENTLY IF EXISTS {INDEX}"))
+        connection.execute(text(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {INDEX} ON {TABLE} (user_id, created_at, id)"))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.parse_args()
+
+    try:
+        existed = index_exists()
+        create_index()
+        print(f"✓ {TABLE} already has {INDEX}" if existed else f"✓ Added {INDEX}")
+    except Exception as e:
+        print(f"✗ Migration failed: {e}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
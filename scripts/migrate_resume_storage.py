@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Migrate resumes to the compact storage layout
+
+Older rows keep the resume text twice, uncompressed in resumes.raw_text and
+again inside parsed_data next to copies of every extracted_* field. This
+rewrites them in batches (keyset on id, one commit per batch) so the text is
+stored once, zstd-compressed in raw_text_compressed, and parsed_data keeps
+only the fields without a column of their own. Adds the raw_text_compressed
+column first if the table predates it, and reports the table size before and
+after. Safe to rerun: migrated rows are skipped.
+
+PostgreSQL only returns the space of rewritten rows to the operating system
+after VACUUM FULL (pass --vacuum, which locks the table while it runs).
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from dotenv import load_dotenv
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+load_dotenv()
+
+# Import after path is set
+from sqlalchemy import JSON, LargeBinary, Text, cast, func, inspect, or_, select, text, update
+from src.backend.shared.compression import compress_text
+from src.backend.shared.database import SessionLocal, engine
+from src.backend.shared.models import Resume
+from src.backend.services.profile_service.resume_storage import structure_only
+
+
+def add_compressed_column():
+    columns = {column["name"] for column in inspect(engine).get_columns(Resume.__tablename__)}
+    if "raw_text_compressed" in columns:
+        return False
+    column_type = LargeBinary().compile(dialect=engine.dialect)
+    with engine.begin() as connection:
+        connection.execute(text(f"ALTER TABLE {Resume.__tablename__} ADD COLUMN raw_text_compressed {column_type}"))
+    return True
+
+
+def payload_bytes(db, column) -> int:
+    """Total stored bytes of one column across the table"""
+    if engine.dialect.name == "postgresql":
+        size = func.octet_length(cast(column, Text) if isinstance(column.type, JSON) else column)
+    else:
+        size = func.length(cast(column, LargeBinary))
+    return db.execute(select(func.coalesce(func.sum(size), 0))).scalar()
+
+
+def table_size(db) -> dict:
+    sizes = {
+        "raw_text": payload_bytes(db, Resume.raw_text),
+        "raw_text_compressed": payload_bytes(db, Resume.raw_text_compressed),
+        "parsed_data": payload_bytes(db, Resume.parsed_data),
+    }
+    if engine.dialect.name == "postgresql":
+        sizes["table (with TOAST and indexes)"] = db.execute(
+            text("SELECT pg_total_relation_size(:table)"), {"table": Resume.__tablename__}
+        ).scalar()
+    elif engine.dialect.name == "sqlite":
+        sizes["database file"] = db.execute(text("PRAGMA page_count")).scalar() * db.execute(text("PRAGMA page_size")).scalar()
+    return sizes
+
+
+def migrate(db, batch_size: int) -> int:
+    migrated = 0
+    last_id = 0
+    while True:
+        rows = db.execute(
+            select(Resume.id, Resume.raw_text, Resume.parsed_data)
+            .where(
+                Resume.id > last_id,
+                Resume.raw_text_compressed.is_(None),
+                or_(Resume.raw_text.isnot(None), Resume.parsed_data.isnot(None)),
+            )
+            .order_by(Resume.id)
+            .limit(batch_size)
+        ).all()
+        if not rows:
+            return migrated
+
+        updates = []
+        for row in rows:
+            raw_text = row.raw_text
+            if raw_text is None and row.parsed_data:
+                raw_text = row.parsed_data.get("raw_text")
+            updates.append({
+                "id": row.id,
+                "raw_text_compressed": compress_text(raw_text),
+                "raw_text": None,
+                "parsed_data": structure_only(row.parsed_data),
+            })
+        # Bulk UPDATE ... WHERE id = :id as one executemany
+        db.execute(update(Resume), updates)
+        db.commit()
+
+        migrated += len(rows)
+        last_id = rows[-1].id
+        print(f"  migrated {migrated:,} resumes (through id {last_id})")
+
+
+def vacuum():
+    statement = "VACUUM FULL resumes" if engine.dialect.name == "postgresql" else "VACUUM"
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as connection:
+        connection.execute(text(statement))
+
+
+def format_size(size: int) -> str:
+    return f"{size / 1024 / 1024:,.1f} MB" if size >= 1024 * 1024 else f"{size / 1024:,.1f} KB"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--vacuum", action="store_true", help="Reclaim the space of rewritten rows afterwards")
+    args = parser.parse_args()
+
+    try:
+        if add_compressed_column():
+            print("✓ Added resumes.raw_text_compressed")
+
+        db = SessionLocal()
+        try:
+            before = table_size(db)
+            started = time.perf_counter()
+            print("Migrating resumes to compressed text storage...")
+            migrated = migrate(db, args.batch_size)
+            elapsed = time.perf_counter() - started
+        finally:
+            db.close()
+
+        if args.vacuum:
+            print("Vacuuming...")
+            vacuum()
+
+        db = SessionLocal()
+        try:
+            after = table_size(db)
+        finally:
+            db.close()
+    except Exception as e:
+        print(f"✗ Migration failed: {e}")
+        sys.exit(1)
+
+    print(f"\n  {'':<32} {'before':>12} {'after':>12}")
+    for name in before:
+        print(f"  {name:<32} {format_size(before[name]):>12} {format_size(after[name]):>12}")
+    print(f"\n✓ Migrated {migrated:,} resumes in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,263 @@
+#!/usr/bin/env python3
+"""
+Batch recompute of connection recommendations for every user
+
+Work is sharded by company and spread over a process pool. Each worker loads
+the user features and scoring tables once, then for every company it is given
+loads that company's employee features once, scores all users against them in
+vectorized batches and bulk upserts the best matches per user into
+connection_recommendations.
+
+With --feature-store, employee features are read from the published feature
+store snapshot (scripts/build_feature_store.py) instead of the database, and
+every worker maps the same snapshot pages.
+
+Completed companies are recorded in a checkpoint file, so an interrupted run
+resumes where it stopped (pass --restart to start over).
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+from dotenv import load_dotenv
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+load_dotenv()
+
+# Import after path is set
+from sqlalchemy import func, select
+from src.backend.shared.database import SessionLocal, engine
+from src.backend.shared.models import CompanyEmployee, ConnectionRecommendation, UserProfile
+from src.backend.shared.upsert import upsert_rows
+from src.backend.services.recommendation_service.feature_store import FeatureSnapshot, FeatureStore
+from src.backend.services.recommendation_service.gazetteer import DEFAULT_DATA_DIR
+from src.backend.services.recommendation_service.industry_matrix import DEFAULT_INDUSTRIES_PATH
+from src.backend.services.recommendation_service.scoring import (
+    CompanyScorer,
+    ProfileFeatures,
+    ScoringContext,
+    USER_FEATURE_COLUMNS,
+    company_employee_features,
+    user_profile_features,
+)
+
+SCORE_COLUMNS = (
+    "total_score",
+    "industry_score",
+    "skill_score",
+    "experience_score",
+    "geographic_score",
+    "mutual_connections_score",
+)
+
+# Bound the users x skill-postings working set of one scoring batch
+MAX_BATCH_CELLS = 8_000_000
+
+# Per-process state, set up once by _init_worker
+_worker = {}
+
+
+def load_context() -> ScoringContext:
+    return ScoringContext.load(
+        os.getenv("INDUSTRY_MATRIX_PATH", DEFAULT_INDUSTRIES_PATH),
+        os.getenv("GAZETTEER_DATA_DIR", DEFAULT_DATA_DIR),
+        os.path.join(os.getenv("ML_MODEL_PATH", "./models/"), "skill_embeddings.npz"),
+    )
+
+
+def load_users(db, context: ScoringContext) -> ProfileFeatures:
+    """Features for every user with a profile"""
+    query = db.query(*USER_FEATURE_COLUMNS).order_by(UserProfile.user_id)
+    return user_profile_features(query.yield_per(10000), context)
+
+
+def _init_worker(snapshot_path: Optional[str]):
+    # Never share pooled connections inherited from the parent process
+    engine.dispose(close=False)
+    context = load_context()
+    db = SessionLocal()
+    try:
+        _worker["context"] = context
+        _worker["snapshot"] = FeatureSnapshot(Path(snapshot_path)) if snapshot_path else None
+        _worker["users"] = load_users(db, context)
+    finally:
+        db.close()
+
+
+def recompute_company(company_id: int, run_started: datetime, limit: int, min_score: float, write_batch: int) -> dict:
+    """Score all users against one company and upsert their best matches"""
+    started = time.perf_counter()
+    context = _worker["context"]
+    users = _worker["users"]
+
+    db = SessionLocal()
+    try:
+        snapshot = _worker["snapshot"]
+        if snapshot is not None:
+            scorer = snapshot.company_scorer(company_id, context)
+        else:
+            scorer = CompanyScorer(company_employee_features(db, company_id, context), context)
+        employees = scorer.employees
+        batch_size = max(1, min(1024, MAX_BATCH_CELLS // max(scorer.indices.size, len(employees), 1)))
+
+        written = 0
+        pending = []
+        for start in range(0, len(users), batch_size):
+            for row in scorer.top_matches(users.slice(start, start + batch_size), limit=limit, min_score=min_score):
+                row["updated_at"] = datetime.utcnow()
+                pending.append(row)
+            if len(pending) >= write_batch:
+                written += upsert_rows(db, ConnectionRecommendation, pending, ("user_id", "employee_id"), SCORE_COLUMNS + ("updated_at",))
+                pending = []
+        written += upsert_rows(db, ConnectionRecommendation, pending, ("user_id", "employee_id"), SCORE_COLUMNS + ("updated_at",))
+
+        # Pending recommendations for this company that this run did not refresh are stale
+        stale = db.query(ConnectionRecommendation).filter(
+            ConnectionRecommendation.status == "pending",
+            ConnectionRecommendation.updated_at < run_started,
+            ConnectionRecommendation.employee_id.in_(
+                select(CompanyEmployee.id).where(CompanyEmployee.company_id == company_id)
+            ),
+        ).delete(synchronize_session=False)
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+    return {
+        "company_id": company_id,
+        "employees": len(employees),
+        "pairs": len(employees) * len(users),
+        "written": written,
+        "stale": stale,
+        "seconds": time.perf_counter() - started,
+    }
+
+
+def load_checkpoint(path: Path, restart: bool) -> dict:
+    if path.exists() and not restart:
+        with open(path) as f:
+            return json.load(f)
+    return {"run_started": datetime.utcnow().isoformat(), "completed": {}}
+
+
+def save_checkpoint(path: Path, checkpoint: dict):
+    # Write then rename so a crash never leaves a truncated checkpoint
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "w") as f:
+        json.dump(checkpoint, f)
+    os.replace(tmp_path, path)
+
+
+def format_duration(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h{minutes:02d}m{seconds:02d}s" if hours else f"{minutes}m{seconds:02d}s"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--limit", type=int, default=20, help="Recommendations kept per user per company")
+    parser.add_argument("--min-score", type=float, default=0.0)
+    parser.add_argument("--write-batch", type=int, default=5000, help="Rows per upsert statement")
+    parser.add_argument("--companies", type=int, nargs="*", help="Only recompute these company IDs")
+    parser.add_argument("--checkpoint", default="recommendations_checkpoint.json")
+    parser.add_argument("--restart", action="store_true", help="Ignore an existing checkpoint")
+    parser.add_argument("--feature-store", help="Read employee features from this feature store root")
+    args = parser.parse_args()
+
+    snapshot_path = None
+    if args.feature_store:
+        # Pin the version published now so every shard scores against the same snapshot
+        snapshot = FeatureStore(Path(args.feature_store)).current
+        if snapshot is None:
+            print(f"✗ No feature store snapshot published under {args.feature_store}")
+            sys.exit(1)
+        if not snapshot.matches(load_context()):
+            print(f"✗ Snapshot v{snapshot.version} was built with different scoring tables; rebuild it with scripts/build_feature_store.py")
+            sys.exit(1)
+        snapshot_path = str(snapshot.path)
+        print(f"Using feature store snapshot v{snapshot.version}")
+
+    checkpoint_path = Path(args.checkpoint)
+    checkpoint = load_checkpoint(checkpoint_path, args.restart)
+    run_started = datetime.fromisoformat(checkpoint["run_started"])
+
+    db = SessionLocal()
+    try:
+        query = db.query(CompanyEmployee.company_id, func.count(CompanyEmployee.id)).filter(
+            CompanyEmployee.company_id.isnot(None)
+        ).group_by(CompanyEmployee.company_id)
+        if args.companies:
+            query = query.filter(CompanyEmployee.company_id.in_(args.companies))
+        sizes = dict(query.all())
+        users = db.query(func.count(UserProfile.id)).scalar()
+    finally:
+        db.close()
+
+    completed = {int(company_id) for company_id in checkpoint["completed"]}
+    # Largest companies first so the pool does not end on one long shard
+    shards = sorted((company_id for company_id in sizes if company_id not in completed), key=sizes.get, reverse=True)
+    total_employees = sum(sizes[company_id] for company_id in shards)
+
+    print(f"Recomputing recommendations for {users:,} users")
+    print(f"  {len(shards):,} companies ({total_employees:,} employees) to process, {len(completed):,} already done")
+    if not shards:
+        print("✓ Nothing to do")
+        return
+
+    started = time.perf_counter()
+    done_employees = 0
+    failures = 0
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=args.workers, mp_context=context, initializer=_init_worker, initargs=(snapshot_path,)) as pool:
+        futures = {
+            pool.submit(recompute_company, company_id, run_started, args.limit, args.min_score, args.write_batch): company_id
+            for company_id in shards
+        }
+        for done, future in enumerate(as_completed(futures), start=1):
+            company_id = futures[future]
+            try:
+                result = future.result()
+            except Exception as e:
+                failures += 1
+                print(f"✗ Company {company_id} failed: {e}")
+                continue
+
+            checkpoint["completed"][str(company_id)] = {"written": result["written"], "seconds": round(result["seconds"], 3)}
+            save_checkpoint(checkpoint_path, checkpoint)
+
+            done_employees += result["employees"]
+            elapsed = time.perf_counter() - started
+            rate = done_employees / elapsed if elapsed else 0.0
+            eta = (total_employees - done_employees) / rate if rate else 0.0
+            print(
+                f"✓ Company {company_id}: {result['employees']:,} employees, "
+                f"{result['pairs'] / max(result['seconds'], 1e-9):,.0f} pairs/s, "
+                f"{result['written']:,} upserted, {result['stale']:,} stale removed "
+                f"[{done}/{len(shards)}, ETA {format_duration(eta)}]"
+            )
+
+    elapsed = time.perf_counter() - started
+    print(f"\nProcessed {done_employees:,} employees in {format_duration(elapsed)}")
+    if failures:
+        print(f"✗ {failures} companies failed; rerun to retry them from the checkpoint")
+        sys.exit(1)
+    print("✓ Recompute completed successfully!")
+
+
+if __name__ == "__main__":
+    main()
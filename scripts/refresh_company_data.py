@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Refresh company and employee data from the LinkedIn API within a request budget
+
+Each pass picks the --budget rows with the highest refresh priority
+(staleness since the last check, weighted by how often the employee, or the
+company's employees, appear in connection recommendations) and re-fetches
+them with conditional requests (If-None-Match / If-Modified-Since). Only rows
+whose content hash changed are rewritten; 304s and identical payloads just
+record the check.
+
+The client is configured by LINKEDIN_API_* (see .env.example); its token
+bucket caps the request rate on top of the per-pass budget. With
+--loop-seconds the script runs a pass every that many seconds.
+
+Usage: python scripts/refresh_company_data.py [--budget 1000] [--concurrency 10] [--min-age-hours 24]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from datetime import timedelta
+from pathlib import Path
+from dotenv import load_dotenv
+
+# Add the project root to the Python path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+load_dotenv()
+
+# Import after path is set
+from src.backend.shared.database import SessionLocal
+from src.backend.services.company_service.refresh_scheduler import run_refresh
+from src.backend.services.profile_service.linkedin_client import LinkedInClient
+
+
+async def refresh_once(client: LinkedInClient, args) -> bool:
+    db = SessionLocal()
+    started = time.perf_counter()
+    try:
+        stats = await run_refresh(
+            db,
+            client,
+            budget=args.budget,
+            concurrency=args.concurrency,
+            write_batch=args.write_batch,
+            min_age=timedelta(hours=args.min_age_hours),
+            demand_weight=args.demand_weight,
+            include_companies=not args.employees_only,
+        )
+    finally:
+        db.close()
+
+    elapsed = time.perf_counter() - started
+    print(
+        f"✓ Refreshed {stats['fetched']:,}/{stats['selected']:,} rows in {elapsed:.1f}s: "
+        f"{stats['changed']:,} changed, {stats['not_modified']:,} not modified (304), "
+        f"{stats['unchanged']:,} unchanged content, {stats['errors']:,} errors"
+    )
+    return stats["errors"] == 0
+
+
+async def main_async(args):
+    client = LinkedInClient.from_env()
+    if client is None:
+        print("✗ LINKEDIN_API_URL is not set")
+        sys.exit(1)
+
+    try:
+        while True:
+            ok = await refresh_once(client, args)
+            if not args.loop_seconds:
+                break
+            await asyncio.sleep(args.loop_seconds)
+    finally:
+        await client.aclose()
+
+    if not ok:
+        sys.exit(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--budget", type=int, default=1000, help="Upstream requests per pass")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--min-age-hours", type=float, default=24, help="Skip rows checked more recently")
+    parser.add_argument("--demand-weight", type=float, default=1.0, help="Weight of log(1 + recommendations)")
+    parser.add_argument("--write-batch", type=int, default=500, help="Results per commit")
+    parser.add_argument("--employees-only", action="store_true", help="Do not refresh companies")
+    parser.add_argument("--loop-seconds", type=float, help="Run a pass every this many seconds")
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Local in-memory stand-in for S3 object storage
+
+Serves path-style PUT, GET, HEAD and DELETE on /{bucket}/{key} with optional
+simulated latency, enough for S3Client (upload, download, delete, exists).
+Request signatures are not checked. GET /_stats reports what it served.
+
+Usage: python scripts/s3_stub_server.py [--port 9200] [--latency-ms 0]
+Then run the profile service with S3_ENDPOINT_URL=http://localhost:9200
+"""
+
+import argparse
+import asyncio
+import hashlib
+from collections import Counter
+
+from fastapi import FastAPI, Request, Response
+
+
+def create_app(latency_ms: float = 0) -> FastAPI:
+    app = FastAPI(title="S3 stub")
+    objects = {}
+    stats = Counter()
+
+    async def delay():
+        if latency_ms:
+            await asyncio.sleep(latency_ms / 1000)
+
+    def not_found() -> Response:
+        body = "<?xml version=\"1.0\" encoding=\"UTF-8\"?><Error><Code>NoSuchKey</Code></Error>"
+        return Response(body, status_code=404, media_type="application/xml")
+
+    @app.get("/_stats")
+    async def get_stats():
+        return {**stats, "objects": len(objects), "bytes": sum(len(body) for body in objects.values())}
+
+    @app.put("/{bucket}/{key:path}")
+    async def put_object(bucket: str, key: str, request: Request):
+        await delay()
+        body = await request.body()
+        objects[(bucket, key)] = body
+        stats["put"] += 1
+        return Response(headers={"ETag": f'"{hashlib.md5(body).hexdigest()}"'})
+
+    @app.get("/{bucket}/{key:path}")
+    async def get_object(bucket: str, key: str):
+        await delay()
+        stats["get"] += 1
+        body = objects.get((bucket, key))
+        return not_found() if body is None else Response(body, media_type="application/octet-stream")
+
+    @app.head("/{bucket}/{key:path}")
+    async def head_object(bucket: str, key: str):
+        await delay()
+        stats["head"] += 1
+        body = objects.get((bucket, key))
+        return Response(status_code=404) if body is None else Response(headers={"Content-Length": str(len(body))})
+
+    @app.delete("/{bucket}/{key:path}")
+    async def delete_object(bucket: str, key: str):
+        await delay()
+        stats["delete"] += 1
+        objects.pop((bucket, key), None)
+        return Response(status_code=204)
+
+    return app
+
+
+def main():
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=9200)
+    parser.add_argument("--latency-ms", type=float, default=0, help="Delay added to every request")
+    args = parser.parse_args()
+
+    uvicorn.run(create_app(args.latency_ms), host="127.0.0.1", port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,342 +1,578 @@
 #!/usr/bin/env python3
 """
-Database seeding script for LinkedIn Networking Application
+Deterministic synthetic data generator for LinkedIn Networking Application
+
+Generates users with profiles and resumes, companies, company employees and
+connection recommendations at any scale, reproducibly: the same --seed and
+counts always produce the same rows (with --fixed-clock, the same timestamps
+too). Distributions are meant to look like
+production rather than uniform noise:
+
+- Industries come from the recommendation service's industry matrix, with
+  technology and finance over-represented; locations from its gazetteer,
+  Zipf-weighted so a few metros dominate.
+- Company sizes are heavy-tailed (a few very large employers, a long tail of
+  small ones) and employees inherit their company's sector and mostly its
+  headquarters.
+- Skills are drawn Zipf-weighted from a per-sector pool plus common skills,
+  so popular skills are shared widely and rare ones are rare.
+- Recommendations favour employees in the user's own sector.
+
+Rows get explicit ids after the current maximum and are streamed in batches
+of --batch-size: COPY on PostgreSQL, batched INSERTs elsewhere. Every user
+shares one password hash (--password), so generated users can log in.
+
+Usage: python scripts/seed.py [--seed 42] [--users 1000] [--companies 200] [--employees 20000] [--recommendations-per-user 20]
 """
 
-import os
-import sys
-import asyncio
-import asyncpg
+import argparse
+import bisect
+import csv
 import json
-from pathlib import Path
+import random
+import sys
+import time
+from array import array
 from datetime import datetime, timedelta
-import uuid
+from pathlib import Path
+from dotenv import load_dotenv
 
 # Add the project root to the Python path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from src.backend.core.config import settings
+load_dotenv()
+
+# Import after path is set
+from sqlalchemy import func
+from src.backend.shared.bulk_load import load_rows, reset_id_sequence
+from src.backend.shared.compression import compress_text
+from src.backend.shared.database import Base, SessionLocal, engine
+from src.backend.shared.models import Company, CompanyEmployee, ConnectionRecommendation, Resume, User, UserProfile
+from src.backend.services.recommendation_service.gazetteer import DEFAULT_DATA_DIR
+from src.backend.services.recommendation_service.industry_matrix import DEFAULT_INDUSTRIES_PATH
+from src.backend.services.recommendation_service.scoring import CULTURE_FIT_SCORE, MUTUAL_CONNECTIONS_SCORE, WEIGHTS
+from src.backend.services.user_service.auth import get_password_hash
+
+# Relative share of companies per sector
+SECTOR_WEIGHTS = {
+    "technology": 30, "finance": 15, "healthcare": 12, "consulting": 8, "media": 6, "commerce": 10,
+    "industrial": 7, "energy": 4, "education": 4, "public": 2, "real_estate": 2,
+}
+
+COMMON_SKILLS = [
+    "Communication", "Leadership", "Project Management", "Microsoft Excel", "Teamwork", "Problem Solving",
+    "Public Speaking", "Negotiation", "Strategic Planning", "Data Analysis",
+]
+
+SECTOR_SKILLS = {
+    "technology": [
+        "Python", "JavaScript", "SQL", "AWS", "Java", "React", "Docker", "Kubernetes", "Go", "TypeScript",
+        "Machine Learning", "PostgreSQL", "Linux", "Git", "Node.js", "C++", "Rust", "Terraform", "GraphQL", "Kafka",
+    ],
+    "finance": [
+        "Financial Modeling", "Risk Management", "Accounting", "Valuation", "Bloomberg", "Excel VBA", "Python",
+        "Portfolio Management", "Due Diligence", "Financial Reporting", "SQL", "Corporate Finance", "Derivatives",
+    ],
+    "healthcare": [
+        "Patient Care", "Clinical Research", "Healthcare Management", "EMR", "HIPAA", "Medical Devices",
+        "Regulatory Affairs", "Biostatistics", "Nursing", "Pharmacology", "GCP",
+    ],
+    "consulting": [
+        "Management Consulting", "Business Strategy", "Change Management", "Stakeholder Management",
+        "PowerPoint", "Business Analysis", "Process Improvement", "Market Research", "Tableau",
+    ],
+    "media": [
+        "Content Strategy", "Copywriting", "Social Media Marketing", "SEO", "Adobe Creative Suite", "Video Editing",
+        "Journalism", "Brand Management", "Digital Marketing", "Google Analytics",
+    ],
+    "commerce": [
+        "E-commerce", "Merchandising", "Supply Chain Management", "Retail Operations", "Sales", "CRM",
+        "Customer Service", "Inventory Management", "Category Management", "Salesforce",
+    ],
+    "industrial": [
+        "Lean Manufacturing", "Six Sigma", "AutoCAD", "SolidWorks", "Quality Assurance", "Mechanical Engineering",
+        "Operations Management", "Logistics", "PLC Programming", "Procurement",
+    ],
+    "energy": [
+        "Renewable Energy", "Power Systems", "Oil and Gas", "Energy Efficiency", "Electrical Engineering",
+        "HSE", "Project Engineering", "Grid Integration", "Petroleum Engineering",
+    ],
+    "education": [
+        "Curriculum Development", "Teaching", "Instructional Design", "Educational Technology", "Research",
+        "Student Counseling", "Classroom Management", "E-Learning",
+    ],
+    "public": [
+        "Public Policy", "Government Relations", "Program Management", "Grant Writing", "Policy Analysis",
+        "Community Outreach", "Nonprofit Management",
+    ],
+    "real_estate": [
+        "Real Estate Development", "Property Management", "Commercial Real Estate", "Leasing", "Appraisal",
+        "Construction Management", "Real Estate Finance",
+    ],
+}
+
+# (title, department) per sector; seniority prefixes are added separately
+SECTOR_ROLES = {
+    "technology": [("Software Engineer", "Engineering"), ("Data Scientist", "Data"), ("Product Manager", "Product"),
+                   ("DevOps Engineer", "Engineering"), ("UX Designer", "Design"), ("Engineering Manager", "Engineering"),
+                   ("Data Engineer", "Data"), ("Security Engineer", "Security"), ("Account Executive", "Sales")],
+    "finance": [("Financial Analyst", "Finance"), ("Investment Banker", "Investment Banking"), ("Accountant", "Accounting"),
+                ("Risk Analyst", "Risk"), ("Portfolio Manager", "Asset Management"), ("Quantitative Analyst", "Trading")],
+    "healthcare": [("Registered Nurse", "Nursing"), ("Clinical Research Associate", "Research"), ("Physician", "Medical"),
+                   ("Healthcare Administrator", "Operations"), ("Regulatory Affairs Specialist", "Regulatory")],
+    "consulting": [("Consultant", "Consulting"), ("Business Analyst", "Consulting"), ("Engagement Manager", "Consulting"),
+                   ("Strategy Analyst", "Strategy")],
+    "media": [("Content Strategist", "Content"), ("Marketing Manager", "Marketing"), ("Editor", "Editorial"),
+              ("Social Media Manager", "Marketing"), ("Graphic Designer", "Design")],
+    "commerce": [("Buyer", "Merchandising"), ("Store Manager", "Retail"), ("Supply Chain Analyst", "Operations"),
+                 ("Sales Representative", "Sales"), ("E-commerce Manager", "Digital")],
+    "industrial": [("Mechanical Engineer", "Engineering"), ("Operations Manager", "Operations"),
+                   ("Quality Engineer", "Quality"), ("Logistics Coordinator", "Logistics")],
+    "energy": [("Electrical Engineer", "Engineering"), ("Project Engineer", "Projects"), ("HSE Specialist", "HSE"),
+               ("Energy Analyst", "Strategy")],
+    "education": [("Teacher", "Teaching"), ("Professor", "Faculty"), ("Instructional Designer", "Learning"),
+                  ("Academic Advisor", "Student Services")],
+    "public": [("Policy Analyst", "Policy"), ("Program Manager", "Programs"), ("Grant Writer", "Development")],
+    "real_estate": [("Property Manager", "Property Management"), ("Real Estate Agent", "Sales"),
+                    ("Development Manager", "Development")],
+}
+
+# (prefix, weight, experience range in years)
+SENIORITY = [("Junior ", 20, (0, 3)), ("", 40, (2, 8)), ("Senior ", 25, (5, 15)), ("Lead ", 8, (8, 20)),
+             ("Director of ", 5, (12, 25)), ("VP of ", 2, (15, 30))]
+
+FIRST_NAMES = [
+    "James", "Mary", "Robert", "Patricia", "John", "Jennifer", "Michael", "Linda", "David", "Elizabeth", "William",
+    "Barbara", "Richard", "Susan", "Joseph", "Jessica", "Thomas", "Sarah", "Wei", "Priya", "Carlos", "Sofia", "Ahmed",
+    "Fatima", "Hiroshi", "Yuki", "Olga", "Ivan", "Chen", "Aisha", "Lucas", "Emma", "Mateo", "Ana", "Raj", "Mei",
+    "Daniel", "Nisha", "Kwame", "Amara",
+]
+
+LAST_NAMES = [
+    "Smith", "Johnson", "Williams", "Brown", "Jones", "Garcia", "Miller", "Davis", "Rodriguez", "Martinez",
+    "Hernandez", "Lopez", "Wilson", "Anderson", "Thomas", "Taylor", "Moore", "Jackson", "Lee", "Wang", "Zhang",
+    "Patel", "Kumar", "Singh", "Kim", "Nguyen", "Chen", "Tanaka", "Sato", "Ivanov", "Müller", "Rossi", "Silva",
+    "Okafor", "Mensah", "Cohen", "Ali", "Khan", "Park", "Novak",
+]
+
+UNIVERSITIES = [
+    "Stanford University", "MIT", "UC Berkeley", "Harvard University", "University of Michigan", "Georgia Tech",
+    "University of Texas at Austin", "University of Washington", "Carnegie Mellon University", "NYU",
+    "University of Toronto", "Imperial College London", "University of Illinois", "Cornell University",
+    "Arizona State University", "Penn State University",
+]
+
+MAJORS = {
+    "technology": "Computer Science", "finance": "Finance", "healthcare": "Biology", "consulting": "Economics",
+    "media": "Communications", "commerce": "Business Administration", "industrial": "Mechanical Engineering",
+    "energy": "Electrical Engineering", "education": "Education", "public": "Political Science",
+    "real_estate": "Business Administration",
+}
+
+EDUCATION_LEVELS = [("Bachelor's", 60), ("Master's", 28), ("PhD", 5), ("Associate", 7)]
+
+COMPANY_WORDS = [
+    "Apex", "Blue", "Summit", "Nova", "Quantum", "Pioneer", "Silver", "Bright", "Vertex", "Harbor", "Atlas", "Cedar",
+    "Crescent", "Evergreen", "Falcon", "Granite", "Horizon", "Iron", "Keystone", "Lumen", "Meridian", "Northstar",
+    "Orion", "Pinnacle", "Redwood", "Sterling", "Titan", "Unity", "Vanguard", "Zenith",
+]
+
+SECTOR_NOUNS = {
+    "technology": ["Labs", "Systems", "Software", "Networks", "Data"], "finance": ["Capital", "Partners", "Financial"],
+    "healthcare": ["Health", "Medical", "Therapeutics"], "consulting": ["Advisory", "Consulting", "Group"],
+    "media": ["Media", "Studios", "Creative"], "commerce": ["Retail", "Brands", "Goods"],
+    "industrial": ["Industries", "Manufacturing", "Logistics"], "energy": ["Energy", "Power", "Renewables"],
+    "education": ["Learning", "Academy", "Education"], "public": ["Foundation", "Institute"],
+    "real_estate": ["Properties", "Realty", "Development"],
+}
+
+# Most common locations first
+MAJOR_METROS = [
+    "New York", "San Francisco", "London", "Seattle", "Boston", "Los Angeles", "Bangalore", "Toronto", "Chicago",
+    "Austin", "Washington", "Berlin", "Singapore", "Paris", "Atlanta", "Dallas", "Sydney", "Denver", "Amsterdam",
+    "Tel Aviv", "San Jose", "Dublin", "Mumbai", "Tokyo",
+]
+
+COMPANY_SIZES = [(10, "1-10"), (50, "11-50"), (200, "51-200"), (500, "201-500"), (1000, "501-1000"),
+                 (5000, "1001-5000"), (10000, "5001-10000"), (float("inf"), "10001+")]
+
+RECOMMENDATION_STATUSES = [("pending", 85), ("sent", 8), ("accepted", 5), ("rejected", 2)]
+
+
+def cumulative(weights):
+    total, result = 0.0, []
+    for weight in weights:
+        total += weight
+        result.append(total)
+    return result
+
+
+def zipf_weights(count: int, exponent: float = 1.1):
+    return cumulative(1.0 / rank ** exponent for rank in range(1, count + 1))
+
+
+class Vocabulary:
+    """Reference data the generator draws from, loaded from the recommendation service's data files"""
+
+    def __init__(self):
+        spec = json.loads(Path(DEFAULT_INDUSTRIES_PATH).read_text())
+        self.sectors = [sector for sector in spec["sectors"] if sector in SECTOR_WEIGHTS]
+        self.sector_weights = cumulative(SECTOR_WEIGHTS[sector] for sector in self.sectors)
+        self.industries = {sector: spec["sectors"][sector] for sector in self.sectors}
+
+        with open(Path(DEFAULT_DATA_DIR) / "locations.csv", newline="", encoding="utf-8") as f:
+            places = [(row["name"], f"{row['name']}, {row['region'] or row['country']}") for row in csv.DictReader(f)]
+        # Major hubs take the head of the Zipf distribution, the rest follow in file order
+        rank = {name: index for index, name in enumerate(MAJOR_METROS)}
+        self.locations = [place for _, place in sorted(places, key=lambda item: rank.get(item[0], len(rank)))]
+        self.location_weights = zipf_weights(len(self.locations))
+
+        self.skills = {sector: SECTOR_SKILLS[sector] + COMMON_SKILLS for sector in self.sectors}
+        self.skill_weights = {sector: zipf_weights(len(skills), 0.9) for sector, skills in self.skills.items()}
+
+
+class Generator:
+    """
+    Row factories for every table. Each table draws from its own random
+    stream derived from the seed, so changing one table's count does not
+    change the rows generated for another.
+    """
+
+    def __init__(self, seed: int, vocabulary: Vocabulary, now: datetime):
+        self.seed = seed
+        self.vocabulary = vocabulary
+        self.now = now
+
+    def rng(self, table: str) -> random.Random:
+        return random.Random(f"{self.seed}:{table}")
+
+    def person_name(self, rng):
+        return rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+
+    def timestamp(self, rng, max_days: int = 3 * 365) -> datetime:
+        return self.now - timedelta(seconds=rng.randrange(max_days * 86400))
+
+    def sector(self, rng) -> str:
+        return rng.choices(self.vocabulary.sectors, cum_weights=self.vocabulary.sector_weights)[0]
 
-async def seed_database():
-    """Seed the database with sample data"""
+    def location(self, rng) -> str:
+        return rng.choices(self.vocabulary.locations, cum_weights=self.vocabulary.location_weights)[0]
+
+    def skills(self, rng, sector: str, low: int = 3, high: int = 12):
+        drawn = rng.choices(self.vocabulary.skills[sector], cum_weights=self.vocabulary.skill_weights[sector], k=rng.randint(low, high))
+        return list(dict.fromkeys(drawn))
+
+    def role(self, rng, sector: str):
+        title, department = rng.choice(SECTOR_ROLES[sector])
+        prefix, _, (low, high) = rng.choices(SENIORITY, cum_weights=SENIORITY_WEIGHTS)[0]
+        if prefix in ("Director of ", "VP of "):
+            title = department
+        return f"{prefix}{title}", department, rng.randint(low, high)
+
+    def company_weights(self, count: int):
+        """Pareto-distributed size weights: a few employers dominate, with a long tail of small ones"""
+        rng = self.rng("company-sizes")
+        return [rng.paretovariate(1.16) for _ in range(count)]
+
+    def companies(self, first_id: int, expected_sizes):
+        """(company row, sector) for each expected headcount in ``expected_sizes``"""
+        rng = self.rng("companies")
+        for offset, expected_size in enumerate(expected_sizes):
+            company_id = first_id + offset
+            sector = self.sector(rng)
+            headquarters = self.location(rng)
+            name = f"{rng.choice(COMPANY_WORDS)} {rng.choice(SECTOR_NOUNS[sector])}"
+            created_at = self.timestamp(rng)
+            yield {
+                "id": company_id,
+                "name": f"{name} {company_id}",
+                "linkedin_company_id": f"synthetic-{self.seed}-{company_id}",
+                "industry": rng.choice(self.vocabulary.industries[sector]),
+                "company_size": next(label for limit, label in COMPANY_SIZES if expected_size <= limit),
+                "headquarters": headquarters,
+                "description": f"{name} is a {sector.replace('_', ' ')} company headquartered in {headquarters}.",
+                "website": f"https://www.{name.lower().replace(' ', '')}{company_id}.example.com",
+                "specialties": self.skills(rng, sector, 2, 5),
+                "created_at": created_at,
+                "updated_at": created_at,
+            }, sector
+
+    def employees(self, first_id: int, count: int, companies, company_weights):
+        """
+        (employee row, sector index) for ``count`` employees spread over
+        ``companies`` (a list of (company_id, sector, headquarters)) in
+        proportion to ``company_weights`` (cumulative)
+        """
+        rng = self.rng("employees")
+        total_weight = company_weights[-1]
+        for offset in range(count):
+            employee_id = first_id + offset
+            company_id, sector, headquarters = companies[bisect.bisect(company_weights, rng.random() * total_weight)]
+            first_name, last_name = self.person_name(rng)
+            position, department, years = self.role(rng, sector)
+            location = headquarters if rng.random() < 0.7 else self.location(rng)
+            slug = f"{first_name}-{last_name}-{self.seed}-{employee_id}".lower()
+            created_at = self.timestamp(rng)
+            yield {
+                "id": employee_id,
+                "company_id": company_id,
+                "linkedin_profile_id": slug,
+                "name": f"{first_name} {last_name}",
+                "headline": f"{position} | {location}",
+                "position": position,
+                "department": department,
+                "profile_url": f"https://www.linkedin.com/in/{slug}/",
+                "profile_data": {"location": location, "years_of_experience": years},
+                "skills": self.skills(rng, sector),
+                "created_at": created_at,
+                "updated_at": created_at,
+            }, sector
+
+    def users(self, first_id: int, count: int, password_hash: str, resume_ratio: float):
+        """(user, profile, resume or None, sector) per user; profiles and resumes share the user's id"""
+        rng = self.rng("users")
+        for offset in range(count):
+            user_id = first_id + offset
+            first_name, last_name = self.person_name(rng)
+            sector = self.sector(rng)
+            industry = rng.choice(self.vocabulary.industries[sector])
+            position, _, years = self.role(rng, sector)
+            location = self.location(rng)
+            skills = self.skills(rng, sector)
+            education_level = rng.choices(EDUCATION_LEVEL_NAMES, cum_weights=EDUCATION_LEVEL_WEIGHTS)[0]
+            university = rng.choice(UNIVERSITIES)
+            graduation_year = self.now.year - years - rng.randint(0, 2)
+            current_company = f"{rng.choice(COMPANY_WORDS)} {rng.choice(SECTOR_NOUNS[sector])}"
+            summary = f"{position} with {years} years of experience in {industry}."
+            email = f"{first_name}.{last_name}.{user_id}@example.com".lower()
+            phone = f"+1-555-{rng.randrange(1000):03d}-{rng.randrange(10000):04d}"
+            created_at = self.timestamp(rng)
+
+            user = {
+                "id": user_id, "email": email, "hashed_password": password_hash, "is_active": True,
+                "created_at": created_at, "updated_at": created_at,
+            }
+            profile = {
+                "id": user_id, "user_id": user_id, "first_name": first_name, "last_name": last_name,
+                "headline": f"{position} | {industry}", "summary": summary, "phone": phone, "location": location,
+                "current_position": position, "current_company": current_company, "industry": industry,
+                "years_of_experience": years, "education_level": education_level, "university": university,
+                "graduation_year": graduation_year, "major": MAJORS[sector], "grade": f"{rng.uniform(2.8, 4.0):.2f}",
+                "skills": skills, "interests": self.skills(rng, sector, 1, 3),
+                "created_at": created_at, "updated_at": created_at,
+            }
+
+            resume = None
+            if rng.random() < resume_ratio:
+                education = [{"degree": education_level, "institution": university, "year": str(graduation_year)}]
+                experience = [{"title": position, "company": current_company, "years": years}]
+                raw_text = "\n".join([
+                    f"{first_name} {last_name}", email, phone, location, "",
+                    "SUMMARY", summary, "",
+                    "EXPERIENCE", f"{position}, {current_company} ({years} years)", "",
+                    "EDUCATION", f"{education_level} in {MAJORS[sector]}, {university}, {graduation_year}", "",
+                    "SKILLS", ", ".join(skills),
+                ])
+                resume = {
+                    "id": user_id, "user_id": user_id, "filename": f"{first_name}_{last_name}_resume.pdf",
+                    "s3_key": f"resumes/{user_id}/synthetic-{self.seed}.pdf", "file_size": len(raw_text) * 12,
+                    "file_type": "pdf", "raw_text_compressed": compress_text(raw_text),
+                    "parsed_data": {"summary": summary}, "extracted_name": f"{first_name} {last_name}",
+                    "extracted_email": email, "extracted_phone": phone, "extracted_skills": skills,
+                    "extracted_education": education, "extracted_experience": experience, "is_primary": True,
+                    "processing_status": "completed", "created_at": created_at, "updated_at": created_at,
+                }
+            yield user, profile, resume, sector
+
+    def recommendations(self, first_id: int, users, employees, per_user: int, same_sector: float):
+        """
+        Up to ``per_user`` distinct employees for each (user_id, sector) in
+        ``users``, drawn from the user's sector with probability
+        ``same_sector``. ``employees`` is an EmployeeIndex.
+        """
+        rng = self.rng("recommendations")
+        recommendation_id = first_id
+        per_user = min(per_user, len(employees))
+        for user_id, sector in users:
+            chosen = set()
+            for _ in range(per_user * 4):
+                if len(chosen) == per_user:
+                    break
+                chosen.add(employees.sample(rng, sector if rng.random() < same_sector else None))
+
+            for employee_id in sorted(chosen):
+                same = employees.sector_of(employee_id) == sector
+                industry = 0.7 + 0.3 * rng.random() if same else rng.choice((0.5, 0.2))
+                skill = rng.betavariate(3, 2) if same else rng.betavariate(2, 4)
+                experience = rng.betavariate(4, 2)
+                geographic = rng.choice((1.0, 0.8, 0.5, 0.2, 0.0))
+                seniority = rng.choice((1.0, 0.5, 0.0))
+                total = (
+                    WEIGHTS["industry_alignment"] * industry
+                    + WEIGHTS["skill_compatibility"] * skill
+                    + WEIGHTS["experience_alignment"] * experience
+                    + WEIGHTS["geographic_proximity"] * geographic
+                    + WEIGHTS["mutual_connections"] * MUTUAL_CONNECTIONS_SCORE
+                    + WEIGHTS["company_culture_fit"] * CULTURE_FIT_SCORE
+                    + WEIGHTS["seniority_compatibility"] * seniority
+                )
+                created_at = self.timestamp(rng, 90)
+                yield {
+                    "id": recommendation_id, "user_id": user_id, "employee_id": employee_id,
+                    "total_score": round(total, 4), "industry_score": round(industry, 4),
+                    "skill_score": round(skill, 4), "experience_score": round(experience, 4),
+                    "geographic_score": geographic, "mutual_connections_score": MUTUAL_CONNECTIONS_SCORE,
+                    "status": rng.choices(RECOMMENDATION_STATUS_NAMES, cum_weights=RECOMMENDATION_STATUS_WEIGHTS)[0],
+                    "created_at": created_at, "updated_at": created_at,
+                }
+                recommendation_id += 1
+
+
+SENIORITY_WEIGHTS = cumulative(weight for _, weight, _ in SENIORITY)
+EDUCATION_LEVEL_NAMES = [name for name, _ in EDUCATION_LEVELS]
+EDUCATION_LEVEL_WEIGHTS = cumulative(weight for _, weight in EDUCATION_LEVELS)
+RECOMMENDATION_STATUS_NAMES = [name for name, _ in RECOMMENDATION_STATUSES]
+RECOMMENDATION_STATUS_WEIGHTS = cumulative(weight for _, weight in RECOMMENDATION_STATUSES)
+
+
+class EmployeeIndex:
+    """Generated employee ids by sector, in compact arrays so tens of millions fit in memory"""
+
+    def __init__(self, sectors):
+        self.sectors = list(sectors)
+        self.first_id = None
+        self._sector_codes = bytearray()
+        self._by_sector = {sector: array("q") for sector in self.sectors}
+        self._codes = {sector: code for code, sector in enumerate(self.sectors)}
+
+    def add(self, employee_id: int, sector: str):
+        if self.first_id is None:
+            self.first_id = employee_id
+        self._sector_codes.append(self._codes[sector])
+        self._by_sector[sector].append(employee_id)
+
+    def __len__(self) -> int:
+        return len(self._sector_codes)
+
+    def sector_of(self, employee_id: int) -> str:
+        return self.sectors[self._sector_codes[employee_id - self.first_id]]
+
+    def sample(self, rng, sector=None) -> int:
+        ids = self._by_sector.get(sector) if sector else None
+        if ids:
+            return ids[rng.randrange(len(ids))]
+        return self.first_id + rng.randrange(len(self._sector_codes))
+
+
+class BatchLoader:
+    """Buffers rows per table and loads them ``batch_size`` at a time, committing each batch"""
+
+    def __init__(self, db, batch_size: int):
+        self.db = db
+        self.batch_size = batch_size
+        self.pending = {}
+        self.loaded = {}
+        self.started = time.perf_counter()
+
+    def add(self, model, row):
+        rows = self.pending.setdefault(model, [])
+        rows.append(row)
+        if len(rows) >= self.batch_size:
+            self.flush(model)
+
+    def flush(self, model):
+        rows = self.pending.pop(model, [])
+        if rows:
+            load_rows(self.db, model, rows)
+            self.db.commit()
+            self.loaded[model] = self.loaded.get(model, 0) + len(rows)
+
+    def finish(self, *models):
+        for model in models:
+            self.flush(model)
+            reset_id_sequence(self.db, model)
+            self.db.commit()
+            elapsed = time.perf_counter() - self.started
+            print(f"✓ {self.loaded.get(model, 0):,} {model.__tablename__} loaded "
+                  f"({sum(self.loaded.values()) / max(elapsed, 1e-9):,.0f} rows/s overall)")
+
+
+def seed_database(args):
+    """Generate and load every table, parents first"""
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    try:
+        def next_id(model) -> int:
+            return (db.query(func.max(model.id)).scalar() or 0) + 1
+
+        vocabulary = Vocabulary()
+        generator = Generator(args.seed, vocabulary, datetime(2025, 1, 1) if args.fixed_clock else datetime.utcnow())
+        loader = BatchLoader(db, args.batch_size)
+
+        # Companies: their size bucket follows from their share of the employees
+        weights = generator.company_weights(args.companies)
+        total_weight = sum(weights) or 1.0
+        companies = []
+        for row, sector in generator.companies(next_id(Company), (args.employees * weight / total_weight for weight in weights)):
+            companies.append((row["id"], sector, row["headquarters"]))
+            loader.add(Company, row)
+        loader.finish(Company)
+
+        employees = EmployeeIndex(vocabulary.sectors)
+        if companies:
+            for row, sector in generator.employees(next_id(CompanyEmployee), args.employees, companies, cumulative(weights)):
+                employees.add(row["id"], sector)
+                loader.add(CompanyEmployee, row)
+        loader.finish(CompanyEmployee)
+
+        # Users, profiles and resumes share ids, so align them past all three
+        first_user = max(next_id(User), next_id(UserProfile), next_id(Resume))
+        password_hash = get_password_hash(args.password)
+        user_sectors = bytearray()
+        for user, profile, resume, sector in generator.users(first_user, args.users, password_hash, args.resume_ratio):
+            user_sectors.append(vocabulary.sectors.index(sector))
+            loader.add(User, user)
+            loader.add(UserProfile, profile)
+            if resume:
+                loader.add(Resume, resume)
+        loader.finish(User, UserProfile, Resume)
+
+        if len(employees):
+            users = ((first_user + offset, vocabulary.sectors[code]) for offset, code in enumerate(user_sectors))
+            for row in generator.recommendations(
+                next_id(ConnectionRecommendation), users, employees, args.recommendations_per_user, args.same_sector,
+            ):
+                loader.add(ConnectionRecommendation, row)
+        loader.finish(ConnectionRecommendation)
+    finally:
+        db.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--companies", type=int, default=200)
+    parser.add_argument("--employees", type=int, default=20000)
+    parser.add_argument("--recommendations-per-user", type=int, default=20)
+    parser.add_argument("--same-sector", type=float, default=0.8, help="Share of recommendations from the user's sector")
+    parser.add_argument("--resume-ratio", type=float, default=0.6, help="Share of users with a resume")
+    parser.add_argument("--password", default="password123", help="Password of every generated user")
+    parser.add_argument("--batch-size", type=int, default=20000, help="Rows per COPY/INSERT batch and commit")
+    parser.add_argument("--fixed-clock", action="store_true", help="Date rows relative to 2025-01-01 instead of now")
+    args = parser.parse_args()
+
+    print(f"Seeding database (seed {args.seed}): {args.companies:,} companies, {args.employees:,} employees, "
+          f"{args.users:,} users, up to {args.users * args.recommendations_per_user:,} recommendations")
+    started = time.perf_counter()
     try:
-        # Connect to the database
-        conn = await asyncpg.connect(settings.DATABASE_URL)
-        
-        print("Connected to database successfully")
-        
-        # Seed companies
-        await seed_companies(conn)
-        
-        # Seed users
-        await seed_users(conn)
-        
-        # Seed company employees
-        await seed_company_employees(conn)
-        
-        # Seed recommendations
-        await seed_recommendations(conn)
-        
-        # Seed connections
-        await seed_connections(conn)
-        
-        # Close the connection
-        await conn.close()
-        print("Database seeding completed successfully")
-        
+        seed_database(args)
     except Exception as e:
-        print(f"Seeding failed: {e}")
+        print(f"✗ Seeding failed: {e}")
         sys.exit(1)
+    print(f"\n✓ Database seeding completed in {time.perf_counter() - started:.1f}s")
 
-async def seed_companies(conn):
-    """Seed companies table"""
-    companies_data = [
-        {
-            'name': 'Google',
-            'industry': 'Technology',
-            'size': 'Large',
-            'location': 'Mountain View, CA',
-            'linkedin_company_id': '1441',
-            'description': 'Google is a multinational technology company specializing in Internet-related services and products.',
-            'website': 'https://google.com',
-            'employee_count': 150000
-        },
-        {
-            'name': 'Microsoft',
-            'industry': 'Technology',
-            'size': 'Large',
-            'location': 'Redmond, WA',
-            'linkedin_company_id': '1035',
-            'description': 'Microsoft is a multinational technology company that develops, manufactures, licenses, supports and sells computer software.',
-            'website': 'https://microsoft.com',
-            'employee_count': 180000
-        },
-        {
-            'name': 'Apple',
-            'industry': 'Technology',
-            'size': 'Large',
-            'location': 'Cupertino, CA',
-            'linkedin_company_id': '162479',
-            'description': 'Apple Inc. is an American multinational technology company that specializes in consumer electronics.',
-            'website': 'https://apple.com',
-            'employee_count': 160000
-        },
-        {
-            'name': 'Amazon',
-            'industry': 'E-commerce',
-            'size': 'Large',
-            'location': 'Seattle, WA',
-            'linkedin_company_id': '104409',
-            'description': 'Amazon.com, Inc. is an American multinational technology company which focuses on e-commerce.',
-            'website': 'https://amazon.com',
-            'employee_count': 1500000
-        },
-        {
-            'name': 'Meta',
-            'industry': 'Technology',
-            'size': 'Large',
-            'location': 'Menlo Park, CA',
-            'linkedin_company_id': '104409',
-            'description': 'Meta Platforms, Inc., doing business as Meta, is an American multinational technology conglomerate.',
-            'website': 'https://meta.com',
-            'employee_count': 87000
-        }
-    ]
-    
-    for company in companies_data:
-        await conn.execute("""
-            INSERT INTO companies (name, industry, size, location, linkedin_company_id, description, website, employee_count)
-            VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
-            ON CONFLICT (linkedin_company_id) DO NOTHING
-        """, company['name'], company['industry'], company['size'], company['location'],
-        company['linkedin_company_id'], company['description'], company['website'], company['employee_count'])
-    
-    print("Companies seeded successfully")
-
-async def seed_users(conn):
-    """Seed users table"""
-    users_data = [
-        {
-            'email': 'john.doe@example.com',
-            'linkedin_id': 'john-doe-123',
-            'profile_data': {
-                'name': 'John Doe',
-                'headline': 'Software Engineer at Tech Corp',
-                'industry': 'Technology',
-                'location': 'San Francisco, CA',
-                'summary': 'Passionate software engineer with 5 years of experience in full-stack development.',
-                'experience': [
-                    {
-                        'title': 'Senior Software Engineer',
-                        'company': 'Tech Corp',
-                        'duration': '2 years',
-                        'description': 'Led development of microservices architecture'
-                    }
-                ],
-                'education': [
-                    {
-                        'school': 'Stanford University',
-                        'degree': 'Bachelor of Science',
-                        'field': 'Computer Science',
-                        'year': 2018
-                    }
-                ],
-                'skills': ['Python', 'JavaScript', 'React', 'Node.js', 'AWS', 'Docker']
-            },
-            'preferences': {
-                'target_companies': ['Google', 'Microsoft', 'Apple'],
-                'connection_goals': 'Find senior engineering roles',
-                'industry_focus': ['Technology', 'Software Development']
-            }
-        },
-        {
-            'email': 'jane.smith@example.com',
-            'linkedin_id': 'jane-smith-456',
-            'profile_data': {
-                'name': 'Jane Smith',
-                'headline': 'Product Manager at StartupCo',
-                'industry': 'Technology',
-                'location': 'New York, NY',
-                'summary': 'Product manager with expertise in user experience and data analysis.',
-                'experience': [
-                    {
-                        'title': 'Senior Product Manager',
-                        'company': 'StartupCo',
-                        'duration': '3 years',
-                        'description': 'Led product strategy and user research'
-                    }
-                ],
-                'education': [
-                    {
-                        'school': 'Harvard Business School',
-                        'degree': 'MBA',
-                        'field': 'Business Administration',
-                        'year': 2019
-                    }
-                ],
-                'skills': ['Product Management', 'Data Analysis', 'User Research', 'Agile', 'SQL', 'Python']
-            },
-            'preferences': {
-                'target_companies': ['Google', 'Meta', 'Amazon'],
-                'connection_goals': 'Network with product leaders',
-                'industry_focus': ['Technology', 'Product Management']
-            }
-        }
-    ]
-    
-    for user in users_data:
-        await conn.execute("""
-            INSERT INTO users (email, linkedin_id, profile_data, preferences)
-            VALUES ($1, $2, $3, $4)
-            ON CONFLICT (email) DO NOTHING
-        """, user['email'], user['linkedin_id'], json.dumps(user['profile_data']), json.dumps(user['preferences']))
-    
-    print("Users seeded successfully")
-
-async def seed_company_employees(conn):
-    """Seed company employees table"""
-    # Get company IDs
-    companies = await conn.fetch("SELECT id, name FROM companies")
-    company_map = {company['name']: company['id'] for company in companies}
-    
-    employees_data = [
-        # Google employees
-        {
-            'company_name': 'Google',
-            'linkedin_id': 'google-engineer-1',
-            'name': 'Alex Johnson',
-            'position': 'Senior Software Engineer',
-            'department': 'Engineering',
-            'seniority_level': 'Senior',
-            'headline': 'Senior Software Engineer at Google',
-            'connection_score': 0.85
-        },
-        {
-            'company_name': 'Google',
-            'linkedin_id': 'google-pm-1',
-            'name': 'Sarah Chen',
-            'position': 'Product Manager',
-            'department': 'Product',
-            'seniority_level': 'Senior',
-            'headline': 'Product Manager at Google',
-            'connection_score': 0.78
-        },
-        # Microsoft employees
-        {
-            'company_name': 'Microsoft',
-            'linkedin_id': 'microsoft-engineer-1',
-            'name': 'David Wilson',
-            'position': 'Principal Software Engineer',
-            'department': 'Engineering',
-            'seniority_level': 'Principal',
-            'headline': 'Principal Software Engineer at Microsoft',
-            'connection_score': 0.92
-        },
-        {
-            'company_name': 'Microsoft',
-            'linkedin_id': 'microsoft-designer-1',
-            'name': 'Emily Rodriguez',
-            'position': 'UX Designer',
-            'department': 'Design',
-            'seniority_level': 'Mid',
-            'headline': 'UX Designer at Microsoft',
-            'connection_score': 0.73
-        },
-        # Apple employees
-        {
-            'company_name': 'Apple',
-            'linkedin_id': 'apple-engineer-1',
-            'name': 'Michael Brown',
-            'position': 'iOS Developer',
-            'department': 'Engineering',
-            'seniority_level': 'Senior',
-            'headline': 'iOS Developer at Apple',
-            'connection_score': 0.88
-        }
-    ]
-    
-    for employee in employees_data:
-        company_id = company_map.get(employee['company_name'])
-        if company_id:
-            await conn.execute("""
-                INSERT INTO company_employees (company_id, linkedin_id, name, position, department, seniority_level, headline, connection_score)
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
-                ON CONFLICT (company_id, linkedin_id) DO NOTHING
-            """, company_id, employee['linkedin_id'], employee['name'], employee['position'],
-            employee['department'], employee['seniority_level'], employee['headline'], employee['connection_score'])
-    
-    print("Company employees seeded successfully")
-
-async def seed_recommendations(conn):
-    """Seed recommendations table"""
-    # Get user and company data
-    users = await conn.fetch("SELECT id, email FROM users")
-    companies = await conn.fetch("SELECT id, name FROM companies")
-    employees = await conn.fetch("SELECT id, company_id, linkedin_id, name FROM company_employees")
-    
-    user_map = {user['email']: user['id'] for user in users}
-    company_map = {company['name']: company['id'] for company in companies}
-    
-    recommendations_data = [
-        {
-            'user_email': 'john.doe@example.com',
-            'company_name': 'Google',
-            'target_person_id': 'google-engineer-1',
-            'match_score': 0.85,
-            'reasoning': [
-                {'factor': 'Industry Match', 'score': 0.9, 'description': 'Both in Technology industry'},
-                {'factor': 'Skill Compatibility', 'score': 0.8, 'description': 'Shared skills in Python, JavaScript'},
-                {'factor': 'Experience Level', 'score': 0.9, 'description': 'Similar experience levels'}
-            ]
-        },
-        {
-            'user_email': 'jane.smith@example.com',
-            'company_name': 'Google',
-            'target_person_id': 'google-pm-1',
-            'match_score': 0.78,
-            'reasoning': [
-                {'factor': 'Industry Match', 'score': 0.9, 'description': 'Both in Technology industry'},
-                {'factor': 'Skill Compatibility', 'score': 0.7, 'description': 'Shared skills in Product Management'},
-                {'factor': 'Experience Level', 'score': 0.8, 'description': 'Similar experience levels'}
-            ]
-        }
-    ]
-    
-    for rec in recommendations_data:
-        user_id = user_map.get(rec['user_email'])
-        company_id = company_map.get(rec['company_name'])
-        
-        if user_id and company_id:
-            await conn.execute("""
-                INSERT INTO recommendations (user_id, target_person_id, company_id, match_score, reasoning)
-                VALUES ($1, $2, $3, $4, $5)
-            """, user_id, rec['target_person_id'], company_id, rec['match_score'], json.dumps(rec['reasoning']))
-    
-    print("Recommendations seeded successfully")
-
-async def seed_connections(conn):
-    """Seed connections table"""
-    # Get recommendations data
-    recommendations = await conn.fetch("""
-        SELECT r.id, r.user_id, r.target_person_id, r.company_id, r.match_score
-        FROM recommendations r
-        LIMIT 5
-    """)
-    
-    for rec in recommendations:
-        await conn.execute("""
-            INSERT INTO connections (user_id, target_person_id, company_id, recommendation_id, status, message, sent_at)
-            VALUES ($1, $2, $3, $4, $5, $6, $7)
-        """, rec['user_id'], rec['target_person_id'], rec['company_id'], rec['id'], 
-        'pending', 'Hi! I would like to connect with you.', datetime.now())
-    
-    print("Connections seeded successfully")
-
-async def main():
-    """Main seeding function"""
-    print("Starting database seeding...")
-    await seed_database()
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    main()
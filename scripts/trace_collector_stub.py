@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Local stand-in for an OpenTelemetry collector's OTLP/HTTP trace receiver
+
+Accepts OTLP/JSON on POST /v1/traces (what shared/tracing.py sends with
+TRACE_OTLP_ENDPOINT; protobuf is rejected with 415), keeps the most recent
+--max-traces traces in memory and optionally appends every request to
+--output as JSONL, the same format as TRACE_EXPORT_FILE.
+
+GET /traces lists recent traces slowest first, GET /traces/{trace_id}
+returns its spans as an indented tree with durations, and GET /_stats
+reports what it received.
+
+Usage: python scripts/trace_collector_stub.py [--port 4318] [--output traces.jsonl] [--max-traces 1000]
+Then run the services with TRACE_OTLP_ENDPOINT=http://localhost:4318
+"""
+
+import argparse
+import json
+from collections import Counter, OrderedDict
+
+from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi.responses import PlainTextResponse
+
+
+def span_tree(spans: list) -> str:
+    """One line per span, children indented under parents, with offsets and durations in ms"""
+    by_id = {span["spanId"]: span for span in spans}
+    children = {}
+    for span in spans:
+        parent = span.get("parentSpanId")
+        children.setdefault(parent if parent in by_id else None, []).append(span)
+    start = min(int(span["startTimeUnixNano"]) for span in spans)
+    lines = []
+
+    def walk(parent, depth):
+        for span in sorted(children.get(parent, []), key=lambda s: int(s["startTimeUnixNano"])):
+            offset = (int(span["startTimeUnixNano"]) - start) / 1e6
+            duration = (int(span["endTimeUnixNano"]) - int(span["startTimeUnixNano"])) / 1e6
+            error = f"  ✗ {span['status'].get('message', '')}" if span.get("status", {}).get("code") == 2 else ""
+            lines.append(f"{offset:9.2f} {duration:9.2f}  {'  ' * depth}{span['_service']}: {span['name']}{error}")
+            walk(span["spanId"], depth + 1)
+
+    walk(None, 0)
+    return "  offset_ms  duration_ms\n" + "\n".join(lines) + "\n"
+
+
+def create_app(output: str = None, max_traces: int = 1000) -> FastAPI:
+    app = FastAPI(title="Trace collector stub")
+    traces = OrderedDict()
+    stats = Counter()
+
+    @app.post("/v1/traces")
+    async def receive_traces(request: Request):
+        if not request.headers.get("content-type", "").startswith("application/json"):
+            return Response(status_code=415)
+        payload = await request.json()
+        stats["requests"] += 1
+        if output:
+            with open(output, "a", encoding="utf-8") as f:
+                f.write(json.dumps(payload) + "\n")
+
+        for resource_spans in payload.get("resourceSpans", []):
+            service = next(
+                (a["value"].get("stringValue") for a in resource_spans.get("resource", {}).get("attributes", [])
+                 if a["key"] == "service.name"),
+                "unknown",
+            )
+            for scope_spans in resource_spans.get("scopeSpans", []):
+                for span in scope_spans.get("spans", []):
+                    stats["spans"] += 1
+                    traces.setdefault(span["traceId"], []).append({**span, "_service": service})
+                    traces.move_to_end(span["traceId"])
+        while len(traces) > max_traces:
+            traces.popitem(last=False)
+        return {"partialSuccess": {}}
+
+    @app.get("/traces")
+    async def list_traces(limit: int = 50):
+        summaries = []
+        for trace_id, spans in traces.items():
+            start = min(int(span["startTimeUnixNano"]) for span in spans)
+            end = max(int(span["endTimeUnixNano"]) for span in spans)
+            span_ids = {span["spanId"] for span in spans}
+            roots = [span for span in spans if span.get("parentSpanId") not in span_ids]
+            summaries.append({
+                "trace_id": trace_id,
+                "root": roots[0]["name"] if roots else None,
+                "services": sorted({span["_service"] for span in spans}),
+                "spans": len(spans),
+                "duration_ms": round((end - start) / 1e6, 2),
+            })
+        return sorted(summaries, key=lambda s: s["duration_ms"], reverse=True)[:limit]
+
+    @app.get("/traces/{trace_id}", response_class=PlainTextResponse)
+    async def get_trace(trace_id: str):
+        spans = traces.get(trace_id)
+        if not spans:
+            raise HTTPException(status_code=404, detail="Trace not found")
+        return span_tree(spans)
+
+    @app.get("/_stats")
+    async def get_stats():
+        return {**stats, "traces": len(traces)}
+
+    return app
+
+
+def main():
+    import uvicorn
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--port", type=int, default=4318)
+    parser.add_argument("--output", help="Append every export request to this JSONL file")
+    parser.add_argument("--max-traces", type=int, default=1000, help="Traces kept in memory")
+    args = parser.parse_args()
+
+    uvicorn.run(create_app(args.output, args.max_traces), host="127.0.0.1", port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -24,9 +24,25 @@ def run_profile_service():
     print(f"Starting Profile Service on port {port}...")
     uvicorn.run(app, host="0.0.0.0", port=port, reload=True)
 
+def run_company_service():
+    """Run Company Service"""
+    from services.company_service.main import app
+    import uvicorn
+    port = int(os.getenv("COMPANY_SERVICE_PORT", 8003))
+    print(f"Starting Company Service on port {port}...")
+    uvicorn.run(app, host="0.0.0.0", port=port, reload=True)
+
+def run_recommendation_service():
+    """Run Recommendation Service"""
+    from services.recommendation_service.main import app
+    import uvicorn
+    port = int(os.getenv("RECOMMENDATION_SERVICE_PORT", 8004))
+    print(f"Starting Recommendation Service on port {port}...")
+    uvicorn.run(app, host="0.0.0.0", port=port, reload=True)
+
 if __name__ == "__main__":
     if len(sys.argv) < 2:
-        print("Usage: python run_services.py [user|profile]")
+        print("Usage: python run_services.py [user|profile|company|recommendation]")
         sys.exit(1)
 
     service = sys.argv[1].lower()
@@ -35,7 +51,11 @@ if __name__ == "__main__":
         run_user_service()
     elif service == "profile":
         run_profile_service()
+    elif service == "company":
+        run_company_service()
+    elif service == "recommendation":
+        run_recommendation_service()
     else:
         print(f"Unknown service: {service}")
-        print("Available services: user, profile")
+        print("Available services: user, profile, company, recommendation")
         sys.exit(1)
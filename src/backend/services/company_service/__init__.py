@@ -0,0 +1 @@
+# Company service
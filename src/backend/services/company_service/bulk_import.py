@@ -0,0 +1,141 @@
+import csv
+import json
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from pydantic import TypeAdapter, ValidationError
+from sqlalchemy.orm import Session
+
+from ...shared.bulk_load import merge_rows
+from ...shared.models import Company, CompanyEmployee
+from ...shared.schemas import CompanyEmployeeImportRow, CompanyImportRow
+
+COMPANY_COLUMNS = ("name", "industry", "company_size", "headquarters", "description", "website", "specialties")
+EMPLOYEE_COLUMNS = ("company_id", "name", "headline", "position", "department", "profile_url", "skills", "profile_data")
+
+
+@dataclass
+class ImportKind:
+    model: Any
+    schema: Any
+    key: str  # Natural key the merge upserts on
+    columns: Tuple[str, ...]
+
+
+IMPORT_KINDS = {
+    "companies": ImportKind(Company, CompanyImportRow, "linkedin_company_id", COMPANY_COLUMNS),
+    "employees": ImportKind(CompanyEmployee, CompanyEmployeeImportRow, "linkedin_profile_id", EMPLOYEE_COLUMNS),
+}
+
+
+@dataclass
+class ChunkResult:
+    read: int
+    merged: int  # Valid rows upserted
+    written: int  # Of those, rows inserted or changed
+    rejected: List[Dict[str, Any]] = field(default_factory=list)
+    seconds: float = 0.0
+
+
+def read_records(path: str, format: Optional[str] = None) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """
+    Stream (line number, record) pairs from a CSV (with header) or JSONL file,
+    or stdin for "-". The format defaults to the file extension. Empty CSV
+    cells are read as missing values.
+    """
+    format = format or ("jsonl" if path.endswith((".jsonl", ".ndjson")) else "csv")
+    handle = sys.stdin if path == "-" else open(path, newline="", encoding="utf-8")
+    try:
+        if format == "jsonl":
+            for line_number, line in enumerate(handle, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield line_number, json.loads(line)
+                except json.JSONDecodeError:
+                    # Not a dict, so validation rejects it with its line number
+                    yield line_number, line
+        else:
+            # Line numbers count the header, matching what an editor shows
+            for line_number, row in enumerate(csv.DictReader(handle), start=2):
+                yield line_number, {key: value for key, value in row.items() if value != ""}
+    finally:
+        if handle is not sys.stdin:
+            handle.close()
+
+
+def validate_batch(schema, records: List[Tuple[int, Dict[str, Any]]]):
+    """
+    Validate a batch in one pass through a list adapter. When it fails, the
+    offending records are split off with their errors and the rest are
+    validated again, so one bad row costs two passes, not one per row.
+    """
+    adapter = TypeAdapter(List[schema])
+    try:
+        return adapter.validate_python([record for _, record in records]), []
+    except ValidationError as e:
+        errors = {}
+        for error in e.errors(include_url=False):
+            index, *loc = error["loc"]
+            errors.setdefault(index, []).append(f"{'.'.join(map(str, loc)) or 'row'}: {error['msg']}")
+
+    rejected = [{"line": line, "errors": errors[index]} for index, (line, _) in enumerate(records) if index in errors]
+    valid = adapter.validate_python([record for index, (_, record) in enumerate(records) if index not in errors])
+    return valid, rejected
+
+
+def company_ids(db: Session, linkedin_company_ids: Iterable[str]) -> Dict[str, int]:
+    return dict(db.query(Company.linkedin_company_id, Company.id).filter(
+        Company.linkedin_company_id.in_(set(linkedin_company_ids))
+    ))
+
+
+def import_chunk(db: Session, kind: ImportKind, records: List[Tuple[int, Dict[str, Any]]]) -> ChunkResult:
+    started = time.perf_counter()
+    valid, rejected = validate_batch(kind.schema, records)
+    rejected_lines = {reject["line"] for reject in rejected}
+    lines = [line for line, _ in records if line not in rejected_lines]
+    now = datetime.utcnow()
+
+    if kind.model is CompanyEmployee:
+        companies = company_ids(db, (row.linkedin_company_id for row in valid if row.linkedin_company_id))
+
+    # Later rows win over earlier ones with the same key, as they would row by row
+    rows = {}
+    for line, row in zip(lines, valid):
+        values = row.model_dump()
+        if kind.model is CompanyEmployee:
+            linkedin_company_id = values.pop("linkedin_company_id")
+            values["company_id"] = companies.get(linkedin_company_id)
+            if linkedin_company_id and values["company_id"] is None:
+                rejected.append({"line": line, "errors": [f"linkedin_company_id: unknown company {linkedin_company_id}"]})
+                continue
+        rows[values[kind.key]] = {**values, "created_at": now, "updated_at": now}
+
+    written = merge_rows(db, kind.model, list(rows.values()), [kind.key], kind.columns + ("updated_at",))
+    db.commit()
+    return ChunkResult(len(records), len(rows), written, rejected, time.perf_counter() - started)
+
+
+def import_records(
+    db: Session,
+    kind: str,
+    records: Iterator[Tuple[int, Dict[str, Any]]],
+    chunk_size: int = 50000,
+) -> Iterator[ChunkResult]:
+    """
+    Validate and merge ``records`` (from ``read_records``) ``chunk_size`` at a
+    time, committing each chunk, and yield a result per chunk. Memory is
+    bounded by one chunk regardless of input size; an interrupted import can
+    simply be rerun, since rows are upserted on their LinkedIn ID.
+    """
+    import_kind = IMPORT_KINDS[kind]
+    while True:
+        chunk = list(islice(records, chunk_size))
+        if not chunk:
+            return
+        yield import_chunk(db, import_kind, chunk)
@@ -0,0 +1,290 @@
+import re
+import threading
+import unicodedata
+from bisect import bisect_left, insort
+from collections import OrderedDict, defaultdict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from ...shared.models import Company, CompanyEmployee
+from ...shared.postings import PostingList, membership
+
+
+MAX_RESULTS = 50
+
+# Fraction of the query's within-word trigrams a name must share to count as a fuzzy match
+MIN_TRIGRAM_SIMILARITY = 0.5
+
+_non_alphanumeric = re.compile(r"[^a-z0-9]+")
+
+
+def normalize_name(name: str) -> str:
+    """Lowercase, strip accents and punctuation, collapse whitespace"""
+    name = unicodedata.normalize("NFKD", name).encode("ascii", "ignore").decode("ascii")
+    return _non_alphanumeric.sub(" ", name.lower()).strip()
+
+
+def name_trigrams(normalized: str) -> List[str]:
+    """Trigrams of a normalized name, padded so word starts get their own trigrams"""
+    padded = f"  {normalized} "
+    return list(dict.fromkeys(padded[i:i + 3] for i in range(len(padded) - 2)))
+
+
+def prefix_keys(normalized: str) -> List[str]:
+    """Keys for prefix lookup: the full name and the name from each later word onwards"""
+    keys = [normalized]
+    for match in re.finditer(r" (?=\S)", normalized):
+        keys.append(normalized[match.end():])
+    return keys
+
+
+class CompanyAutocomplete:
+    """
+    In-memory company name typeahead.
+
+    Prefix matches come from a sorted array of word-prefix keys searched with
+    bisect; the top results for wide prefixes (one or two keystrokes) are
+    memoized. Infix and typo-tolerant matches come from trigram postings.
+    All results are ranked by employee count.
+    """
+
+    def __init__(self, scan_limit: int = 2000, cache_size: int = 50000):
+        self.scan_limit = scan_limit
+        self.cache_size = cache_size
+        self._names: Dict[int, str] = {}
+        self._normalized: Dict[int, str] = {}
+        self._employee_counts: Dict[int, int] = {}
+        self._count_array = np.zeros(1, dtype=np.int64)
+        # Sorted (key, company_id) pairs
+        self._keys: List[Tuple[str, int]] = []
+        self._trigrams: Dict[str, PostingList] = {}
+        self._cache: "OrderedDict[Tuple[str, str], List[int]]" = OrderedDict()
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def _invalidate(self):
+        self._cache.clear()
+
+    def _cached(self, key: Tuple[str, str]) -> Optional[List[int]]:
+        result = self._cache.get(key)
+        if result is not None:
+            self._cache.move_to_end(key)
+        return result
+
+    def _store(self, key: Tuple[str, str], result: List[int]):
+        self._cache[key] = result
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def add(self, company_id: int, name: str):
+        """Index a company name, replacing any previously indexed name"""
+        with self._lock:
+            if company_id in self._names:
+                self.remove(company_id)
+
+            normalized = normalize_name(name)
+            self._names[company_id] = name
+            self._normalized[company_id] = normalized
+            for key in prefix_keys(normalized):
+                insort(self._keys, (key, company_id))
+            for trigram in name_trigrams(normalized):
+                posting = self._trigrams.get(trigram)
+                if posting is None:
+                    posting = self._trigrams[trigram] = PostingList()
+                posting.add(company_id)
+            self._invalidate()
+
+    def remove(self, company_id: int):
+        """Remove a company from the index"""
+        with self._lock:
+            normalized = self._normalized.pop(company_id, None)
+            if normalized is None:
+                return
+            del self._names[company_id]
+            for key in prefix_keys(normalized):
+                position = bisect_left(self._keys, (key, company_id))
+                if position < len(self._keys) and self._keys[position] == (key, company_id):
+                    del self._keys[position]
+            for trigram in name_trigrams(normalized):
+                self._trigrams[trigram].remove(company_id)
+            self._invalidate()
+
+    def apply_changes(self, upserted: List[Dict[str, Any]], deleted_ids: List[int]):
+        """Apply committed Company writes (see shared.change_feed.ChangeFeed)"""
+        with self._lock:
+            for row in upserted:
+                if self._names.get(row["id"]) != row["name"]:
+                    self.add(row["id"], row["name"])
+            for company_id in deleted_ids:
+                self.remove(company_id)
+
+    def set_employee_counts(self, counts: Dict[int, int]):
+        """Replace the employee counts used for ranking"""
+        with self._lock:
+            self._employee_counts = dict(counts)
+            # Dense copy indexed by company ID for vectorized ranking
+            count_array = np.zeros(max(counts, default=0) + 1, dtype=np.int64)
+            count_array[np.fromiter(counts.keys(), dtype=np.int64)] = np.fromiter(counts.values(), dtype=np.int64)
+            self._count_array = count_array
+            self._invalidate()
+
+    def bulk_load(self, companies: Iterable[Tuple[int, str]], employee_counts: Optional[Dict[int, int]] = None):
+        """Build the index from ``(id, name)`` pairs; replaces existing contents"""
+        names: Dict[int, str] = {}
+        normalized_names: Dict[int, str] = {}
+        keys: List[Tuple[str, int]] = []
+        trigram_ids: Dict[str, List[int]] = defaultdict(list)
+
+        for company_id, name in companies:
+            if not name:
+                continue
+            normalized = normalize_name(name)
+            names[company_id] = name
+            normalized_names[company_id] = normalized
+            keys.extend((key, company_id) for key in prefix_keys(normalized))
+            for trigram in name_trigrams(normalized):
+                trigram_ids[trigram].append(company_id)
+
+        keys.sort()
+        trigrams = {
+            trigram: PostingList(np.unique(np.array(ids, dtype=np.int64)))
+            for trigram, ids in trigram_ids.items()
+        }
+
+        with self._lock:
+            self._names = names
+            self._normalized = normalized_names
+            self._keys = keys
+            self._trigrams = trigrams
+            self._invalidate()
+            if employee_counts is not None:
+                self.set_employee_counts(employee_counts)
+
+    def build_from_db(self, db: Session):
+        """Load every company name and its employee count"""
+        companies = db.query(Company.id, Company.name).all()
+        self.bulk_load((tuple(row) for row in companies), employee_counts=load_employee_counts(db))
+
+    def _counts_for(self, company_ids: np.ndarray) -> np.ndarray:
+        counts = np.zeros(company_ids.size, dtype=np.int64)
+        known = company_ids < self._count_array.size
+        counts[known] = self._count_array[company_ids[known]]
+        return counts
+
+    def _rank(self, company_ids: np.ndarray, scores: np.ndarray, limit: int) -> List[int]:
+        """Top ``limit`` IDs by descending score, ties broken by ascending ID"""
+        if company_ids.size > limit:
+            # Keep every ID tied with the limit-th score; argpartition would pick among them arbitrarily
+            cutoff = np.partition(scores, company_ids.size - limit)[company_ids.size - limit]
+            keep = scores >= cutoff
+            company_ids, scores = company_ids[keep], scores[keep]
+        order = np.lexsort((company_ids, -scores))[:limit]
+        return company_ids[order].tolist()
+
+    def _rank_by_employees(self, company_ids: Iterable[int]) -> List[int]:
+        company_ids = np.fromiter(company_ids, dtype=np.int64)
+        return self._rank(company_ids, self._counts_for(company_ids), MAX_RESULTS)
+
+    def _prefix_matches(self, query: str) -> List[int]:
+        cache_key = ("prefix", query)
+        result = self._cached(cache_key)
+        if result is not None:
+            return result
+
+        low = bisect_left(self._keys, (query,))
+        high = bisect_left(self._keys, (query + "\uffff",))
+        if high - low <= self.scan_limit:
+            company_ids = {company_id for _, company_id in self._keys[low:high]}
+            result = self._rank_by_employees(company_ids)
+        else:
+            # Wide prefix: narrow the scan to the best results of the next keystroke
+            # so each extension's result is computed (and memoized) only once
+            company_ids = {company_id for _, company_id in self._keys[low:low + self.scan_limit]}
+            position = low + self.scan_limit
+            while position < high:
+                next_prefix = self._keys[position][0][:len(query) + 1]
+                if next_prefix == query:
+                    # Keys equal to the query itself cannot be narrowed further
+                    end = bisect_left(self._keys, (query + "\x00",))
+                    company_ids.update(company_id for _, company_id in self._keys[position:end])
+                    position = end
+                    continue
+                company_ids.update(self._prefix_matches(next_prefix))
+                position = bisect_left(self._keys, (next_prefix + "\uffff",))
+            result = self._rank_by_employees(company_ids)
+
+        self._store(cache_key, result)
+        return result
+
+    def _trigram_matches(self, query: str) -> List[int]:
+        cache_key = ("trigram", query)
+        result = self._cached(cache_key)
+        if result is not None:
+            return result
+
+        # Drop the trailing padded trigram: the query may be a partial word
+        trigrams = [trigram for trigram in name_trigrams(query) if not trigram.endswith(" ")]
+        # Word-start trigrams only boost the score, so infix queries still match
+        inner = [trigram for trigram in trigrams if not trigram.startswith(" ")]
+        required = max(1, int(np.ceil(len(inner) * MIN_TRIGRAM_SIMILARITY)))
+
+        postings = [self._trigrams[trigram].ids() for trigram in inner if trigram in self._trigrams]
+        if len(postings) < required:
+            self._store(cache_key, [])
+            return []
+
+        # Company IDs are dense, so counting shared trigrams is a single bincount
+        hits = np.bincount(np.concatenate(postings))
+        matched = np.flatnonzero(hits >= required)
+        hits = hits[matched]
+        for trigram in trigrams:
+            if trigram.startswith(" ") and trigram in self._trigrams:
+                hits += membership(matched, self._trigrams[trigram].ids())
+
+        # Rank by number of shared trigrams, then employee count
+        scores = (hits.astype(np.int64) << 40) | self._counts_for(matched)
+        result = self._rank(matched, scores, MAX_RESULTS)
+        self._store(cache_key, result)
+        return result
+
+    def search(self, query: str, limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Return up to ``limit`` companies matching ``query``: word-prefix matches
+        first, then infix and fuzzy trigram matches.
+        """
+        limit = min(limit, MAX_RESULTS)
+        normalized = normalize_name(query)
+        if not normalized:
+            return []
+
+        with self._lock:
+            company_ids = list(self._prefix_matches(normalized)[:limit])
+            if len(company_ids) < limit and len(normalized) >= 3:
+                seen = set(company_ids)
+                for company_id in self._trigram_matches(normalized):
+                    if company_id not in seen:
+                        company_ids.append(company_id)
+                        if len(company_ids) == limit:
+                            break
+
+            return [
+                {
+                    "id": company_id,
+                    "name": self._names[company_id],
+                    "employee_count": self._employee_counts.get(company_id, 0),
+                }
+                for company_id in company_ids
+            ]
+
+
+def load_employee_counts(db: Session) -> Dict[int, int]:
+    """Employee count per company in a single GROUP BY"""
+    rows = db.query(CompanyEmployee.company_id, func.count(CompanyEmployee.id)).group_by(
+        CompanyEmployee.company_id
+    ).all()
+    return {company_id: count for company_id, count in rows if company_id is not None}
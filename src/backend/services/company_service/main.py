@@ -0,0 +1,121 @@
+from fastapi import FastAPI, Depends, Query
+from fastapi.middleware.cors import CORSMiddleware
+from starlette.concurrency import run_in_threadpool
+from typing import List
+import asyncio
+import logging
+import os
+import time
+from dotenv import load_dotenv
+
+from ...shared.change_feed import ChangeFeed
+from ...shared.database import engine, Base, SessionLocal
+from ...shared.models import User, Company
+from ...shared.schemas import CompanySearchResult
+from ..user_service.auth import get_current_user
+from .company_autocomplete import CompanyAutocomplete, MAX_RESULTS, load_employee_counts
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Create tables
+Base.metadata.create_all(bind=engine)
+
+app = FastAPI(
+    title="Company Service",
+    description="Company lookup and search",
+    version="1.0.0"
+)
+
+# CORS
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=os.getenv("CORS_ORIGINS", "http://localhost:3000").split(","),
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+# Initialize services
+company_autocomplete = CompanyAutocomplete()
+
+# Keep company names in sync with Company writes from every process (import, refresh, seed)
+company_changes = ChangeFeed(
+    Company,
+    ("name",),
+    [company_autocomplete.apply_changes],
+    reconcile_interval=float(os.getenv("COMPANY_CHANGE_RECONCILE_SECONDS", "300")),
+)
+
+CHANGE_POLL_SECONDS = float(os.getenv("COMPANY_CHANGE_POLL_SECONDS", "5"))
+COUNT_REFRESH_SECONDS = int(os.getenv("COMPANY_COUNT_REFRESH_SECONDS", "300"))
+
+
+def refresh_companies(refresh_counts: bool):
+    """Apply company inserts, renames and deletes, and optionally reload the employee counts used for ranking"""
+    db = SessionLocal()
+    try:
+        company_changes.poll(db)
+        if refresh_counts:
+            company_autocomplete.set_employee_counts(load_employee_counts(db))
+    finally:
+        db.close()
+
+
+async def refresh_companies_periodically():
+    next_count_refresh = time.monotonic() + COUNT_REFRESH_SECONDS
+    while True:
+        await asyncio.sleep(CHANGE_POLL_SECONDS)
+        refresh_counts = time.monotonic() >= next_count_refresh
+        try:
+            await run_in_threadpool(refresh_companies, refresh_counts)
+        except Exception:
+            logger.exception("Failed to refresh companies")
+            continue
+        if refresh_counts:
+            next_count_refresh = time.monotonic() + COUNT_REFRESH_SECONDS
+
+
+@app.on_event("startup")
+async def build_company_autocomplete():
+    """Build the company name index from the database"""
+    db = SessionLocal()
+    try:
+        # Primed first, so writes made during the build are applied by the first poll
+        await run_in_threadpool(company_changes.prime, db)
+        await run_in_threadpool(company_autocomplete.build_from_db, db)
+    finally:
+        db.close()
+    app.state.count_refresh_task = asyncio.create_task(refresh_companies_periodically())
+
+
+@app.on_event("shutdown")
+async def stop_count_refresh():
+    app.state.count_refresh_task.cancel()
+
+
+# Health Check
+@app.get("/health")
+async def health_check():
+    return {"status": "healthy", "service": "company-service", "indexed_companies": len(company_autocomplete)}
+
+
+# Company Typeahead Search
+@app.get("/api/companies/search", response_model=List[CompanySearchResult])
+async def search_companies(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=MAX_RESULTS),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Search companies by name prefix, infix or approximate spelling.
+    Results are ranked by employee count.
+    """
+    return company_autocomplete.search(q, limit=limit)
+
+
+if __name__ == "__main__":
+    import uvicorn
+    port = int(os.getenv("COMPANY_SERVICE_PORT", 8003))
+    uvicorn.run(app, host="0.0.0.0", port=port)
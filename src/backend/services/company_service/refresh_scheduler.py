@@ -0,0 +1,252 @@
+import asyncio
+import hashlib
+import heapq
+import json
+import math
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from sqlalchemy import DateTime, Float, cast, func, literal, or_, update
+from sqlalchemy.orm import Session
+
+from ...shared.models import Company, CompanyEmployee, ConnectionRecommendation
+from ..profile_service.linkedin_client import LinkedInAPIError, LinkedInClient
+
+# Upstream company fields copied onto Company when its content changes
+COMPANY_FIELDS = ("name", "industry", "company_size", "headquarters", "description", "website", "specialties")
+
+
+@dataclass
+class RefreshCandidate:
+    model: Any  # Company or CompanyEmployee
+    row_id: int
+    upstream_id: str
+    source_etag: Optional[str]
+    source_last_modified: Optional[str]
+    content_hash: Optional[str]
+    updated_at: Optional[datetime]
+    age_seconds: float
+    demand: int
+    priority: float
+
+    @property
+    def path(self) -> str:
+        if self.model is CompanyEmployee:
+            return f"/profiles/{self.upstream_id}"
+        return f"/companies/{self.upstream_id}"
+
+
+def refresh_priority(age_seconds: float, demand: int, demand_weight: float = 1.0) -> float:
+    """
+    Staleness weighted by demand. Demand counts recommendations referencing the
+    row and enters logarithmically, so popular rows are refreshed sooner
+    without starving the long tail: every row's priority keeps growing with age.
+    """
+    return age_seconds * (1.0 + demand_weight * math.log1p(demand))
+
+
+def content_hash(fields: Dict[str, Any]) -> str:
+    canonical = json.dumps(fields, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def employee_fields(data: Dict[str, Any]) -> Dict[str, Any]:
+    """CompanyEmployee columns from upstream LinkedInProfileData fields"""
+    fields = {
+        "name": " ".join(part for part in (data.get("first_name"), data.get("last_name")) if part),
+        "headline": data.get("headline"),
+        "position": data.get("current_position"),
+        "skills": data.get("skills"),
+        "profile_data": data,
+    }
+    if not fields["name"]:
+        del fields["name"]  # NOT NULL; keep the stored name
+    return fields
+
+
+def company_fields(data: Dict[str, Any]) -> Dict[str, Any]:
+    fields = {field: data.get(field) for field in COMPANY_FIELDS}
+    if not fields["name"]:
+        del fields["name"]
+    return fields
+
+
+# Never-checked rows are aged as if last checked at this time, so they sort first
+NEVER_CHECKED = datetime(1970, 1, 1)
+
+
+def _age_seconds(dialect: str, now: datetime, checked_at):
+    now = literal(now, DateTime)
+    if dialect == "postgresql":
+        return cast(func.extract("epoch", now - checked_at), Float)
+    return (func.julianday(now) - func.julianday(checked_at)) * 86400.0
+
+
+def _top_candidates(db: Session, model, upstream_column, demand_query, now: datetime, min_age: timedelta,
+                    demand_weight: float, budget: int) -> List[RefreshCandidate]:
+    demand = demand_query.subquery()
+    checked_at = func.coalesce(model.last_fetched_at, model.updated_at)
+    row_demand = func.coalesce(demand.c.demand, 0)
+    # refresh_priority() in SQL (SQLite needs its math functions for ln), so the database keeps only the top rows
+    age = _age_seconds(db.get_bind().dialect.name, now, func.coalesce(checked_at, NEVER_CHECKED))
+    priority = age * (1.0 + demand_weight * func.ln(cast(1 + row_demand, Float)))
+    query = db.query(
+        model.id, upstream_column, model.source_etag, model.source_last_modified, model.content_hash,
+        model.updated_at, checked_at.label("checked_at"), row_demand, priority.label("priority"),
+    ).outerjoin(demand, demand.c.row_id == model.id).filter(
+        upstream_column.isnot(None),
+        or_(checked_at.is_(None), checked_at < now - min_age),
+    ).order_by(priority.desc(), model.id).limit(budget)
+
+    candidates = []
+    for row_id, upstream_id, etag, last_modified, stored_hash, updated_at, checked, row_demand, row_priority in query:
+        age = (now - checked).total_seconds() if checked else float("inf")
+        candidates.append(RefreshCandidate(
+            model, row_id, upstream_id, etag, last_modified, stored_hash, updated_at, age, row_demand, row_priority,
+        ))
+    return candidates
+
+
+def select_candidates(
+    db: Session,
+    budget: int,
+    now: Optional[datetime] = None,
+    min_age: timedelta = timedelta(days=1),
+    demand_weight: float = 1.0,
+    include_companies: bool = True,
+) -> List[RefreshCandidate]:
+    """
+    The ``budget`` highest-priority employees and companies not checked for
+    at least ``min_age``. Priority is computed in the database, which returns
+    only the top ``budget`` rows of each table (ORDER BY ... LIMIT), so
+    neither the stale rows nor the demand counts are pulled into Python.
+    """
+    now = now or datetime.utcnow()
+    employee_demand = db.query(
+        ConnectionRecommendation.employee_id.label("row_id"),
+        func.count(ConnectionRecommendation.id).label("demand"),
+    ).group_by(ConnectionRecommendation.employee_id)
+    candidates = _top_candidates(
+        db, CompanyEmployee, CompanyEmployee.linkedin_profile_id, employee_demand, now, min_age, demand_weight, budget
+    )
+
+    if include_companies:
+        company_demand = db.query(
+            CompanyEmployee.company_id.label("row_id"),
+            func.count(ConnectionRecommendation.id).label("demand"),
+        ).join(ConnectionRecommendation, ConnectionRecommendation.employee_id == CompanyEmployee.id).group_by(
+            CompanyEmployee.company_id
+        )
+        candidates += _top_candidates(
+            db, Company, Company.linkedin_company_id, company_demand, now, min_age, demand_weight, budget
+        )
+
+    return heapq.nlargest(budget, candidates, key=lambda c: c.priority)
+
+
+class RefreshStats(dict):
+    def __missing__(self, key):
+        return 0
+
+
+async def fetch_candidates(client: LinkedInClient, candidates: List[RefreshCandidate], concurrency: int):
+    """Yield (candidate, response or None if unchanged, error) as conditional fetches complete"""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fetch(candidate: RefreshCandidate):
+        async with semaphore:
+            try:
+                return candidate, await client.get_if_modified(
+                    candidate.path, candidate.source_etag, candidate.source_last_modified
+                ), None
+            except LinkedInAPIError as e:
+                return candidate, None, e
+
+    for done in asyncio.as_completed([fetch(candidate) for candidate in candidates]):
+        yield await done
+
+
+def apply_results(db: Session, results: List[tuple], stats: RefreshStats, now: Optional[datetime] = None):
+    """
+    Write one batch of fetch results. Rows whose content hash changed get
+    their content columns and updated_at rewritten; unchanged rows (304 or
+    same hash) only record the check, keeping updated_at, so nothing
+    downstream sees them as modified.
+
+    Rows are stamped with the time the batch is written (``now`` defaults to
+    it), not the start of the pass: a pass paced by the rate limit takes
+    hours, and change feeds following updated_at only look a few seconds
+    behind the newest write they have seen.
+    """
+    now = now or datetime.utcnow()
+    checked = {Company: [], CompanyEmployee: []}
+    changed = {Company: [], CompanyEmployee: []}
+
+    for candidate, response, error in results:
+        bookkeeping = {"id": candidate.row_id, "last_fetched_at": now, "updated_at": candidate.updated_at}
+        if error is not None:
+            stats["errors"] += 1
+            if error.status_code == 404:
+                # Gone upstream: stop asking until it is old again
+                checked[candidate.model].append(bookkeeping)
+            continue
+
+        if response is None:
+            stats["not_modified"] += 1
+            checked[candidate.model].append(bookkeeping)
+            continue
+
+        data = response.json()
+        fields = employee_fields(data) if candidate.model is CompanyEmployee else company_fields(data)
+        new_hash = content_hash(fields)
+        validators = {
+            "source_etag": response.headers.get("ETag"),
+            "source_last_modified": response.headers.get("Last-Modified"),
+        }
+        if new_hash == candidate.content_hash:
+            stats["unchanged"] += 1
+            checked[candidate.model].append({**bookkeeping, **validators})
+        else:
+            stats["changed"] += 1
+            changed[candidate.model].append({
+                "id": candidate.row_id, **fields, **validators,
+                "content_hash": new_hash, "last_fetched_at": now, "updated_at": now,
+            })
+
+    for model in (Company, CompanyEmployee):
+        # Bulk UPDATE ... WHERE id = :id executemany; rows of one statement share a key set
+        for rows in (checked[model], changed[model]):
+            for keys in {tuple(sorted(row)) for row in rows}:
+                db.execute(update(model), [row for row in rows if tuple(sorted(row)) == keys])
+    db.commit()
+
+
+async def run_refresh(
+    db: Session,
+    client: LinkedInClient,
+    budget: int,
+    concurrency: int = 10,
+    write_batch: int = 500,
+    min_age: timedelta = timedelta(days=1),
+    demand_weight: float = 1.0,
+    include_companies: bool = True,
+) -> RefreshStats:
+    """
+    One refresh pass: spend at most ``budget`` upstream requests (before
+    retries, which the client's token bucket also paces) on the stalest,
+    most-demanded rows, committing every ``write_batch`` results.
+    """
+    stats = RefreshStats()
+    candidates = select_candidates(db, budget, datetime.utcnow(), min_age, demand_weight, include_companies)
+    stats["selected"] = len(candidates)
+
+    pending = []
+    async for result in fetch_candidates(client, candidates, concurrency):
+        pending.append(result)
+        stats["fetched"] += 1
+        if len(pending) >= write_batch:
+            apply_results(db, pending, stats)
+            pending = []
+    apply_results(db, pending, stats)
+    return stats
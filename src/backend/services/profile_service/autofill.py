@@ -0,0 +1,61 @@
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Optional, Tuple
+
+from sqlalchemy.orm import Session
+
+from ...shared.database import SessionLocal
+from ...shared.models import Resume
+from ...shared.schemas import AutofillSource
+
+
+async def timed_fetch(
+    source: str,
+    fetch: Callable[[], Awaitable[Any]],
+    timeout: float,
+) -> Tuple[Optional[Any], AutofillSource]:
+    """
+    Await ``fetch()`` for at most ``timeout`` seconds. Never raises: a timeout
+    or error is reported in the returned AutofillSource with a None result.
+    """
+    started = time.perf_counter()
+    result, status, error = None, "ok", None
+    try:
+        result = await asyncio.wait_for(fetch(), timeout)
+    except asyncio.TimeoutError:
+        status, error = "timeout", f"timed out after {timeout:g}s"
+    except Exception as e:
+        status, error = "error", str(e)
+
+    elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+    return result, AutofillSource(source=source, status=status, elapsed_ms=elapsed_ms, error=error)
+
+
+def load_completed_resume(resume_id: int, user_id: int):
+    """
+    The extracted fields of one of the user's parsed resumes. Uses its own
+    session, because a timed out lookup keeps running in its worker thread
+    after the request has finished with the request's session.
+    """
+    db: Session = SessionLocal()
+    try:
+        resume = db.query(
+            Resume.processing_status,
+            Resume.extracted_name,
+            Resume.extracted_email,
+            Resume.extracted_phone,
+            Resume.extracted_skills,
+            Resume.extracted_education,
+            Resume.extracted_experience,
+        ).filter(
+            Resume.id == resume_id,
+            Resume.user_id == user_id
+        ).first()
+    finally:
+        db.close()
+
+    if not resume:
+        raise LookupError("Resume not found")
+    if resume.processing_status != "completed":
+        raise LookupError(f"Resume processing status: {resume.processing_status}")
+    return resume
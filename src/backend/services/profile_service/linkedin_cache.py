@@ -0,0 +1,98 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Dict, Set
+
+from ...shared.schemas import LinkedInProfileData
+
+logger = logging.getLogger(__name__)
+
+
+class LinkedInProfileCache:
+    """
+    Per-worker cache of LinkedIn profile data keyed by normalized profile ID.
+
+    - Fresh entries (younger than ``ttl`` seconds) are returned as is.
+    - Stale entries (up to ``stale_ttl`` seconds past the TTL) are returned
+      immediately while one background refresh replaces them.
+    - Anything older, or missing, is fetched; concurrent requests for the same
+      ID share a single upstream call (single-flight). Failures are not cached.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[str], Awaitable[LinkedInProfileData]],
+        ttl: float = 86400.0,
+        stale_ttl: float = 604800.0,
+        max_entries: int = 50000,
+    ):
+        self.fetch = fetch
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._background: Set[asyncio.Task] = set()
+
+    @staticmethod
+    def normalize(profile_id: str) -> str:
+        # LinkedIn vanity names are case-insensitive
+        return profile_id.strip().lower()
+
+    async def get(self, profile_id: str) -> LinkedInProfileData:
+        key = self.normalize(profile_id)
+        entry = self._entries.get(key)
+        if entry is not None:
+            fetched_at, data = entry
+            age = time.monotonic() - fetched_at
+            if age < self.ttl + self.stale_ttl:
+                self._entries.move_to_end(key)
+                if age >= self.ttl and key not in self._inflight:
+                    self._refresh_in_background(key)
+                return data.model_copy()
+
+        # Shield the shared fetch so a cancelled caller (e.g. a timed out
+        # autofill) does not cancel it for everyone else
+        return (await asyncio.shield(self._fetch_once(key))).model_copy()
+
+    def _fetch_once(self, key: str) -> asyncio.Task:
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._load(key))
+            self._inflight[key] = task
+            task.add_done_callback(lambda task: self._finished(key, task))
+        return task
+
+    def _finished(self, key: str, task: asyncio.Task):
+        self._inflight.pop(key, None)
+        # Mark the error retrieved even if every caller went away
+        if not task.cancelled():
+            task.exception()
+
+    async def _load(self, key: str) -> LinkedInProfileData:
+        data = await self.fetch(key)
+        self._entries[key] = (time.monotonic(), data)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return data
+
+    def _refresh_in_background(self, key: str):
+        task = self._fetch_once(key)
+        self._background.add(task)
+
+        def _done(task: asyncio.Task):
+            self._background.discard(task)
+            if not task.cancelled() and task.exception() is not None:
+                # Keep serving the stale entry; the next stale read retries
+                logger.warning("Failed to refresh LinkedIn profile %s: %s", key, task.exception())
+
+        task.add_done_callback(_done)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def aclose(self):
+        for task in list(self._background):
+            task.cancel()
@@ -0,0 +1,180 @@
+import asyncio
+import importlib.util
+import os
+import random
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+
+import httpx
+
+from ...shared.tracing import SPAN_KIND_CLIENT, inject_headers, start_span
+
+# httpx negotiates HTTP/2 only with the optional h2 package (httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+RETRY_STATUS_CODES = {429, 500, 502, 503, 504}
+
+
+class LinkedInAPIError(Exception):
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+class TokenBucket:
+    """
+    Async token bucket: ``rate`` tokens per second, bursts of up to
+    ``capacity``. Waiters are served in arrival order.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                # Holding the lock while sleeping keeps later callers queued behind this one
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+def retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    """The delay requested by a Retry-After header (seconds or HTTP date), if any"""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class LinkedInClient:
+    """
+    Long-lived async HTTP client for the LinkedIn profile data API.
+
+    One instance per worker process: it keeps a pooled (HTTP/2 when available)
+    connection set open across requests, and all requests share its token
+    bucket. Throttled (429), 5xx and transport failures are retried with
+    capped exponential backoff and full jitter, honouring Retry-After.
+    """
+
+    def __init__(
+        self,
+        base_url: str,
+        access_token: Optional[str] = None,
+        rate: float = 100 / 3600,
+        burst: float = 10,
+        max_retries: int = 3,
+        backoff_base: float = 0.5,
+        backoff_max: float = 30.0,
+        timeout: float = 10.0,
+        max_connections: int = 20,
+    ):
+        self.base_url = base_url.rstrip("/")
+        self.access_token = access_token
+        self.bucket = TokenBucket(rate, burst)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self._client: Optional[httpx.AsyncClient] = None
+
+    @classmethod
+    def from_env(cls) -> Optional["LinkedInClient"]:
+        """The client configured by LINKEDIN_API_URL, or None when it is not set"""
+        base_url = os.getenv("LINKEDIN_API_URL")
+        if not base_url:
+            return None
+        return cls(
+            base_url,
+            access_token=os.getenv("LINKEDIN_API_TOKEN"),
+            rate=float(os.getenv("LINKEDIN_API_RATE_LIMIT", "100")) / float(os.getenv("LINKEDIN_API_WINDOW", "3600")),
+            burst=float(os.getenv("LINKEDIN_API_BURST", "10")),
+            max_retries=int(os.getenv("LINKEDIN_API_MAX_RETRIES", "3")),
+            timeout=float(os.getenv("LINKEDIN_API_TIMEOUT_SECONDS", "10")),
+            max_connections=int(os.getenv("LINKEDIN_API_MAX_CONNECTIONS", "20")),
+        )
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None:
+            headers = {"X-Restli-Protocol-Version": "2.0.0"}
+            if self.access_token:
+                headers["Authorization"] = f"Bearer {self.access_token}"
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                headers=headers,
+                http2=HTTP2_AVAILABLE,
+                timeout=self.timeout,
+                limits=httpx.Limits(max_connections=self.max_connections, max_keepalive_connections=self.max_connections),
+            )
+        return self._client
+
+    def backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+
+    async def _get(self, path: str, headers: Optional[Dict[str, str]] = None) -> httpx.Response:
+        """GET with rate limiting and retries; returns 200 and 304 responses, raises on anything else"""
+        for attempt in range(self.max_retries + 1):
+            await self.bucket.acquire()
+            try:
+                attributes = {"http.request.method": "GET", "url.path": path, "http.request.resend_count": attempt}
+                with start_span("LinkedIn GET", SPAN_KIND_CLIENT, attributes) as span:
+                    response = await self.client.get(path, headers=inject_headers(headers))
+                    span.set_attribute("http.response.status_code", response.status_code)
+            except httpx.TransportError as e:
+                if attempt == self.max_retries:
+                    raise LinkedInAPIError(f"LinkedIn API unreachable: {e}") from e
+                await asyncio.sleep(self.backoff(attempt))
+                continue
+
+            if response.status_code in (200, 304):
+                return response
+            if response.status_code not in RETRY_STATUS_CODES or attempt == self.max_retries:
+                raise LinkedInAPIError(f"LinkedIn API error: {response.status_code}", response.status_code)
+
+            delay = retry_after_seconds(response)
+            await asyncio.sleep(min(self.backoff_max, delay) if delay is not None else self.backoff(attempt))
+
+    async def get_json(self, path: str) -> Dict[str, Any]:
+        return (await self._get(path)).json()
+
+    async def get_if_modified(
+        self,
+        path: str,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> Optional[httpx.Response]:
+        """
+        Conditional GET with the validators from a previous response. Returns
+        None when the resource is unchanged (304), otherwise the 200 response,
+        whose ETag and Last-Modified headers should be kept for the next call.
+        """
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        response = await self._get(path, headers)
+        return None if response.status_code == 304 else response
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
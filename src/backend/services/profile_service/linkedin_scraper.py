@@ -1,7 +1,8 @@
 import re
 from typing import Dict, List, Optional, Any
-import httpx
 from ...shared.schemas import LinkedInProfileData
+from .linkedin_cache import LinkedInProfileCache
+from .linkedin_client import LinkedInClient
 
 
 class LinkedInScraper:
@@ -17,23 +18,25 @@ class LinkedInScraper:
     This implementation provides a structure for authorized API integration.
     """
 
-    def __init__(self):
-        self.base_url = "https://api.linkedin.com/v2"
+    def __init__(self, client: Optional[LinkedInClient] = None, cache_options: Optional[Dict[str, Any]] = None):
+        self.client = client
+        self.cache = LinkedInProfileCache(self._fetch_profile, **(cache_options or {})) if client is not None else None
 
-    def extract_profile(self, linkedin_url: str) -> LinkedInProfileData:
+    async def extract_profile(self, linkedin_url: str) -> LinkedInProfileData:
         """
         Extract profile data from LinkedIn URL.
 
-        In production, this should:
-        1. Use LinkedIn Official API
-        2. Require user OAuth authentication
-        3. Make authorized API calls
-
-        For now, returns mock data structure that can be replaced with real API calls.
+        With an API client configured (LINKEDIN_API_URL), fetches the profile
+        through it, via the profile cache. Otherwise returns mock data.
         """
         # Extract profile ID from URL
         profile_id = self._extract_profile_id(linkedin_url)
 
+        if self.client is not None:
+            if profile_id is None:
+                raise ValueError("Not a LinkedIn profile URL")
+            return await self.cache.get(profile_id)
+
         # TODO: Replace with actual LinkedIn API call
         # For development/testing, you could integrate with:
         # - LinkedIn Official API (requires OAuth)
@@ -45,6 +48,11 @@ class LinkedInScraper:
 
         return LinkedInProfileData(**profile_data)
 
+    def profile_key(self, linkedin_url: str) -> Optional[str]:
+        """Normalized profile ID identifying the profile a URL points to, or None if it is not a profile URL"""
+        profile_id = self._extract_profile_id(linkedin_url)
+        return LinkedInProfileCache.normalize(profile_id) if profile_id else None
+
     def _extract_profile_id(self, linkedin_url: str) -> Optional[str]:
         """Extract profile ID from LinkedIn URL"""
         # Pattern: https://www.linkedin.com/in/profile-id/
@@ -108,28 +116,20 @@ class LinkedInScraper:
             "profile_picture_url": None
         }
 
-    # TODO: Implement actual LinkedIn API integration
-    def _fetch_from_linkedin_api(self, access_token: str) -> Dict[str, Any]:
+    async def _fetch_from_linkedin_api(self, profile_id: str) -> Dict[str, Any]:
         """
-        Fetch profile data from LinkedIn Official API.
-        Requires OAuth access token.
-
-        Example implementation:
+        Fetch profile data from the configured profile data API, which
+        returns LinkedInProfileData fields for GET /profiles/{profile_id}.
         """
-        # headers = {
-        #     'Authorization': f'Bearer {access_token}',
-        #     'X-Restli-Protocol-Version': '2.0.0'
-        # }
-        #
-        # # Get basic profile
-        # response = httpx.get(
-        #     f'{self.base_url}/me',
-        #     headers=headers
-        # )
-        #
-        # if response.status_code == 200:
-        #     return response.json()
-        #
-        # raise Exception(f"LinkedIn API error: {response.status_code}")
-
-        pass
+        data = await self.client.get_json(f"/profiles/{profile_id}")
+        data.setdefault("linkedin_profile_id", profile_id)
+        return data
+
+    async def _fetch_profile(self, profile_id: str) -> LinkedInProfileData:
+        return LinkedInProfileData(**await self._fetch_from_linkedin_api(profile_id))
+
+    async def aclose(self):
+        if self.cache is not None:
+            await self.cache.aclose()
+        if self.client is not None:
+            await self.client.aclose()
@@ -1,28 +1,58 @@
-from fastapi import FastAPI, Depends, HTTPException, status, UploadFile, File, Form
+from fastapi import FastAPI, Depends, HTTPException, Query, Request, Response, status, UploadFile, File, Form
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
-from typing import Optional, List
+from fastapi.responses import ORJSONResponse, StreamingResponse
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Session, undefer
+from typing import Dict, Optional, List
+import asyncio
 import os
+import time
 from dotenv import load_dotenv
 
 from ...shared.database import engine, get_db, Base
 from ...shared.models import User, UserProfile, Resume
+from ...shared.metrics import instrument_app
+from ...shared.profiling import enable_profiling
+from ...shared.tracing import enable_tracing
+from ...shared.http_cache import make_etag, etag_matches, cache_headers, not_modified
+from ...shared.pagination import encode_cursor, decode_cursor
+from ...shared.responses import FAST_JSON_RESPONSES, orm_response, trusted_payload
 from ...shared.schemas import (
     ResumeUploadResponse,
     ResumeResponse,
+    ResumeSummary,
+    ResumeListResponse,
+    ResumeTextResponse,
     LinkedInProfileRequest,
     LinkedInProfileData,
+    LinkedInBatchRequest,
+    LinkedInBatchResult,
     AutofillProfileRequest,
     AutofillProfileResponse,
     UserProfileCreate
 )
-from ..user_service.auth import get_current_user
+from ..user_service.auth import get_current_email, get_current_user
+from .autofill import timed_fetch, load_completed_resume
 from .resume_parser import ResumeParser
+from .resume_storage import store_parsed_resume, parsed_resume, resume_text
+from .linkedin_client import LinkedInClient
 from .linkedin_scraper import LinkedInScraper
 from .s3_client import S3Client
 
 load_dotenv()
 
+# Cache-Control for GET /api/resume/{id}; the default makes clients revalidate with If-None-Match
+RESUME_CACHE_CONTROL = os.getenv("RESUME_CACHE_CONTROL", "private, no-cache")
+
+# Per-source timeouts for profile autofill, in seconds
+AUTOFILL_LINKEDIN_TIMEOUT = float(os.getenv("AUTOFILL_LINKEDIN_TIMEOUT_SECONDS", "5"))
+AUTOFILL_RESUME_TIMEOUT = float(os.getenv("AUTOFILL_RESUME_TIMEOUT_SECONDS", "2"))
+
+# Batch LinkedIn extraction limits
+MAX_LINKEDIN_BATCH_URLS = 1000
+LINKEDIN_BATCH_CONCURRENCY = int(os.getenv("LINKEDIN_BATCH_CONCURRENCY", "8"))
+
 # Create tables
 Base.metadata.create_all(bind=engine)
 
@@ -41,12 +71,33 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Prometheus metrics at GET /metrics
+instrument_app(app, engine)
+
+# Opt-in sampling profiler (PROFILE_SAMPLE_RATE / PROFILE_TOKEN); not installed otherwise
+enable_profiling(app)
+
+# Request, database, S3 and parser tracing (TRACE_EXPORT_FILE / TRACE_OTLP_ENDPOINT); not installed otherwise
+enable_tracing(app, engine)
+
 # Initialize services
 resume_parser = ResumeParser()
-linkedin_scraper = LinkedInScraper()
+linkedin_scraper = LinkedInScraper(
+    LinkedInClient.from_env(),
+    cache_options={
+        "ttl": float(os.getenv("LINKEDIN_CACHE_TTL_SECONDS", "86400")),
+        "stale_ttl": float(os.getenv("LINKEDIN_CACHE_STALE_SECONDS", "604800")),
+        "max_entries": int(os.getenv("LINKEDIN_CACHE_MAX_ENTRIES", "50000")),
+    },
+)
 s3_client = S3Client()
 
 
+@app.on_event("shutdown")
+async def close_linkedin_client():
+    await linkedin_scraper.aclose()
+
+
 # Health Check
 @app.get("/health")
 async def health_check():
@@ -94,14 +145,7 @@ async def upload_resume(
         parsed_data = resume_parser.parse_pdf(file_content)
 
         # Update resume with parsed data
-        resume.raw_text = parsed_data.get("raw_text")
-        resume.parsed_data = parsed_data
-        resume.extracted_name = parsed_data.get("name")
-        resume.extracted_email = parsed_data.get("email")
-        resume.extracted_phone = parsed_data.get("phone")
-        resume.extracted_skills = parsed_data.get("skills")
-        resume.extracted_education = parsed_data.get("education")
-        resume.extracted_experience = parsed_data.get("experience")
+        store_parsed_resume(resume, parsed_data)
         resume.processing_status = "completed"
 
         db.commit()
@@ -114,40 +158,113 @@ async def upload_resume(
             detail=f"Failed to parse resume: {str(e)}"
         )
 
-    return resume
+    return orm_response(ResumeUploadResponse, resume, status_code=status.HTTP_201_CREATED)
 
 
 # Get Resume
 @app.get("/api/resume/{resume_id}", response_model=ResumeResponse)
 async def get_resume(
+    resume_id: int,
+    request: Request,
+    response: Response,
+    email: str = Depends(get_current_email),
+    db: Session = Depends(get_db)
+):
+    """
+    Get resume details, including the parsed content.
+    Supports If-None-Match: a matching ETag returns 304 after a version-only
+    lookup, without loading or serializing the resume.
+    """
+    version = db.query(Resume.id, Resume.updated_at).join(
+        User, User.id == Resume.user_id
+    ).filter(Resume.id == resume_id, User.email == email).first()
+
+    if not version:
+        # Tell an unknown user (401) apart from a missing resume (404)
+        await get_current_user(email, db)
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Resume not found"
+        )
+
+    etag = make_etag(version.id, version.updated_at)
+    if etag_matches(request.headers.get("If-None-Match"), etag):
+        return not_modified(etag, RESUME_CACHE_CONTROL)
+
+    resume = db.query(Resume).options(undefer(Resume.parsed_data)).filter(Resume.id == version.id).first()
+    # Headers follow the loaded row, which may be newer than the version lookup
+    response.headers.update(cache_headers(make_etag(resume.id, resume.updated_at), RESUME_CACHE_CONTROL))
+
+    # The raw text is not part of parsed_data; GET /api/resume/{id}/text returns it
+    return orm_response(ResumeResponse, resume, response=response, parsed_data=parsed_resume(resume))
+
+
+# Get Resume Text
+@app.get("/api/resume/{resume_id}/text", response_model=ResumeTextResponse)
+async def get_resume_text(
     resume_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """Get resume details"""
-    resume = db.query(Resume).filter(
+    """Get the raw text extracted from a resume, decompressed on request"""
+    row = db.query(Resume.id, Resume.raw_text_compressed, Resume.raw_text).filter(
         Resume.id == resume_id,
         Resume.user_id == current_user.id
     ).first()
 
-    if not resume:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Resume not found"
         )
 
-    return resume
+    return ResumeTextResponse(id=row.id, raw_text=resume_text(row.raw_text_compressed, row.raw_text))
 
 
 # Get All User Resumes
-@app.get("/api/resume", response_model=List[ResumeResponse])
+@app.get("/api/resume", response_model=ResumeListResponse)
 async def get_user_resumes(
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
-    """Get all resumes for current user"""
-    resumes = db.query(Resume).filter(Resume.user_id == current_user.id).all()
-    return resumes
+    """
+    List the current user's resumes, newest first.
+    Pass the returned next_cursor to fetch the following page.
+    """
+    # Metadata columns only; raw_text and parsed_data are never read here
+    query = db.query(*(getattr(Resume, field) for field in ResumeSummary.model_fields)).filter(
+        Resume.user_id == current_user.id
+    )
+
+    if cursor:
+        try:
+            created_at, resume_id = decode_cursor(cursor)
+        except ValueError as e:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=str(e)
+            )
+        query = query.filter(tuple_(Resume.created_at, Resume.id) < tuple_(created_at, resume_id))
+
+    rows = query.order_by(Resume.created_at.desc(), Resume.id.desc()).limit(limit + 1).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].created_at, rows[-1].id)
+
+    if FAST_JSON_RESPONSES:
+        return ORJSONResponse({
+            "items": [trusted_payload(ResumeSummary, row) for row in rows],
+            "next_cursor": next_cursor,
+        })
+
+    return ResumeListResponse(
+        items=[ResumeSummary.model_validate(row) for row in rows],
+        next_cursor=next_cursor
+    )
 
 
 # Extract LinkedIn Profile Data
@@ -158,7 +275,7 @@ async def extract_linkedin_profile(
 ):
     """Extract data from LinkedIn profile URL"""
     try:
-        profile_data = linkedin_scraper.extract_profile(request.linkedin_url)
+        profile_data = await linkedin_scraper.extract_profile(request.linkedin_url)
         return profile_data
     except Exception as e:
         raise HTTPException(
@@ -167,63 +284,131 @@ async def extract_linkedin_profile(
         )
 
 
+async def stream_linkedin_extractions(request: Request, profiles: Dict[str, List[str]]):
+    """
+    Extract each distinct profile with at most LINKEDIN_BATCH_CONCURRENCY in
+    flight and yield results as they complete. Profiles are only started as
+    slots free up, and everything not yet started is cancelled when the
+    client goes away.
+    """
+    results: asyncio.Queue = asyncio.Queue()
+    remaining = iter(profiles.items())
+
+    async def worker():
+        for profile_id, linkedin_urls in remaining:
+            started = time.perf_counter()
+            try:
+                profile = await linkedin_scraper.extract_profile(linkedin_urls[0])
+                result = LinkedInBatchResult(profile_id=profile_id, linkedin_urls=linkedin_urls, profile=profile, elapsed_ms=0)
+            except Exception as e:
+                result = LinkedInBatchResult(profile_id=profile_id, linkedin_urls=linkedin_urls, elapsed_ms=0, error=str(e))
+            result.elapsed_ms = round((time.perf_counter() - started) * 1000, 1)
+            await results.put(result)
+
+    workers = [asyncio.create_task(worker()) for _ in range(min(LINKEDIN_BATCH_CONCURRENCY, len(profiles)))]
+    try:
+        for _ in profiles:
+            result = await results.get()
+            if await request.is_disconnected():
+                break
+            yield result
+    finally:
+        for task in workers:
+            task.cancel()
+
+
+# Extract LinkedIn Profiles in Batch
+@app.post("/api/linkedin/extract/batch")
+async def extract_linkedin_profiles_batch(
+    batch: LinkedInBatchRequest,
+    request: Request,
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Extract many LinkedIn profiles at once, streamed back as NDJSON
+    (one LinkedInBatchResult per line) in completion order. URLs for the same
+    profile are fetched once; failures are reported per item.
+    """
+    if len(batch.linkedin_urls) > MAX_LINKEDIN_BATCH_URLS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {MAX_LINKEDIN_BATCH_URLS} URLs per request"
+        )
+
+    profiles: Dict[str, List[str]] = {}
+    invalid = []
+    for linkedin_url in batch.linkedin_urls:
+        profile_id = linkedin_scraper.profile_key(linkedin_url)
+        if profile_id is None:
+            invalid.append(LinkedInBatchResult(linkedin_urls=[linkedin_url], elapsed_ms=0, error="Not a LinkedIn profile URL"))
+        else:
+            profiles.setdefault(profile_id, []).append(linkedin_url)
+
+    async def lines():
+        for result in invalid:
+            yield result.model_dump_json() + "\n"
+        async for result in stream_linkedin_extractions(request, profiles):
+            yield result.model_dump_json() + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
 # Autofill Profile from LinkedIn and/or Resume
 @app.post("/api/profile/autofill", response_model=AutofillProfileResponse)
 async def autofill_profile(
     linkedin_url: Optional[str] = Form(None),
     resume_id: Optional[int] = Form(None),
-    current_user: User = Depends(get_current_user),
-    db: Session = Depends(get_db)
+    current_user: User = Depends(get_current_user)
 ):
     """
     Autofill user profile from LinkedIn URL and/or resume data.
-    Combines data from both sources if both are provided.
+    Combines data from both sources if both are provided. The sources are
+    fetched concurrently, each with its own timeout; if one fails or times out
+    the other's data is still returned. `sources` reports each source's
+    outcome and latency.
     """
-    linkedin_data = None
-    resume_data = None
-    combined_profile = {}
+    if not linkedin_url and not resume_id:
+        return AutofillProfileResponse(
+            success=False,
+            message="Please provide LinkedIn URL or resume ID"
+        )
 
-    # Extract LinkedIn data if URL provided
+    fetches = {}
     if linkedin_url:
-        try:
-            linkedin_data = linkedin_scraper.extract_profile(linkedin_url)
-            combined_profile.update({
-                "first_name": linkedin_data.first_name,
-                "last_name": linkedin_data.last_name,
-                "headline": linkedin_data.headline,
-                "summary": linkedin_data.summary,
-                "location": linkedin_data.location,
-                "current_position": linkedin_data.current_position,
-                "current_company": linkedin_data.current_company,
-                "industry": linkedin_data.industry,
-                "skills": linkedin_data.skills,
-                "linkedin_url": linkedin_url,
-            })
-        except Exception as e:
-            return AutofillProfileResponse(
-                success=False,
-                message=f"Failed to extract LinkedIn data: {str(e)}"
-            )
-
-    # Extract resume data if resume_id provided
+        fetches["linkedin"] = timed_fetch(
+            "linkedin",
+            lambda: linkedin_scraper.extract_profile(linkedin_url),
+            AUTOFILL_LINKEDIN_TIMEOUT,
+        )
     if resume_id:
-        resume = db.query(Resume).filter(
-            Resume.id == resume_id,
-            Resume.user_id == current_user.id
-        ).first()
-
-        if not resume:
-            return AutofillProfileResponse(
-                success=False,
-                message="Resume not found"
-            )
+        fetches["resume"] = timed_fetch(
+            "resume",
+            lambda: run_in_threadpool(load_completed_resume, resume_id, current_user.id),
+            AUTOFILL_RESUME_TIMEOUT,
+        )
+    results = dict(zip(fetches, await asyncio.gather(*fetches.values())))
+    sources = [source for _, source in results.values()]
 
-        if resume.processing_status != "completed":
-            return AutofillProfileResponse(
-                success=False,
-                message=f"Resume processing status: {resume.processing_status}"
-            )
+    linkedin_data, _ = results.get("linkedin", (None, None))
+    resume, _ = results.get("resume", (None, None))
+    resume_data = None
+    combined_profile = {}
 
+    if linkedin_data:
+        combined_profile.update({
+            "first_name": linkedin_data.first_name,
+            "last_name": linkedin_data.last_name,
+            "headline": linkedin_data.headline,
+            "summary": linkedin_data.summary,
+            "location": linkedin_data.location,
+            "current_position": linkedin_data.current_position,
+            "current_company": linkedin_data.current_company,
+            "industry": linkedin_data.industry,
+            "skills": linkedin_data.skills,
+            "linkedin_url": linkedin_url,
+        })
+
+    if resume:
         # Use resume data to fill in missing fields
         if resume.extracted_name and not combined_profile.get("first_name"):
             name_parts = resume.extracted_name.split(" ", 1)
@@ -257,10 +442,15 @@ async def autofill_profile(
             "experience": resume.extracted_experience,
         }
 
+    failures = "; ".join(
+        f"{'LinkedIn' if source.source == 'linkedin' else 'Resume'} {source.status}: {source.error}"
+        for source in sources if source.status != "ok"
+    )
     if not linkedin_data and not resume_data:
         return AutofillProfileResponse(
             success=False,
-            message="Please provide LinkedIn URL or resume ID"
+            message=f"Failed to extract profile data ({failures})",
+            sources=sources
         )
 
     # Create profile data schema
@@ -271,7 +461,8 @@ async def autofill_profile(
         profile_data=profile_data,
         linkedin_data=linkedin_data,
         resume_data=resume_data,
-        message="Profile data extracted successfully"
+        message=f"Profile data extracted with partial results ({failures})" if failures else "Profile data extracted successfully",
+        sources=sources
     )
 
 
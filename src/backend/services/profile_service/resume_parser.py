@@ -3,6 +3,9 @@ import re
 from typing import Dict, List, Optional, Any
 from io import BytesIO
 
+from ...shared.metrics import RESUME_PARSE_STAGE_DURATION
+from ...shared.tracing import start_span
+
 
 class ResumeParser:
     """Parse PDF resumes and extract structured information"""
@@ -14,21 +17,28 @@ class ResumeParser:
 
     def parse_pdf(self, file_content: bytes) -> Dict[str, Any]:
         """Parse PDF resume and extract information"""
+        with start_span("parse_pdf", attributes={"resume.size_bytes": len(file_content)}):
+            return self._parse_pdf(file_content)
+
+    def _parse_pdf(self, file_content: bytes) -> Dict[str, Any]:
         # Extract raw text from PDF
-        raw_text = self._extract_text_from_pdf(file_content)
-
-        # Extract structured information
-        extracted_data = {
-            "raw_text": raw_text,
-            "name": self._extract_name(raw_text),
-            "email": self._extract_email(raw_text),
-            "phone": self._extract_phone(raw_text),
-            "linkedin_url": self._extract_linkedin_url(raw_text),
-            "skills": self._extract_skills(raw_text),
-            "education": self._extract_education(raw_text),
-            "experience": self._extract_experience(raw_text),
-            "summary": self._extract_summary(raw_text),
-        }
+        with RESUME_PARSE_STAGE_DURATION.labels("extract_text").time(), start_span("parse_pdf.extract_text"):
+            raw_text = self._extract_text_from_pdf(file_content)
+
+        # Extract structured information, timing each field as its own stage
+        extracted_data = {"raw_text": raw_text}
+        for field, extract in (
+            ("name", self._extract_name),
+            ("email", self._extract_email),
+            ("phone", self._extract_phone),
+            ("linkedin_url", self._extract_linkedin_url),
+            ("skills", self._extract_skills),
+            ("education", self._extract_education),
+            ("experience", self._extract_experience),
+            ("summary", self._extract_summary),
+        ):
+            with RESUME_PARSE_STAGE_DURATION.labels(field).time(), start_span(f"parse_pdf.{field}"):
+                extracted_data[field] = extract(raw_text)
 
         return extracted_data
 
@@ -0,0 +1,54 @@
+from typing import Any, Dict, Optional
+
+from ...shared.compression import compress_text, decompress_text
+from ...shared.models import Resume
+
+# parse_pdf fields that have their own Resume column
+EXTRACTED_COLUMNS = {
+    "name": "extracted_name",
+    "email": "extracted_email",
+    "phone": "extracted_phone",
+    "skills": "extracted_skills",
+    "education": "extracted_education",
+    "experience": "extracted_experience",
+}
+
+
+def structure_only(parsed_data: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """The part of a parse result that is stored in ``Resume.parsed_data``"""
+    if parsed_data is None:
+        return None
+    return {
+        field: value for field, value in parsed_data.items()
+        if field != "raw_text" and field not in EXTRACTED_COLUMNS
+    }
+
+
+def store_parsed_resume(resume: Resume, parsed_data: Dict[str, Any]):
+    """
+    Write a ``ResumeParser.parse_pdf`` result onto ``resume`` so each piece is
+    kept once: the raw text compressed, extracted fields in their columns and
+    only the remaining structure in ``parsed_data``.
+    """
+    resume.raw_text_compressed = compress_text(parsed_data.get("raw_text"))
+    resume.raw_text = None
+    for field, column in EXTRACTED_COLUMNS.items():
+        setattr(resume, column, parsed_data.get(field))
+    resume.parsed_data = structure_only(parsed_data)
+
+
+def parsed_resume(resume: Resume) -> Optional[Dict[str, Any]]:
+    """The full parse result without the raw text, reassembled from the stored columns"""
+    if resume.parsed_data is None and resume.processing_status != "completed":
+        return None
+    parsed = {field: getattr(resume, column) for field, column in EXTRACTED_COLUMNS.items()}
+    # Rows written before the compact layout still carry everything in parsed_data
+    parsed.update(structure_only(resume.parsed_data) or {})
+    return parsed
+
+
+def resume_text(raw_text_compressed: Optional[bytes], raw_text: Optional[str]) -> Optional[str]:
+    """Decompress stored resume text, falling back to the legacy uncompressed column"""
+    if raw_text_compressed is not None:
+        return decompress_text(raw_text_compressed)
+    return raw_text
@@ -1,9 +1,14 @@
 import boto3
+from botocore.config import Config
 from botocore.exceptions import ClientError
 import os
+from contextlib import contextmanager
 from dotenv import load_dotenv
 from typing import Optional
 
+from ...shared.metrics import S3_OPERATION_DURATION
+from ...shared.tracing import SPAN_KIND_CLIENT, start_span
+
 load_dotenv()
 
 
@@ -14,14 +19,26 @@ class S3Client:
         self.bucket_name = os.getenv("S3_BUCKET", "linkedin-networking-storage")
         self.region = os.getenv("AWS_REGION", "us-east-1")
 
+        # Optional S3-compatible endpoint (MinIO, scripts/s3_stub_server.py), addressed path-style
+        endpoint_url = os.getenv("S3_ENDPOINT_URL") or None
+
         # Initialize S3 client
         self.s3_client = boto3.client(
             's3',
             region_name=self.region,
+            endpoint_url=endpoint_url,
             aws_access_key_id=os.getenv("AWS_ACCESS_KEY_ID"),
-            aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY")
+            aws_secret_access_key=os.getenv("AWS_SECRET_ACCESS_KEY"),
+            config=Config(s3={'addressing_style': 'path'}) if endpoint_url else None
         )
 
+    @contextmanager
+    def _operation(self, operation: str, s3_key: str):
+        """Time an S3 call into the operation histogram and the current trace"""
+        attributes = {"aws.s3.bucket": self.bucket_name, "aws.s3.key": s3_key}
+        with S3_OPERATION_DURATION.labels(operation).time(), start_span(f"S3 {operation}", SPAN_KIND_CLIENT, attributes):
+            yield
+
     def upload_file(self, file_content: bytes, s3_key: str) -> bool:
         """
         Upload file to S3 bucket
@@ -34,12 +51,13 @@ class S3Client:
             True if upload successful, raises exception otherwise
         """
         try:
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=s3_key,
-                Body=file_content,
-                ServerSideEncryption='AES256'  # Enable encryption at rest
-            )
+            with self._operation("put_object", s3_key):
+                self.s3_client.put_object(
+                    Bucket=self.bucket_name,
+                    Key=s3_key,
+                    Body=file_content,
+                    ServerSideEncryption='AES256'  # Enable encryption at rest
+                )
             return True
         except ClientError as e:
             raise Exception(f"Failed to upload file to S3: {str(e)}")
@@ -55,11 +73,12 @@ class S3Client:
             File content as bytes
         """
         try:
-            response = self.s3_client.get_object(
-                Bucket=self.bucket_name,
-                Key=s3_key
-            )
-            return response['Body'].read()
+            with self._operation("get_object", s3_key):
+                response = self.s3_client.get_object(
+                    Bucket=self.bucket_name,
+                    Key=s3_key
+                )
+                return response['Body'].read()
         except ClientError as e:
             raise Exception(f"Failed to download file from S3: {str(e)}")
 
@@ -74,10 +93,11 @@ class S3Client:
             True if deletion successful
         """
         try:
-            self.s3_client.delete_object(
-                Bucket=self.bucket_name,
-                Key=s3_key
-            )
+            with self._operation("delete_object", s3_key):
+                self.s3_client.delete_object(
+                    Bucket=self.bucket_name,
+                    Key=s3_key
+                )
             return True
         except ClientError as e:
             raise Exception(f"Failed to delete file from S3: {str(e)}")
@@ -117,10 +137,11 @@ class S3Client:
             True if file exists, False otherwise
         """
         try:
-            self.s3_client.head_object(
-                Bucket=self.bucket_name,
-                Key=s3_key
-            )
+            with self._operation("head_object", s3_key):
+                self.s3_client.head_object(
+                    Bucket=self.bucket_name,
+                    Key=s3_key
+                )
             return True
         except ClientError:
             return False
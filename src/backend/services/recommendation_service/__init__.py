@@ -0,0 +1 @@
+# Recommendation service
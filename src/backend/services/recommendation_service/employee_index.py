@@ -0,0 +1,262 @@
+import re
+import threading
+from collections import defaultdict
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from ...shared.models import CompanyEmployee
+from ...shared.postings import PostingList, membership
+
+
+# Columns needed to index an employee; profile_data is never loaded
+INDEXED_COLUMNS = ("company_id", "skills", "position", "headline", "department")
+
+TITLE_STOPWORDS = {"a", "an", "and", "at", "for", "in", "of", "on", "the", "to", "with"}
+
+TITLE_SYNONYMS = {
+    "sr": "senior",
+    "jr": "junior",
+    "eng": "engineer",
+    "engineering": "engineer",
+    "mgr": "manager",
+    "dev": "developer",
+    "swe": "engineer",
+    "vp": "vice-president",
+}
+
+_token_pattern = re.compile(r"[a-z0-9+#]+")
+
+
+@lru_cache(maxsize=65536)
+def normalize_skill(skill: str) -> str:
+    """Normalize a skill name for indexing (case and whitespace insensitive)"""
+    return " ".join(skill.lower().split())
+
+
+def normalize_department(department: str) -> str:
+    """Normalize a department name for indexing"""
+    return " ".join(department.lower().split())
+
+
+@lru_cache(maxsize=65536)
+def title_tokens(title: str) -> Tuple[str, ...]:
+    """Split a position or headline into normalized title tokens"""
+    tokens = []
+    for token in _token_pattern.findall(title.lower()):
+        if token in TITLE_STOPWORDS:
+            continue
+        tokens.append(TITLE_SYNONYMS.get(token, token))
+    return tuple(tokens)
+
+
+def employee_terms(
+    company_id: Optional[int] = None,
+    skills: Optional[Iterable[str]] = None,
+    position: Optional[str] = None,
+    headline: Optional[str] = None,
+    department: Optional[str] = None,
+) -> List[str]:
+    """Build the set of index terms for an employee"""
+    terms = set()
+    if company_id is not None:
+        terms.add(f"company:{company_id}")
+    for skill in skills or []:
+        if isinstance(skill, str) and skill.strip():
+            terms.add(f"skill:{normalize_skill(skill)}")
+    for title in (position, headline):
+        if title:
+            terms.update(f"title:{token}" for token in title_tokens(title))
+    if department:
+        terms.add(f"dept:{normalize_department(department)}")
+    return sorted(terms)
+
+
+class EmployeeIndex:
+    """
+    In-process inverted index over CompanyEmployee skills, title tokens,
+    department and company, used to narrow the candidate set before scoring.
+    """
+
+    def __init__(self):
+        self._term_ids: Dict[str, int] = {}
+        self._postings: List[PostingList] = []
+        # Term IDs per employee (packed uint32) so updates can unindex old terms
+        self._doc_terms: Dict[int, bytes] = {}
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._doc_terms)
+
+    def __contains__(self, employee_id: int) -> bool:
+        return employee_id in self._doc_terms
+
+    def _term_id(self, term: str) -> int:
+        term_id = self._term_ids.get(term)
+        if term_id is None:
+            term_id = len(self._postings)
+            self._term_ids[term] = term_id
+            self._postings.append(PostingList())
+        return term_id
+
+    def add(self, employee_id: int, **fields: Any):
+        """Index an employee, replacing any previously indexed version"""
+        with self._lock:
+            new_terms = {self._term_id(term) for term in employee_terms(**fields)}
+            old_terms = set(np.frombuffer(self._doc_terms.get(employee_id, b""), dtype=np.uint32).tolist())
+
+            for term_id in old_terms - new_terms:
+                self._postings[term_id].remove(employee_id)
+            for term_id in new_terms - old_terms:
+                self._postings[term_id].add(employee_id)
+
+            self._doc_terms[employee_id] = np.array(sorted(new_terms), dtype=np.uint32).tobytes()
+
+    def remove(self, employee_id: int):
+        """Remove an employee from the index"""
+        with self._lock:
+            packed = self._doc_terms.pop(employee_id, None)
+            if packed is None:
+                return
+            for term_id in np.frombuffer(packed, dtype=np.uint32).tolist():
+                self._postings[term_id].remove(employee_id)
+
+    def apply_changes(self, upserted: List[Dict[str, Any]], deleted_ids: List[int]):
+        """Apply committed CompanyEmployee writes (see shared.change_feed.ChangeFeed)"""
+        with self._lock:
+            for row in upserted:
+                self.add(row["id"], **{column: row.get(column) for column in INDEXED_COLUMNS})
+            for employee_id in deleted_ids:
+                self.remove(employee_id)
+
+    def bulk_load(self, rows: Iterable[Tuple[Any, ...]]):
+        """
+        Build the index from ``(id, company_id, skills, position, headline, department)``
+        tuples. Much faster than repeated ``add`` calls; replaces existing contents.
+        """
+        term_ids: Dict[str, int] = {}
+        term_docs: Dict[int, List[int]] = defaultdict(list)
+        doc_terms: Dict[int, bytes] = {}
+
+        for employee_id, company_id, skills, position, headline, department in rows:
+            ids = []
+            for term in employee_terms(company_id, skills, position, headline, department):
+                term_id = term_ids.get(term)
+                if term_id is None:
+                    term_id = term_ids[term] = len(term_ids)
+                term_docs[term_id].append(employee_id)
+                ids.append(term_id)
+            doc_terms[employee_id] = np.array(ids, dtype=np.uint32).tobytes()
+
+        postings = [PostingList() for _ in range(len(term_ids))]
+        for term_id, docs in term_docs.items():
+            postings[term_id] = PostingList(np.unique(np.array(docs, dtype=np.int64)))
+
+        with self._lock:
+            self._term_ids = term_ids
+            self._postings = postings
+            self._doc_terms = doc_terms
+
+    def build_from_db(self, db: Session, batch_size: int = 10000):
+        """Load every CompanyEmployee, streaming only the indexed columns"""
+        query = db.query(
+            CompanyEmployee.id,
+            CompanyEmployee.company_id,
+            CompanyEmployee.skills,
+            CompanyEmployee.position,
+            CompanyEmployee.headline,
+            CompanyEmployee.department,
+        ).yield_per(batch_size)
+        self.bulk_load(tuple(row) for row in query)
+
+    def postings(self, term: str) -> np.ndarray:
+        """Return the sorted employee IDs for a single term"""
+        with self._lock:
+            term_id = self._term_ids.get(term)
+            if term_id is None:
+                return np.empty(0, dtype=np.int64)
+            return self._postings[term_id].ids()
+
+    def intersect(self, terms: Iterable[str]) -> np.ndarray:
+        """Employees matching every term (AND)"""
+        terms = list(terms)
+        if not terms:
+            return np.empty(0, dtype=np.int64)
+
+        with self._lock:
+            if any(term not in self._term_ids for term in terms):
+                return np.empty(0, dtype=np.int64)
+            # Intersect the shortest lists first so the working set shrinks fast
+            ordered = sorted(terms, key=lambda term: len(self._postings[self._term_ids[term]]))
+            result = self.postings(ordered[0])
+            for term in ordered[1:]:
+                if result.size == 0:
+                    break
+                result = result[membership(result, self.postings(term))]
+            return result
+
+    def union(self, terms: Iterable[str]) -> np.ndarray:
+        """Employees matching at least one term (OR)"""
+        with self._lock:
+            arrays = [self.postings(term) for term in terms]
+        arrays = [ids for ids in arrays if ids.size]
+        if not arrays:
+            return np.empty(0, dtype=np.int64)
+        if len(arrays) == 1:
+            return arrays[0]
+        return np.unique(np.concatenate(arrays))
+
+    def retrieve(
+        self,
+        skills: Optional[Iterable[str]] = None,
+        title: Optional[str] = None,
+        departments: Optional[Iterable[str]] = None,
+        company_id: Optional[int] = None,
+        match: str = "any",
+    ) -> np.ndarray:
+        """
+        Retrieve candidate employee IDs.
+
+        With ``match="any"`` an employee needs at least one of the skill, title
+        or department terms; with ``match="all"`` it needs every one of them.
+        ``company_id`` always restricts the result to that company.
+        """
+        if match not in ("any", "all"):
+            raise ValueError(f"Unknown match mode: {match}")
+
+        terms = [f"skill:{normalize_skill(skill)}" for skill in skills or [] if skill.strip()]
+        if title:
+            terms.extend(f"title:{token}" for token in title_tokens(title))
+        terms.extend(f"dept:{normalize_department(dept)}" for dept in departments or [] if dept.strip())
+        terms = list(dict.fromkeys(terms))
+
+        company_term = [f"company:{company_id}"] if company_id is not None else []
+
+        if not terms:
+            return self.postings(company_term[0]) if company_term else np.empty(0, dtype=np.int64)
+
+        if match == "all":
+            return self.intersect(terms + company_term)
+
+        if company_term:
+            # A company is far smaller than most terms, so filter it per term instead
+            # of materializing the full union
+            company_ids = self.postings(company_term[0])
+            matched = np.zeros(company_ids.size, dtype=bool)
+            for term in terms:
+                matched |= membership(company_ids, self.postings(term))
+            return company_ids[matched]
+
+        return self.union(terms)
+
+    def stats(self) -> Dict[str, int]:
+        """Size information for monitoring and benchmarks"""
+        with self._lock:
+            return {
+                "employees": len(self._doc_terms),
+                "terms": len(self._term_ids),
+                "postings": sum(len(posting) for posting in self._postings),
+                "posting_bytes": sum(posting.nbytes for posting in self._postings),
+            }
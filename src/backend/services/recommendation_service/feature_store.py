@@ -0,0 +1,370 @@
+import json
+import logging
+import os
+import shutil
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from ...shared.models import Company, CompanyEmployee
+from .scoring import CompanyScorer, ProfileFeatures, ScoringContext, seniority_level, skill_set
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_FEATURE_STORE_DIR = "./feature_store"
+
+# Name of the file holding the published snapshot version
+CURRENT_FILE = "CURRENT"
+
+# Skill postings are buffered in chunks of this many entries, then appended to disk
+SKILL_CHUNK_SIZE = 65536
+SKILL_INDEX_DTYPE = np.dtype("<i4")
+
+# Per-employee arrays, all ordered by (company_id, employee_id)
+ROW_ARRAYS = {
+    "employee_ids": np.int64,
+    "company_ids": np.int32,
+    "industries": np.int32,
+    "locations": np.int32,
+    "latitudes": np.float32,
+    "longitudes": np.float32,
+    "experience": np.float32,
+    "seniority": np.int8,
+    "skill_indptr": np.int64,
+    "vectors": np.float32,
+}
+
+
+def context_versions(context: ScoringContext) -> Dict[str, Any]:
+    """Versions of the lookup tables resolved into a snapshot at build time"""
+    return {
+        "industry_matrix_version": context.industries.version,
+        "gazetteer_version": context.gazetteer.version,
+        "embedding_dimensions": context.embeddings.dimensions,
+        "embedding_version": context.embeddings.version,
+    }
+
+
+def _snapshot_name(version: int) -> str:
+    return f"v{version:06d}"
+
+
+def _fsync_dir(path: Path):
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+class FeatureSnapshot:
+    """
+    One immutable, versioned feature store snapshot opened read-only.
+
+    Arrays are memory-mapped ``.npy`` files, so every worker on the host shares
+    the same page-cache pages and per-worker memory does not grow with the
+    employee table. Rows are ordered by (company_id, employee_id), so a
+    company's employees are one contiguous slice.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        with open(self.path / "manifest.json") as f:
+            self.manifest: Dict[str, Any] = json.load(f)
+        self.version: int = self.manifest["version"]
+
+        arrays = {name: np.load(self.path / f"{name}.npy", mmap_mode="r") for name in ROW_ARRAYS}
+        for name, array in arrays.items():
+            setattr(self, name, array)
+        self.skill_indices = np.load(self.path / "skill_indices.npy", mmap_mode="r")
+        self.sorted_ids = np.load(self.path / "sorted_ids.npy", mmap_mode="r")
+        self.sorted_rows = np.load(self.path / "sorted_rows.npy", mmap_mode="r")
+        self.company_keys = np.load(self.path / "company_keys.npy", mmap_mode="r")
+        self.company_offsets = np.load(self.path / "company_offsets.npy", mmap_mode="r")
+        with open(self.path / "skills.json") as f:
+            self.skill_names: List[str] = json.load(f)
+
+    def __len__(self) -> int:
+        return self.employee_ids.size
+
+    def matches(self, context: ScoringContext) -> bool:
+        """True if the snapshot was built with ``context``'s industry matrix, gazetteer and skill embeddings"""
+        return all(self.manifest.get(key) == value for key, value in context_versions(context).items())
+
+    def rows_for(self, employee_ids: np.ndarray) -> np.ndarray:
+        """Snapshot rows for employee IDs (-1 where absent)"""
+        employee_ids = np.asarray(employee_ids, dtype=np.int64)
+        rows = np.full(employee_ids.size, -1, dtype=np.int64)
+        if not len(self):
+            return rows
+        positions = np.minimum(np.searchsorted(self.sorted_ids, employee_ids), len(self) - 1)
+        found = self.sorted_ids[positions] == employee_ids
+        rows[found] = self.sorted_rows[positions[found]]
+        return rows
+
+    def company_slice(self, company_id: int) -> slice:
+        position = int(np.searchsorted(self.company_keys, company_id))
+        if position == self.company_keys.size or self.company_keys[position] != company_id:
+            return slice(0, 0)
+        return slice(int(self.company_offsets[position]), int(self.company_offsets[position + 1]))
+
+    def company_features(self, company_id: int) -> ProfileFeatures:
+        """Zero-copy views over one company's employee rows"""
+        rows = self.company_slice(company_id)
+        return ProfileFeatures(
+            ids=self.employee_ids[rows],
+            industries=self.industries[rows],
+            locations=self.locations[rows],
+            experience=self.experience[rows],
+            seniority=self.seniority[rows],
+            skills=None,
+            vectors=self.vectors[rows],
+        )
+
+    def company_scorer(self, company_id: int, context: ScoringContext) -> CompanyScorer:
+        rows = self.company_slice(company_id)
+        indptr = self.skill_indptr[rows.start:rows.stop + 1] if rows.stop > rows.start else np.zeros(1, dtype=np.int64)
+        return CompanyScorer(
+            self.company_features(company_id),
+            context,
+            skill_indptr=indptr,
+            skill_indices=self.skill_indices[indptr[0]:indptr[-1]],
+            skill_names=self.skill_names,
+        )
+
+
+class FeatureStore:
+    """
+    Follows the published snapshot under ``root`` and swaps to a new version
+    when the builder publishes one. Readers take a reference to one snapshot,
+    so a swap never changes features in the middle of a batch; the old
+    mappings are released once nothing references them.
+    """
+
+    def __init__(self, root: Path, check_interval: float = 30.0):
+        self.root = Path(root)
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._current: Optional[FeatureSnapshot] = None
+        self._next_check = 0.0
+
+    @property
+    def current(self) -> Optional[FeatureSnapshot]:
+        """The current snapshot (None until one is published), checked at most every ``check_interval`` seconds"""
+        if time.monotonic() >= self._next_check:
+            try:
+                self.refresh()
+            except Exception as e:
+                # Keep serving the last good snapshot
+                logger.warning("Failed to load feature store snapshot from %s: %s", self.root, e)
+        return self._current
+
+    def refresh(self) -> bool:
+        """Open the published snapshot if it changed; returns True if a new version was opened"""
+        with self._lock:
+            self._next_check = time.monotonic() + self.check_interval
+            try:
+                name = (self.root / CURRENT_FILE).read_text().strip()
+            except FileNotFoundError:
+                return False
+            if self._current is not None and self._current.path.name == name:
+                return False
+            self._current = FeatureSnapshot(self.root / name)
+            return True
+
+
+def publish_snapshot(root: Path, staging: Path, keep: int = 3) -> int:
+    """
+    Atomically publish a fully written staging directory as the next version:
+    rename it into place, then replace the CURRENT pointer. Older snapshots
+    beyond ``keep`` are removed; workers still mapping them keep their pages
+    until they swap.
+    """
+    root = Path(root)
+    versions = sorted(int(path.name[1:]) for path in root.glob("v[0-9]*") if path.is_dir())
+    version = (versions[-1] if versions else 0) + 1
+
+    manifest_path = staging / "manifest.json"
+    with open(manifest_path) as f:
+        manifest = json.load(f)
+    manifest["version"] = version
+    with open(manifest_path, "w") as f:
+        json.dump(manifest, f)
+        f.flush()
+        os.fsync(f.fileno())
+
+    name = _snapshot_name(version)
+    os.rename(staging, root / name)
+    _fsync_dir(root)
+
+    pointer = root / f"{CURRENT_FILE}.tmp"
+    with open(pointer, "w") as f:
+        f.write(name)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(pointer, root / CURRENT_FILE)
+    _fsync_dir(root)
+
+    for old in versions[:max(len(versions) + 1 - keep, 0)]:
+        shutil.rmtree(root / _snapshot_name(old), ignore_errors=True)
+    return version
+
+
+class SnapshotWriter:
+    """
+    Writes a snapshot into a staging directory. Rows must be added in
+    (company_id, employee_id) order; fixed-width arrays are streamed into
+    preallocated memory-mapped files and the variable-length skill postings
+    are appended to a raw file in chunks, so building never holds them in RAM.
+    """
+
+    def __init__(self, root: Path, count: int, context: ScoringContext):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.staging = self.root / f".staging-{os.getpid()}-{int(time.time())}"
+        self.staging.mkdir()
+        self.context = context
+        self.count = count
+        self.size = 0
+
+        self.arrays = {}
+        for name, dtype in ROW_ARRAYS.items():
+            shape = (count + 1,) if name == "skill_indptr" else (count,)
+            if name == "vectors":
+                shape = (count, context.embeddings.dimensions)
+            self.arrays[name] = np.lib.format.open_memmap(self.staging / f"{name}.npy", mode="w+", dtype=dtype, shape=shape)
+        self.skill_ids: Dict[str, int] = {}
+        self.skill_count = 0
+        self._skill_chunk: List[int] = []
+        self._skill_file = open(self.staging / "skill_indices.raw", "wb")
+
+    def add(self, employee_id: int, company_id: int, industry: Optional[str], location: Optional[str],
+            experience_years: Optional[float], title: Optional[str], skills: Optional[List[str]]):
+        row = self.size
+        if row == self.count:
+            raise ValueError("More rows added than the snapshot was sized for")
+        location_id = self.context.gazetteer.resolve(location)
+        profile_skills = skill_set(skills)
+
+        arrays = self.arrays
+        arrays["employee_ids"][row] = employee_id
+        arrays["company_ids"][row] = company_id
+        arrays["industries"][row] = self.context.industries.industry_id(industry)
+        arrays["locations"][row] = location_id
+        arrays["latitudes"][row] = self.context.gazetteer.latitudes[location_id]
+        arrays["longitudes"][row] = self.context.gazetteer.longitudes[location_id]
+        arrays["experience"][row] = experience_years or 0
+        arrays["seniority"][row] = seniority_level(title)
+        arrays["vectors"][row] = self.context.embeddings.pool(profile_skills)
+        self._skill_chunk.extend(self.skill_ids.setdefault(skill, len(self.skill_ids)) for skill in profile_skills)
+        self.skill_count += len(profile_skills)
+        if len(self._skill_chunk) >= SKILL_CHUNK_SIZE:
+            self._flush_skills()
+        arrays["skill_indptr"][row + 1] = self.skill_count
+        self.size += 1
+
+    def _flush_skills(self):
+        np.asarray(self._skill_chunk, dtype=SKILL_INDEX_DTYPE).tofile(self._skill_file)
+        self._skill_chunk.clear()
+
+    def _write_skill_indices(self):
+        """Wrap the raw skill postings in an .npy header, copying them in chunks"""
+        self._flush_skills()
+        self._skill_file.close()
+        raw = self.staging / "skill_indices.raw"
+        with open(raw, "rb") as source, open(self.staging / "skill_indices.npy", "wb") as target:
+            np.lib.format.write_array_header_1_0(target, {
+                "descr": np.lib.format.dtype_to_descr(SKILL_INDEX_DTYPE),
+                "fortran_order": False,
+                "shape": (self.skill_count,),
+            })
+            shutil.copyfileobj(source, target, 1 << 20)
+        raw.unlink()
+
+    def _truncate(self):
+        """Shrink the preallocated arrays when fewer rows were added than sized for"""
+        for name in list(self.arrays):
+            rows = self.size + 1 if name == "skill_indptr" else self.size
+            data = np.array(self.arrays.pop(name)[:rows])
+            np.save(self.staging / f"{name}.npy", data)
+            self.arrays[name] = np.load(self.staging / f"{name}.npy", mmap_mode="r")
+        self.count = self.size
+
+    def publish(self, keep: int = 3) -> int:
+        if self.size < self.count:
+            self._truncate()
+
+        company_ids = np.asarray(self.arrays["company_ids"])
+        employee_ids = np.asarray(self.arrays["employee_ids"])
+        company_keys, starts = np.unique(company_ids, return_index=True)
+        np.save(self.staging / "company_keys.npy", company_keys.astype(np.int32))
+        np.save(self.staging / "company_offsets.npy", np.append(starts, self.count).astype(np.int64))
+        order = np.argsort(employee_ids, kind="stable")
+        np.save(self.staging / "sorted_ids.npy", employee_ids[order])
+        np.save(self.staging / "sorted_rows.npy", order.astype(np.int64))
+        self._write_skill_indices()
+        with open(self.staging / "skills.json", "w") as f:
+            json.dump(sorted(self.skill_ids, key=self.skill_ids.get), f)
+
+        for array in self.arrays.values():
+            array.flush()
+        self.arrays.clear()
+        with open(self.staging / "manifest.json", "w") as f:
+            json.dump({
+                "created_at": datetime.utcnow().isoformat(),
+                "employees": self.count,
+                "companies": int(company_keys.size),
+                "skills": len(self.skill_ids),
+                **context_versions(self.context),
+            }, f)
+        for path in self.staging.iterdir():
+            with open(path, "rb") as f:
+                os.fsync(f.fileno())
+        return publish_snapshot(self.root, self.staging, keep=keep)
+
+    def abort(self):
+        self.arrays.clear()
+        self._skill_file.close()
+        shutil.rmtree(self.staging, ignore_errors=True)
+
+
+def build_snapshot(db: Session, root: Path, context: ScoringContext, batch_size: int = 10000, keep: int = 3) -> int:
+    """Build and publish a snapshot of every CompanyEmployee with a company; returns its version"""
+    count = db.query(CompanyEmployee.id).filter(CompanyEmployee.company_id.isnot(None)).count()
+    writer = SnapshotWriter(root, count, context)
+    try:
+        query = db.query(
+            CompanyEmployee.id,
+            CompanyEmployee.company_id,
+            CompanyEmployee.position,
+            CompanyEmployee.skills,
+            CompanyEmployee.profile_data,
+            Company.industry,
+        ).outerjoin(Company, CompanyEmployee.company_id == Company.id).filter(
+            CompanyEmployee.company_id.isnot(None)
+        ).order_by(
+            CompanyEmployee.company_id, CompanyEmployee.id
+        )
+        for employee_id, company_id, position, skills, profile_data, company_industry in query.yield_per(batch_size):
+            profile_data = profile_data or {}
+            writer.add(
+                employee_id,
+                company_id,
+                industry=profile_data.get("industry") or company_industry,
+                location=profile_data.get("location"),
+                experience_years=profile_data.get("experience_years") or profile_data.get("years_of_experience"),
+                title=position,
+                skills=skills,
+            )
+            if writer.size == count:
+                # Rows inserted after the count are picked up by the next build
+                break
+        return writer.publish(keep=keep)
+    except Exception:
+        writer.abort()
+        raise
@@ -0,0 +1,286 @@
+import csv
+import math
+import re
+import unicodedata
+import zlib
+from collections import defaultdict
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+
+DEFAULT_DATA_DIR = Path(__file__).parent / "data"
+
+EARTH_RADIUS_MILES = 3958.8
+
+# Index 0 is reserved for missing or unrecognized locations
+UNKNOWN_LOCATION = 0
+
+CITY, REGION, COUNTRY = 1, 2, 3
+
+# Bump when resolution rules change, so feature snapshots resolved by older rules are not reused
+RESOLVER_VERSION = 2
+
+NOISE_WORDS = {"greater", "area", "metropolitan", "metro", "region", "remote", "hybrid"}
+
+_punctuation = re.compile(r"[^a-z0-9, ]+")
+
+
+def normalize_location(location: str) -> str:
+    """Lowercase, strip accents and punctuation (commas are kept as separators)"""
+    location = unicodedata.normalize("NFKD", location).encode("ascii", "ignore").decode("ascii")
+    location = _punctuation.sub(" ", location.lower())
+    return ", ".join(" ".join(part.split()) for part in location.split(",") if part.strip())
+
+
+def _strip_noise(text: str) -> str:
+    words = [word for word in text.split() if word not in NOISE_WORDS]
+    return " ".join(words)
+
+
+def haversine_miles(latitude: float, longitude: float, latitudes: np.ndarray, longitudes: np.ndarray) -> np.ndarray:
+    """Great-circle distance in miles from one point to many (all in radians)"""
+    dlat = latitudes - latitude
+    dlon = longitudes - longitude
+    a = np.sin(dlat / 2) ** 2 + np.cos(latitude) * np.cos(latitudes) * np.sin(dlon / 2) ** 2
+    return 2 * EARTH_RADIUS_MILES * np.arcsin(np.sqrt(np.minimum(a, 1.0)))
+
+
+class Gazetteer:
+    """
+    Offline gazetteer that resolves free-text locations ("San Francisco Bay Area",
+    "Austin, TX", "Germany") to integer location IDs with coordinates.
+
+    Resolution is memoized per distinct string, and geographic scoring for a
+    candidate batch is vectorized over location ID arrays.
+    """
+
+    def __init__(self, data_dir: Path = DEFAULT_DATA_DIR, cache_size: int = 200000, cell_degrees: float = 1.0):
+        self.names: List[str] = [""]
+        kinds = [0]
+        countries = [""]
+        latitudes = [math.nan]
+        longitudes = [math.nan]
+
+        # Unqualified names, and (name, qualifier) pairs for "City, ST" style strings
+        self._names: Dict[str, int] = {}
+        self._qualified: Dict[Tuple[str, str], int] = {}
+        self._regions: Dict[str, int] = {}
+        # Region codes ("ca", "on") by code, each with the IDs of every country's region using it
+        self._region_codes: Dict[str, List[int]] = {}
+        self._countries: Dict[str, int] = {}
+
+        def add_place(name, kind, country, latitude, longitude):
+            self.names.append(name)
+            kinds.append(kind)
+            countries.append(country)
+            latitudes.append(float(latitude))
+            longitudes.append(float(longitude))
+            return len(self.names) - 1
+
+        # Location IDs depend on the data files and resolution rules; feature snapshots record which they used
+        checksum = zlib.crc32(str(RESOLVER_VERSION).encode())
+        for name in ("countries.csv", "regions.csv", "locations.csv"):
+            checksum = zlib.crc32((Path(data_dir) / name).read_bytes(), checksum)
+        self.version = f"{checksum:08x}"
+
+        country_names: Dict[str, List[str]] = {}
+        with open(Path(data_dir) / "countries.csv", newline="") as f:
+            for row in csv.DictReader(f):
+                location_id = add_place(row["name"], COUNTRY, row["code"], row["latitude"], row["longitude"])
+                keys = [row["name"], row["code"]] + [alias for alias in row["aliases"].split("|") if alias]
+                country_names[row["code"]] = [normalize_location(key) for key in keys]
+                for key in country_names[row["code"]]:
+                    self._countries.setdefault(key, location_id)
+
+        region_names: Dict[Tuple[str, str], List[str]] = {}
+        with open(Path(data_dir) / "regions.csv", newline="") as f:
+            for row in csv.DictReader(f):
+                location_id = add_place(row["name"], REGION, row["country"], row["latitude"], row["longitude"])
+                keys = [normalize_location(row["name"]), normalize_location(row["code"])]
+                region_names[(row["country"], row["code"])] = keys
+                # Full region names are unambiguous; bare codes only resolve as qualifiers
+                self._regions.setdefault(keys[0], location_id)
+                self._region_codes.setdefault(keys[1], []).append(location_id)
+
+        with open(Path(data_dir) / "locations.csv", newline="") as f:
+            for row in csv.DictReader(f):
+                location_id = add_place(row["name"], CITY, row["country"], row["latitude"], row["longitude"])
+                keys = [normalize_location(row["name"])]
+                keys += [normalize_location(alias) for alias in row["aliases"].split("|") if alias]
+                qualifiers = region_names.get((row["country"], row["region"]), []) + country_names.get(row["country"], [])
+                for key in keys:
+                    # The first listed city wins an ambiguous bare name
+                    self._names.setdefault(key, location_id)
+                    for qualifier in qualifiers:
+                        self._qualified.setdefault((key, qualifier), location_id)
+
+        self.kinds = np.array(kinds, dtype=np.int8)
+        country_codes = sorted(set(countries))
+        self.countries = np.array([country_codes.index(code) for code in countries], dtype=np.int16)
+        self.country_codes = country_codes
+        self.latitudes = np.radians(np.array(latitudes))
+        self.longitudes = np.radians(np.array(longitudes))
+
+        # Grid of city IDs by (lat, lon) cell for radius queries
+        self.cell_degrees = cell_degrees
+        cells = defaultdict(list)
+        for location_id in np.flatnonzero(self.kinds == CITY).tolist():
+            cells[self._cell(location_id)].append(location_id)
+        self._cells = {cell: np.array(ids, dtype=np.int32) for cell, ids in cells.items()}
+
+        self.resolve = lru_cache(maxsize=cache_size)(self._resolve)
+        self._score_row = lru_cache(maxsize=4096)(self._score_row)
+
+    def __len__(self) -> int:
+        return len(self.names) - 1
+
+    def _cell(self, location_id: int) -> Tuple[int, int]:
+        return (
+            int(math.floor(math.degrees(self.latitudes[location_id]) / self.cell_degrees)),
+            int(math.floor(math.degrees(self.longitudes[location_id]) / self.cell_degrees)),
+        )
+
+    def _lookup(self, text: str) -> int:
+        return (
+            self._names.get(text)
+            or self._regions.get(text)
+            or self._countries.get(text)
+            or UNKNOWN_LOCATION
+        )
+
+    def _resolve(self, location: Optional[str]) -> int:
+        if not location:
+            return UNKNOWN_LOCATION
+
+        normalized = normalize_location(location)
+        location_id = self._lookup(normalized.replace(",", "")) or self._lookup(_strip_noise(normalized.replace(",", "")))
+        if location_id:
+            return location_id
+
+        raw_parts = [part.strip() for part in normalized.split(",")]
+        parts = [_strip_noise(part) for part in raw_parts]
+        parts = [part for part in parts if part]
+        if not parts:
+            return UNKNOWN_LOCATION
+
+        # "City, Region" / "City, Country"
+        for city in dict.fromkeys((raw_parts[0], parts[0])):
+            for qualifier in parts[1:]:
+                location_id = self._qualified.get((city, qualifier))
+                if location_id:
+                    return location_id
+
+        # A qualifier naming a place means the city is not in the gazetteer there:
+        # "Fresno, CA" is California and "Portland, Maine" is Maine, not Portland, Oregon
+        for qualifier in parts[1:]:
+            qualifier_id = self._qualifier(qualifier, parts)
+            if qualifier_id:
+                # "California, US": keep the more specific first part when it lies inside the qualifier
+                region_id = self._regions.get(parts[0])
+                if region_id and self.countries[region_id] == self.countries[qualifier_id]:
+                    return region_id
+                return qualifier_id
+
+        location_id = self._names.get(parts[0])
+        if location_id:
+            return location_id
+
+        # Fall back to the most specific region or country mentioned
+        for part in parts:
+            location_id = self._regions.get(part) or self._countries.get(part)
+            if location_id:
+                return location_id
+        return UNKNOWN_LOCATION
+
+    def _qualifier(self, qualifier: str, parts: List[str]) -> int:
+        """
+        The region or country a trailing location part names. Codes are tried
+        as region codes before country codes, so "IL" is Illinois, not Israel;
+        a code shared by several countries' regions follows a country named in
+        ``parts``, else the first listed.
+        """
+        region_ids = self._region_codes.get(qualifier)
+        if region_ids:
+            named = {self.countries[self._countries[part]] for part in parts if part in self._countries}
+            return next((region_id for region_id in region_ids if self.countries[region_id] in named), region_ids[0])
+        return self._regions.get(qualifier) or self._countries.get(qualifier) or UNKNOWN_LOCATION
+
+    def resolve_many(self, locations: Iterable[Optional[str]]) -> np.ndarray:
+        """Location IDs for a batch of free-text locations"""
+        return np.fromiter((self.resolve(location) for location in locations), dtype=np.int32)
+
+    def country_code(self, location_id: int) -> Optional[str]:
+        return self.country_codes[self.countries[location_id]] or None
+
+    def distances_miles(self, location_id: int, location_ids: np.ndarray) -> np.ndarray:
+        """Distances from one location to many; NaN where either side is unknown"""
+        return haversine_miles(
+            self.latitudes[location_id],
+            self.longitudes[location_id],
+            self.latitudes[location_ids],
+            self.longitudes[location_ids],
+        )
+
+    def location_scores(self, user_location: int, employee_locations: np.ndarray) -> np.ndarray:
+        """
+        Geographic proximity of one user to a batch of employees:
+        same city 1.0, within 50 miles 0.9, same country 0.7, within 200 miles 0.6,
+        otherwise 0.3, and 0.5 when either location is unknown.
+        Distances only count between city-level locations.
+        """
+        return self._score_row(user_location)[employee_locations]
+
+    def _score_row(self, user_location: int) -> np.ndarray:
+        """Scores from one location to every gazetteer entry, so batches are a single gather"""
+        scores = np.full(len(self.names), 0.3, dtype=np.float32)
+        if user_location == UNKNOWN_LOCATION:
+            scores[:] = 0.5
+            return scores
+
+        location_ids = np.arange(len(self.names))
+        city_pair = (self.kinds == CITY) & (self.kinds[user_location] == CITY)
+        with np.errstate(invalid="ignore"):
+            distances = self.distances_miles(user_location, location_ids)
+            scores[city_pair & (distances < 200)] = 0.6
+            scores[self.countries == self.countries[user_location]] = 0.7
+            scores[city_pair & (distances < 50)] = 0.9
+        scores[city_pair & (location_ids == user_location)] = 1.0
+        scores[UNKNOWN_LOCATION] = 0.5
+        scores.setflags(write=False)
+        return scores
+
+    def nearby(self, location_id: int, radius_miles: float) -> np.ndarray:
+        """City IDs within ``radius_miles`` of a location, using the grid index"""
+        if location_id == UNKNOWN_LOCATION:
+            return np.empty(0, dtype=np.int32)
+
+        latitude = math.degrees(self.latitudes[location_id])
+        lat_span = radius_miles / 69.0
+        lon_span = radius_miles / max(69.0 * math.cos(math.radians(latitude)), 1e-6)
+        lat_cells = range(
+            int(math.floor((latitude - lat_span) / self.cell_degrees)),
+            int(math.floor((latitude + lat_span) / self.cell_degrees)) + 1,
+        )
+        longitude = math.degrees(self.longitudes[location_id])
+        lon_cells = range(
+            int(math.floor((longitude - min(lon_span, 180)) / self.cell_degrees)),
+            int(math.floor((longitude + min(lon_span, 180)) / self.cell_degrees)) + 1,
+        )
+        wrap = int(round(360 / self.cell_degrees))
+        half = wrap // 2
+
+        candidates = []
+        for lat_cell in lat_cells:
+            for lon_cell in lon_cells:
+                # Wrap across the antimeridian
+                cell = (lat_cell, (lon_cell + half) % wrap - half)
+                if cell in self._cells:
+                    candidates.append(self._cells[cell])
+        if not candidates:
+            return np.empty(0, dtype=np.int32)
+
+        candidates = np.unique(np.concatenate(candidates))
+        return candidates[self.distances_miles(location_id, candidates) <= radius_miles]
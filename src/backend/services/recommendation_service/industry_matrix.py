@@ -0,0 +1,141 @@
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INDUSTRIES_PATH = Path(__file__).parent / "data" / "industries.json"
+
+# Index 0 is reserved for missing or unrecognized industries
+UNKNOWN_INDUSTRY = 0
+
+
+def normalize_industry(industry: str) -> str:
+    return " ".join(industry.lower().replace("&", "and").split())
+
+
+class IndustryMatrix:
+    """
+    Immutable, versioned industry relatedness matrix.
+
+    Industries are mapped to integer IDs once, so scoring a whole candidate
+    batch is a single gather: ``matrix[user_industry, employee_industries]``.
+    """
+
+    def __init__(self, version: int, industries: List[str], aliases: Dict[str, int], matrix: np.ndarray):
+        self.version = version
+        self.industries = industries
+        self.matrix = matrix
+        self.matrix.setflags(write=False)
+        self._ids = {normalize_industry(name): index for index, name in enumerate(industries) if index}
+        self._ids.update(aliases)
+
+    @classmethod
+    def from_spec(cls, spec: Dict) -> "IndustryMatrix":
+        """Build the dense matrix from an industries spec (see data/industries.json)"""
+        industries = [""]
+        sector_of = [None]
+        for sector, names in spec["sectors"].items():
+            for name in names:
+                industries.append(name)
+                sector_of.append(sector)
+        ids = {normalize_industry(name): index for index, name in enumerate(industries) if index}
+
+        size = len(industries)
+        matrix = np.full((size, size), spec["default_score"], dtype=np.float32)
+
+        # Sector-level cross-industry scores
+        sectors = np.array([sector or "" for sector in sector_of])
+        for sector_a, sector_b, score in spec.get("sector_scores", []):
+            rows = sectors == sector_a
+            cols = sectors == sector_b
+            matrix[np.ix_(rows, cols)] = score
+            matrix[np.ix_(cols, rows)] = score
+
+        # Industries in the same sector are related
+        for sector in set(sector_of[1:]):
+            members = sectors == sector
+            matrix[np.ix_(members, members)] = spec["related_score"]
+
+        # Explicit industry pairs override sector defaults
+        for industry_a, industry_b, score in spec.get("industry_scores", []):
+            a = ids[normalize_industry(industry_a)]
+            b = ids[normalize_industry(industry_b)]
+            matrix[a, b] = matrix[b, a] = score
+
+        np.fill_diagonal(matrix, spec["same_score"])
+        matrix[UNKNOWN_INDUSTRY, :] = spec["unknown_score"]
+        matrix[:, UNKNOWN_INDUSTRY] = spec["unknown_score"]
+
+        aliases = {
+            normalize_industry(alias): ids[normalize_industry(target)]
+            for alias, target in spec.get("aliases", {}).items()
+        }
+        return cls(spec["version"], industries, aliases, matrix)
+
+    @classmethod
+    def load(cls, path: Path = DEFAULT_INDUSTRIES_PATH) -> "IndustryMatrix":
+        with open(path) as f:
+            return cls.from_spec(json.load(f))
+
+    def industry_id(self, industry: Optional[str]) -> int:
+        """Integer ID for an industry name; unknown industries map to 0"""
+        if not industry:
+            return UNKNOWN_INDUSTRY
+        return self._ids.get(normalize_industry(industry), UNKNOWN_INDUSTRY)
+
+    def industry_ids(self, industries: Iterable[Optional[str]]) -> np.ndarray:
+        return np.fromiter((self.industry_id(industry) for industry in industries), dtype=np.int32)
+
+    def scores(self, user_industry: int, employee_industries: np.ndarray) -> np.ndarray:
+        """Industry alignment of one user against a batch of employees"""
+        return self.matrix[user_industry, employee_industries]
+
+
+class IndustryMatrixStore:
+    """
+    Holds the current IndustryMatrix for the process and hot-reloads it when the
+    spec file changes on disk. Readers take a reference to one immutable matrix,
+    so a reload never changes scores in the middle of a batch.
+    """
+
+    def __init__(self, path: Optional[Path] = None, check_interval: float = 30.0):
+        self.path = Path(path or os.getenv("INDUSTRY_MATRIX_PATH", DEFAULT_INDUSTRIES_PATH))
+        self.check_interval = check_interval
+        self._lock = threading.Lock()
+        self._mtime = os.stat(self.path).st_mtime_ns
+        self._current = IndustryMatrix.load(self.path)
+        self._next_check = time.monotonic() + check_interval
+
+    @property
+    def current(self) -> IndustryMatrix:
+        """The current matrix, checking the spec file at most every ``check_interval`` seconds"""
+        if time.monotonic() >= self._next_check:
+            try:
+                self.reload()
+            except Exception as e:
+                # Keep serving the last good matrix
+                logger.warning("Failed to reload industry matrix from %s: %s", self.path, e)
+        return self._current
+
+    def reload(self, force: bool = False) -> bool:
+        """Reload the matrix if the spec file changed; returns True if a new version was loaded"""
+        with self._lock:
+            self._next_check = time.monotonic() + self.check_interval
+            mtime = os.stat(self.path).st_mtime_ns
+            if mtime == self._mtime and not force:
+                return False
+
+            matrix = IndustryMatrix.load(self.path)
+            self._mtime = mtime
+            if matrix.version == self._current.version and not force:
+                return False
+
+            self._current = matrix
+            return True
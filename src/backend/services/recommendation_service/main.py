@@ -0,0 +1,327 @@
+from fastapi import FastAPI, Depends, HTTPException, Query, Request, status
+from fastapi.concurrency import run_in_threadpool
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
+from sqlalchemy.orm import Session
+from typing import Optional, List
+import asyncio
+import logging
+import os
+import time
+from dotenv import load_dotenv
+
+from ...shared.change_feed import ChangeFeed
+from ...shared.database import engine, Base, SessionLocal, get_db
+from ...shared.models import User, UserProfile, CompanyEmployee
+from ...shared.schemas import EmployeeCandidatesResponse, SimilarEmployee, CompanyRecommendations, RecommendationScore
+from ..user_service.auth import get_current_user
+from .employee_index import EmployeeIndex, INDEXED_COLUMNS
+from .feature_store import FeatureStore, DEFAULT_FEATURE_STORE_DIR
+from .gazetteer import Gazetteer, DEFAULT_DATA_DIR
+from .industry_matrix import IndustryMatrixStore
+from .scoring import CompanyScorer, ProfileFeatures, ScoringContext, USER_FEATURE_COLUMNS, company_employee_features, user_profile_features
+from .skill_embeddings import SkillEmbeddings, SimHashIndex, ProfileVectorStore
+
+load_dotenv()
+
+logger = logging.getLogger(__name__)
+
+# Create tables
+Base.metadata.create_all(bind=engine)
+
+app = FastAPI(
+    title="Recommendation Service",
+    description="Candidate retrieval and connection recommendations",
+    version="1.0.0"
+)
+
+# CORS
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=os.getenv("CORS_ORIGINS", "http://localhost:3000").split(","),
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+
+# Initialize services
+employee_index = EmployeeIndex()
+industry_matrices = IndustryMatrixStore(
+    check_interval=float(os.getenv("INDUSTRY_MATRIX_CHECK_SECONDS", "30"))
+)
+gazetteer = Gazetteer(os.getenv("GAZETTEER_DATA_DIR", DEFAULT_DATA_DIR))
+# Employee feature snapshots are memory-mapped, so all workers share one copy
+feature_store = FeatureStore(
+    os.getenv("FEATURE_STORE_DIR", DEFAULT_FEATURE_STORE_DIR),
+    check_interval=float(os.getenv("FEATURE_STORE_CHECK_SECONDS", "30"))
+)
+
+
+def load_skill_embeddings() -> SkillEmbeddings:
+    """Load the offline skill embedding table (scripts/build_skill_embeddings.py) if present"""
+    path = os.path.join(os.getenv("ML_MODEL_PATH", "./models/"), "skill_embeddings.npz")
+    if os.path.exists(path):
+        return SkillEmbeddings.load(path)
+    # Without a table every skill is embedded on the fly with the same hashing
+    return SkillEmbeddings.build([])
+
+
+skill_embeddings = load_skill_embeddings()
+employee_vectors = ProfileVectorStore(
+    skill_embeddings,
+    ann_index=SimHashIndex(skill_embeddings.dimensions)
+    if os.getenv("SKILL_ANN_ENABLED", "true").lower() == "true" else None,
+)
+
+# Companies scored at once per streaming request
+STREAM_CONCURRENCY = int(os.getenv("RECOMMENDATION_STREAM_CONCURRENCY", "4"))
+MAX_STREAM_COMPANIES = 500
+
+# Keep the index and vectors in sync with CompanyEmployee writes from every process
+EMPLOYEE_BATCH_SIZE = int(os.getenv("EMPLOYEE_INDEX_BATCH_SIZE", "10000"))
+CHANGE_POLL_SECONDS = float(os.getenv("EMPLOYEE_CHANGE_POLL_SECONDS", "5"))
+employee_changes = ChangeFeed(
+    CompanyEmployee,
+    INDEXED_COLUMNS + ("skills",),
+    [employee_index.apply_changes, employee_vectors.apply_changes],
+    reconcile_interval=float(os.getenv("EMPLOYEE_CHANGE_RECONCILE_SECONDS", "300")),
+    batch_size=EMPLOYEE_BATCH_SIZE,
+)
+
+
+@app.on_event("startup")
+def build_employee_index():
+    """Build the employee inverted index and skill vectors from the database"""
+    db = SessionLocal()
+    try:
+        # Primed first, so writes made during the build are applied by the first poll
+        employee_changes.prime(db)
+        employee_index.build_from_db(db, batch_size=EMPLOYEE_BATCH_SIZE)
+        employee_vectors.build_from_db(db, batch_size=EMPLOYEE_BATCH_SIZE)
+    finally:
+        db.close()
+
+
+def poll_employee_changes():
+    db = SessionLocal()
+    try:
+        employee_changes.poll(db)
+    finally:
+        db.close()
+
+
+async def follow_employee_changes():
+    while True:
+        await asyncio.sleep(CHANGE_POLL_SECONDS)
+        try:
+            await run_in_threadpool(poll_employee_changes)
+        except Exception:
+            logger.exception("Failed to apply company employee changes")
+
+
+@app.on_event("startup")
+async def start_employee_change_feed():
+    app.state.employee_change_task = asyncio.create_task(follow_employee_changes())
+
+
+@app.on_event("shutdown")
+async def stop_employee_change_feed():
+    app.state.employee_change_task.cancel()
+
+
+# Health Check
+@app.get("/health")
+async def health_check():
+    return {
+        "status": "healthy",
+        "service": "recommendation-service",
+        "employee_index": employee_index.stats(),
+        "industry_matrix_version": industry_matrices.current.version,
+        "gazetteer_locations": len(gazetteer),
+        "skill_vectors": len(employee_vectors),
+        "feature_store_version": feature_store.current.version if feature_store.current else None,
+    }
+
+
+# Retrieve Candidate Employees
+@app.get("/api/employees/candidates", response_model=EmployeeCandidatesResponse)
+async def get_employee_candidates(
+    skills: Optional[List[str]] = Query(None),
+    title: Optional[str] = None,
+    departments: Optional[List[str]] = Query(None),
+    company_id: Optional[int] = None,
+    match: str = "any",
+    limit: int = Query(1000, ge=1, le=100000),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Retrieve candidate employee IDs from the inverted index.
+    Use match=any for OR semantics or match=all for AND semantics.
+    """
+    try:
+        candidates = employee_index.retrieve(
+            skills=skills,
+            title=title,
+            departments=departments,
+            company_id=company_id,
+            match=match,
+        )
+    except ValueError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=str(e)
+        )
+
+    return EmployeeCandidatesResponse(
+        count=int(candidates.size),
+        employee_ids=candidates[:limit].tolist()
+    )
+
+
+# People With Similar Skills
+@app.get("/api/employees/{employee_id}/similar", response_model=List[SimilarEmployee])
+async def get_similar_employees(
+    employee_id: int,
+    limit: int = Query(20, ge=1, le=100),
+    current_user: User = Depends(get_current_user)
+):
+    """Find employees with similar skill profiles using the approximate nearest-neighbour index"""
+    if employee_vectors.ann_index is None:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Similar-skills search is disabled"
+        )
+
+    vector = employee_vectors.vector_for(employee_id)
+    if vector is None or not vector.any():
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Employee not found or has no skills"
+        )
+
+    return [
+        SimilarEmployee(employee_id=similar_id, similarity=similarity)
+        for similar_id, similarity in employee_vectors.most_similar(vector, limit=limit, exclude=employee_id)
+    ]
+
+
+def score_company(company_id: int, user: ProfileFeatures, context: ScoringContext, limit: int) -> CompanyRecommendations:
+    """Top-K recommendations at one company, from the feature store snapshot when it was built with ``context``'s tables"""
+    started = time.perf_counter()
+    snapshot = feature_store.current
+    if snapshot is not None and snapshot.matches(context):
+        scorer = snapshot.company_scorer(company_id, context)
+    else:
+        db = SessionLocal()
+        try:
+            scorer = CompanyScorer(company_employee_features(db, company_id, context), context)
+        finally:
+            db.close()
+
+    matches = sorted(scorer.top_matches(user, limit=limit), key=lambda match: match["total_score"], reverse=True)
+    return CompanyRecommendations(
+        company_id=company_id,
+        recommendations=[
+            RecommendationScore(**{key: value for key, value in match.items() if key != "user_id"})
+            for match in matches
+        ],
+        elapsed_ms=(time.perf_counter() - started) * 1000,
+    )
+
+
+async def stream_company_recommendations(
+    request: Request,
+    company_ids: List[int],
+    user: ProfileFeatures,
+    context: ScoringContext,
+    limit: int,
+):
+    """
+    Score companies with at most STREAM_CONCURRENCY in flight and yield each
+    result as soon as it is ready. Companies are only started as slots free
+    up, so the first result does not wait on the rest, and everything not yet
+    started is cancelled when the client goes away.
+    """
+    results: asyncio.Queue = asyncio.Queue()
+    remaining = iter(company_ids)
+
+    async def worker():
+        for company_id in remaining:
+            started = time.perf_counter()
+            try:
+                result = await run_in_threadpool(score_company, company_id, user, context, limit)
+            except Exception as e:
+                result = CompanyRecommendations(
+                    company_id=company_id,
+                    elapsed_ms=(time.perf_counter() - started) * 1000,
+                    error=str(e),
+                )
+            await results.put(result)
+
+    workers = [asyncio.create_task(worker()) for _ in range(min(STREAM_CONCURRENCY, len(company_ids)))]
+    try:
+        for _ in company_ids:
+            result = await results.get()
+            if await request.is_disconnected():
+                break
+            yield result
+    finally:
+        for task in workers:
+            task.cancel()
+
+
+# Stream Recommendations Across Companies
+@app.get("/api/recommendations/stream")
+async def stream_recommendations(
+    request: Request,
+    company_ids: List[int] = Query(...),
+    limit: int = Query(20, ge=1, le=100),
+    format: str = Query("ndjson", pattern="^(ndjson|sse)$"),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db)
+):
+    """
+    Stream the current user's top recommendations per company as each
+    company finishes scoring, as NDJSON lines or Server-Sent Events.
+    """
+    company_ids = list(dict.fromkeys(company_ids))
+    if len(company_ids) > MAX_STREAM_COMPANIES:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {MAX_STREAM_COMPANIES} companies per request"
+        )
+
+    profile = db.query(*USER_FEATURE_COLUMNS).filter(UserProfile.user_id == current_user.id).first()
+    if not profile:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profile not found"
+        )
+
+    context = ScoringContext(industries=industry_matrices.current, gazetteer=gazetteer, embeddings=skill_embeddings)
+    user = user_profile_features([profile], context)
+    results = stream_company_recommendations(request, company_ids, user, context, limit)
+
+    if format == "sse":
+        async def events():
+            async for result in results:
+                yield f"event: company\ndata: {result.model_dump_json()}\n\n"
+            yield "event: done\ndata: {}\n\n"
+
+        return StreamingResponse(
+            events(),
+            media_type="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+        )
+
+    async def lines():
+        async for result in results:
+            yield result.model_dump_json() + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+if __name__ == "__main__":
+    import uvicorn
+    port = int(os.getenv("RECOMMENDATION_SERVICE_PORT", 8004))
+    uvicorn.run(app, host="0.0.0.0", port=port)
@@ -0,0 +1,298 @@
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from ...shared.models import Company, CompanyEmployee, UserProfile
+from .employee_index import normalize_skill, title_tokens
+from .gazetteer import Gazetteer
+from .industry_matrix import IndustryMatrix
+from .skill_embeddings import SkillEmbeddings
+
+
+# Factor weights from docs/algorithms/algorithm_design.md (calculate_match_score)
+WEIGHTS = {
+    "industry_alignment": 0.25,
+    "skill_compatibility": 0.20,
+    "experience_alignment": 0.15,
+    "geographic_proximity": 0.10,
+    "mutual_connections": 0.15,
+    "company_culture_fit": 0.10,
+    "seniority_compatibility": 0.05,
+}
+
+# No connection graph or company values are stored yet, so these factors are constant
+MUTUAL_CONNECTIONS_SCORE = 0.0
+CULTURE_FIT_SCORE = 0.5
+
+MAX_EXPERIENCE_DIFF = 20.0
+
+SENIORITY_LEVELS = ("entry", "mid", "senior", "executive")
+
+SENIORITY_TOKENS = {
+    "intern": 0, "junior": 0, "associate": 0, "entry": 0, "graduate": 0,
+    "senior": 2, "staff": 2, "principal": 2, "lead": 2, "manager": 2,
+    "director": 3, "head": 3, "vice-president": 3, "chief": 3, "partner": 3,
+    "founder": 3, "cto": 3, "ceo": 3, "cfo": 3, "coo": 3,
+}
+
+# Score by absolute level difference: within one level 1.0, two levels 0.7, otherwise 0.3
+_level_diff = np.abs(np.subtract.outer(np.arange(4), np.arange(4)))
+SENIORITY_SCORES = np.where(_level_diff <= 1, 1.0, np.where(_level_diff == 2, 0.7, 0.3)).astype(np.float32)
+
+
+def seniority_level(title: Optional[str]) -> int:
+    """Seniority level index for a job title (defaults to mid)"""
+    if not title:
+        return 1
+    levels = [SENIORITY_TOKENS[token] for token in title_tokens(title) if token in SENIORITY_TOKENS]
+    return max(levels) if levels else 1
+
+
+def skill_set(skills: Optional[Sequence[Any]]) -> Tuple[str, ...]:
+    return tuple(sorted({normalize_skill(skill) for skill in skills or [] if isinstance(skill, str) and skill.strip()}))
+
+
+@dataclass
+class ScoringContext:
+    """Per-process lookup tables shared by every scoring call"""
+    industries: IndustryMatrix
+    gazetteer: Gazetteer
+    embeddings: SkillEmbeddings
+
+    @classmethod
+    def load(cls, industries_path: Path, gazetteer_dir: Path, embeddings_path: Path) -> "ScoringContext":
+        """Load the scoring tables; without an embedding table skills are hashed on the fly"""
+        return cls(
+            industries=IndustryMatrix.load(industries_path),
+            gazetteer=Gazetteer(gazetteer_dir),
+            embeddings=SkillEmbeddings.load(embeddings_path) if os.path.exists(embeddings_path) else SkillEmbeddings.build([]),
+        )
+
+
+@dataclass
+class ProfileFeatures:
+    """
+    Column-oriented features for a batch of profiles (users or employees).
+    Skills are normalized, sorted tuples; feature store snapshots leave them
+    unset and pass their CSR skill layout to CompanyScorer instead.
+    """
+    ids: np.ndarray
+    industries: np.ndarray
+    locations: np.ndarray
+    experience: np.ndarray
+    seniority: np.ndarray
+    skills: Optional[List[Tuple[str, ...]]]
+    vectors: np.ndarray
+
+    def __len__(self) -> int:
+        return self.ids.size
+
+    @classmethod
+    def build(cls, rows: List[Dict[str, Any]], context: ScoringContext) -> "ProfileFeatures":
+        """
+        Build features from dicts with id, industry, location, experience_years,
+        title and skills keys.
+        """
+        skills = [skill_set(row.get("skills")) for row in rows]
+        vectors = np.zeros((len(rows), context.embeddings.dimensions), dtype=np.float32)
+        for i, profile_skills in enumerate(skills):
+            vectors[i] = context.embeddings.pool(profile_skills)
+        return cls(
+            ids=np.array([row["id"] for row in rows], dtype=np.int64),
+            industries=context.industries.industry_ids(row.get("industry") for row in rows),
+            locations=context.gazetteer.resolve_many(row.get("location") for row in rows),
+            experience=np.array([row.get("experience_years") or 0 for row in rows], dtype=np.float32),
+            seniority=np.array([seniority_level(row.get("title")) for row in rows], dtype=np.int8),
+            skills=skills,
+            vectors=vectors,
+        )
+
+    def slice(self, start: int, stop: int) -> "ProfileFeatures":
+        return ProfileFeatures(
+            ids=self.ids[start:stop],
+            industries=self.industries[start:stop],
+            locations=self.locations[start:stop],
+            experience=self.experience[start:stop],
+            seniority=self.seniority[start:stop],
+            skills=self.skills[start:stop] if self.skills is not None else None,
+            vectors=self.vectors[start:stop],
+        )
+
+
+# UserProfile columns consumed by user_profile_features, in order
+USER_FEATURE_COLUMNS = (
+    UserProfile.user_id,
+    UserProfile.industry,
+    UserProfile.location,
+    UserProfile.years_of_experience,
+    UserProfile.current_position,
+    UserProfile.skills,
+)
+
+
+def user_profile_features(rows: Iterable[Tuple], context: ScoringContext) -> ProfileFeatures:
+    """Features for users from rows of USER_FEATURE_COLUMNS"""
+    return ProfileFeatures.build([
+        {
+            "id": user_id,
+            "industry": industry,
+            "location": location,
+            "experience_years": experience,
+            "title": position,
+            "skills": skills,
+        }
+        for user_id, industry, location, experience, position, skills in rows
+    ], context)
+
+
+def company_employee_features(db: Session, company_id: int, context: ScoringContext) -> ProfileFeatures:
+    """Features for one company's employees; industry falls back to the company's"""
+    company_industry = db.query(Company.industry).filter(Company.id == company_id).scalar()
+    query = db.query(
+        CompanyEmployee.id,
+        CompanyEmployee.position,
+        CompanyEmployee.skills,
+        CompanyEmployee.profile_data,
+    ).filter(CompanyEmployee.company_id == company_id)
+    rows = []
+    for employee_id, position, skills, profile_data in query:
+        profile_data = profile_data or {}
+        rows.append({
+            "id": employee_id,
+            "industry": profile_data.get("industry") or company_industry,
+            "location": profile_data.get("location"),
+            "experience_years": profile_data.get("experience_years") or profile_data.get("years_of_experience"),
+            "title": position,
+            "skills": skills,
+        })
+    return ProfileFeatures.build(rows, context)
+
+
+class CompanyScorer:
+    """
+    Scores batches of users against every employee of one company.
+
+    Employee features are laid out once; each user batch is then scored with
+    whole-matrix operations (gathers, a skill-membership cumulative sum and one
+    matrix product for semantic similarity).
+    """
+
+    def __init__(
+        self,
+        employees: ProfileFeatures,
+        context: ScoringContext,
+        skill_indptr: Optional[np.ndarray] = None,
+        skill_indices: Optional[np.ndarray] = None,
+        skill_names: Optional[Sequence[str]] = None,
+    ):
+        """
+        Employee skills come from ``employees.skills``, or from a CSR layout of
+        global skill IDs (``skill_indptr``/``skill_indices`` into ``skill_names``)
+        such as a feature store snapshot slice.
+        """
+        self.employees = employees
+        self.context = context
+
+        # Company-local skill vocabulary and CSR skill lists
+        if skill_indptr is None:
+            self.vocabulary: Dict[str, int] = {}
+            indices = []
+            indptr = [0]
+            for profile_skills in employees.skills:
+                indices.extend(self.vocabulary.setdefault(skill, len(self.vocabulary)) for skill in profile_skills)
+                indptr.append(len(indices))
+            self.indices = np.array(indices, dtype=np.int32)
+            self.indptr = np.array(indptr, dtype=np.int64)
+        else:
+            global_ids, local_indices = np.unique(skill_indices, return_inverse=True)
+            self.vocabulary = {skill_names[skill_id]: local for local, skill_id in enumerate(global_ids.tolist())}
+            self.indices = local_indices.astype(np.int32)
+            self.indptr = np.asarray(skill_indptr, dtype=np.int64) - skill_indptr[0]
+        self.skill_counts = np.diff(self.indptr).astype(np.float32)
+
+    def _skill_intersections(self, users: ProfileFeatures) -> np.ndarray:
+        """Shared skill counts, users x employees"""
+        has_skill = np.zeros((len(users), len(self.vocabulary) + 1), dtype=np.int32)
+        for row, profile_skills in enumerate(users.skills):
+            local = [self.vocabulary[skill] for skill in profile_skills if skill in self.vocabulary]
+            has_skill[row, local] = 1
+        cumulative = np.zeros((len(users), self.indices.size + 1), dtype=np.int32)
+        np.cumsum(has_skill[:, self.indices], axis=1, out=cumulative[:, 1:])
+        return cumulative[:, self.indptr[1:]] - cumulative[:, self.indptr[:-1]]
+
+    def score(self, users: ProfileFeatures) -> Dict[str, np.ndarray]:
+        """Factor and total scores for a user batch, each shaped users x employees"""
+        employees = self.employees
+
+        industry = self.context.industries.matrix[users.industries[:, None], employees.industries[None, :]]
+
+        user_skill_counts = np.array([len(profile_skills) for profile_skills in users.skills], dtype=np.float32)
+        overlap = self._skill_intersections(users).astype(np.float32)
+        union = user_skill_counts[:, None] + self.skill_counts[None, :] - overlap
+        jaccard = np.divide(overlap, union, out=np.zeros_like(overlap), where=union > 0)
+        semantic = np.clip(users.vectors @ employees.vectors.T, 0.0, 1.0)
+        skill = np.where(union > 0, 0.6 * jaccard + 0.4 * semantic, 0.0).astype(np.float32)
+
+        experience_diff = np.abs(users.experience[:, None] - employees.experience[None, :])
+        experience = 1.0 - np.minimum(experience_diff / MAX_EXPERIENCE_DIFF, 1.0)
+
+        geographic = np.stack([
+            self.context.gazetteer.location_scores(int(location), employees.locations)
+            for location in users.locations
+        ])
+
+        seniority = SENIORITY_SCORES[users.seniority[:, None], employees.seniority[None, :]]
+
+        total = (
+            WEIGHTS["industry_alignment"] * industry
+            + WEIGHTS["skill_compatibility"] * skill
+            + WEIGHTS["experience_alignment"] * experience
+            + WEIGHTS["geographic_proximity"] * geographic
+            + WEIGHTS["mutual_connections"] * MUTUAL_CONNECTIONS_SCORE
+            + WEIGHTS["company_culture_fit"] * CULTURE_FIT_SCORE
+            + WEIGHTS["seniority_compatibility"] * seniority
+        )
+        return {
+            "total_score": total,
+            "industry_score": industry,
+            "skill_score": skill,
+            "experience_score": experience,
+            "geographic_score": geographic,
+        }
+
+    def top_matches(
+        self,
+        users: ProfileFeatures,
+        limit: int = 20,
+        min_score: float = 0.0,
+    ) -> Iterator[Dict[str, Any]]:
+        """Best ``limit`` employees per user as ConnectionRecommendation column dicts"""
+        if not len(users) or not len(self.employees):
+            return
+        scores = self.score(users)
+        total = scores["total_score"]
+
+        limit = min(limit, len(self.employees))
+        if limit < len(self.employees):
+            top = np.argpartition(-total, limit - 1, axis=1)[:, :limit]
+        else:
+            top = np.broadcast_to(np.arange(limit), (len(users), limit))
+        user_rows = np.repeat(np.arange(len(users)), limit)
+        employee_rows = top.ravel()
+        keep = total[user_rows, employee_rows] >= min_score
+        user_rows, employee_rows = user_rows[keep], employee_rows[keep]
+
+        columns = {name: values[user_rows, employee_rows].tolist() for name, values in scores.items()}
+        user_ids = users.ids[user_rows].tolist()
+        employee_ids = self.employees.ids[employee_rows].tolist()
+        for i in range(len(user_ids)):
+            yield {
+                "user_id": user_ids[i],
+                "employee_id": employee_ids[i],
+                "mutual_connections_score": MUTUAL_CONNECTIONS_SCORE,
+                **{name: values[i] for name, values in columns.items()},
+            }
@@ -0,0 +1,238 @@
+import threading
+import zlib
+from collections import defaultdict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from sqlalchemy.orm import Session
+
+from ...shared.models import CompanyEmployee
+from .employee_index import normalize_skill
+
+
+DEFAULT_DIMENSIONS = 64
+
+
+def _features(skill: str) -> List[str]:
+    """Character 3-5 grams with word boundary markers, plus whole words"""
+    features = []
+    for word in skill.split():
+        features.append(f"w:{word}")
+        marked = f"<{word}>"
+        for n in (3, 4, 5):
+            features.extend(marked[i:i + n] for i in range(len(marked) - n + 1))
+    return features
+
+
+def hash_embedding(skill: str, dimensions: int = DEFAULT_DIMENSIONS) -> np.ndarray:
+    """
+    Embed a skill by hashing its character n-grams into a signed, L2-normalized
+    float32 vector. Deterministic across processes and needs no model download.
+    """
+    vector = np.zeros(dimensions, dtype=np.float32)
+    for feature in _features(normalize_skill(skill)):
+        digest = zlib.crc32(feature.encode("utf-8"))
+        vector[digest % dimensions] += 1.0 if digest & 0x80000000 else -1.0
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+class SkillEmbeddings:
+    """
+    Skill embedding table: a contiguous float32 matrix with one row per known
+    skill. Skills outside the table are embedded on the fly and memoized.
+    """
+
+    def __init__(self, vocabulary: List[str], vectors: np.ndarray):
+        self.vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        self.dimensions = self.vectors.shape[1]
+        self._rows = {skill: row for row, skill in enumerate(vocabulary)}
+        # Identifies the table's contents, so feature snapshots record which one they pooled with
+        checksum = zlib.crc32("\0".join(vocabulary).encode("utf-8"))
+        self.version = f"{zlib.crc32(self.vectors.tobytes(), checksum):08x}"
+        self.vector = lru_cache(maxsize=100000)(self._vector)
+        self.pool = lru_cache(maxsize=100000)(self._pool)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    @classmethod
+    def build(cls, skills: Iterable[str], dimensions: int = DEFAULT_DIMENSIONS) -> "SkillEmbeddings":
+        vocabulary = sorted({normalize_skill(skill) for skill in skills if skill and skill.strip()})
+        vectors = np.zeros((len(vocabulary), dimensions), dtype=np.float32)
+        for row, skill in enumerate(vocabulary):
+            vectors[row] = hash_embedding(skill, dimensions)
+        return cls(vocabulary, vectors)
+
+    @classmethod
+    def load(cls, path: Path) -> "SkillEmbeddings":
+        with np.load(path, allow_pickle=False) as data:
+            return cls(data["vocabulary"].tolist(), data["vectors"])
+
+    def save(self, path: Path):
+        vocabulary = sorted(self._rows, key=self._rows.get)
+        np.savez(path, vocabulary=np.array(vocabulary), vectors=self.vectors)
+
+    def _vector(self, skill: str) -> np.ndarray:
+        skill = normalize_skill(skill)
+        row = self._rows.get(skill)
+        if row is not None:
+            return self.vectors[row]
+        return hash_embedding(skill, self.dimensions)
+
+    def _pool(self, skills: Tuple[str, ...]) -> np.ndarray:
+        vectors = [self.vector(skill) for skill in skills if skill and skill.strip()]
+        if not vectors:
+            return np.zeros(self.dimensions, dtype=np.float32)
+        pooled = np.mean(vectors, axis=0)
+        norm = np.linalg.norm(pooled)
+        pooled = pooled / norm if norm else pooled
+        pooled.setflags(write=False)
+        return pooled
+
+    def profile_vector(self, skills: Optional[Iterable[str]]) -> np.ndarray:
+        """Mean-pooled, normalized vector for a skill list (cached per distinct skill set)"""
+        return self.pool(tuple(sorted({normalize_skill(skill) for skill in skills or [] if isinstance(skill, str)})))
+
+
+class SimHashIndex:
+    """
+    Approximate nearest-neighbour index over pooled profile vectors using
+    random-hyperplane (SimHash) signatures in several hash tables.
+    """
+
+    def __init__(self, dimensions: int, tables: int = 8, bits: int = 12, seed: int = 7):
+        rng = np.random.default_rng(seed)
+        self.planes = rng.standard_normal((tables, bits, dimensions)).astype(np.float32)
+        self._weights = (1 << np.arange(bits)).astype(np.int64)
+        self._buckets: List[Dict[int, set]] = [defaultdict(set) for _ in range(tables)]
+        self._signatures: Dict[int, np.ndarray] = {}
+
+    def _signature(self, vector: np.ndarray) -> np.ndarray:
+        return ((self.planes @ vector) > 0).astype(np.int64) @ self._weights
+
+    def add(self, item_id: int, vector: np.ndarray):
+        self.remove(item_id)
+        if not vector.any():
+            return
+        signature = self._signature(vector)
+        self._signatures[item_id] = signature
+        for table, key in enumerate(signature.tolist()):
+            self._buckets[table][key].add(item_id)
+
+    def remove(self, item_id: int):
+        signature = self._signatures.pop(item_id, None)
+        if signature is None:
+            return
+        for table, key in enumerate(signature.tolist()):
+            bucket = self._buckets[table][key]
+            bucket.discard(item_id)
+            if not bucket:
+                del self._buckets[table][key]
+
+    def candidates(self, vector: np.ndarray) -> np.ndarray:
+        """IDs sharing a bucket with ``vector`` in at least one table"""
+        found = set()
+        for table, key in enumerate(self._signature(vector).tolist()):
+            found.update(self._buckets[table].get(key, ()))
+        return np.fromiter(found, dtype=np.int64, count=len(found))
+
+
+class ProfileVectorStore:
+    """
+    Pooled skill vectors for CompanyEmployee rows in one contiguous float32 matrix,
+    so semantic similarity for a candidate batch is a single matrix-vector product.
+    """
+
+    def __init__(self, embeddings: SkillEmbeddings, ann_index: Optional[SimHashIndex] = None):
+        self.embeddings = embeddings
+        self.ann_index = ann_index
+        self._rows: Dict[int, int] = {}
+        # Rows released by remove(), reused before the matrix grows
+        self._free_rows: List[int] = []
+        self._next_row = 0
+        # Dense employee ID -> matrix row lookup (-1 when absent) for vectorized gathers
+        self._row_of = np.full(1024, -1, dtype=np.int64)
+        self._matrix = np.zeros((1024, embeddings.dimensions), dtype=np.float32)
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def set(self, employee_id: int, skills: Optional[Iterable[str]]):
+        with self._lock:
+            row = self._rows.get(employee_id)
+            if row is None:
+                if self._free_rows:
+                    row = self._free_rows.pop()
+                else:
+                    row = self._next_row
+                    self._next_row += 1
+                if row == self._matrix.shape[0]:
+                    grown = np.zeros((row * 2, self._matrix.shape[1]), dtype=np.float32)
+                    grown[:row] = self._matrix
+                    self._matrix = grown
+                self._rows[employee_id] = row
+                if employee_id >= self._row_of.size:
+                    grown = np.full(max(employee_id + 1, self._row_of.size * 2), -1, dtype=np.int64)
+                    grown[:self._row_of.size] = self._row_of
+                    self._row_of = grown
+                self._row_of[employee_id] = row
+            vector = self.embeddings.profile_vector(skills)
+            self._matrix[row] = vector
+            if self.ann_index is not None:
+                self.ann_index.add(employee_id, vector)
+
+    def remove(self, employee_id: int):
+        with self._lock:
+            # The row is zeroed rather than compacted and reused by the next new employee
+            row = self._rows.pop(employee_id, None)
+            if row is not None:
+                self._matrix[row] = 0
+                self._row_of[employee_id] = -1
+                self._free_rows.append(row)
+            if self.ann_index is not None:
+                self.ann_index.remove(employee_id)
+
+    def apply_changes(self, upserted: List[Dict[str, Any]], deleted_ids: List[int]):
+        """Apply committed CompanyEmployee writes (see shared.change_feed.ChangeFeed)"""
+        for row in upserted:
+            self.set(row["id"], row.get("skills"))
+        for employee_id in deleted_ids:
+            self.remove(employee_id)
+
+    def build_from_db(self, db: Session, batch_size: int = 10000):
+        query = db.query(CompanyEmployee.id, CompanyEmployee.skills).yield_per(batch_size)
+        for employee_id, skills in query:
+            self.set(employee_id, skills)
+
+    def similarity(self, user_vector: np.ndarray, employee_ids: np.ndarray) -> np.ndarray:
+        """Cosine similarity of one profile vector against a batch of employees (0 if unknown)"""
+        with self._lock:
+            employee_ids = np.asarray(employee_ids, dtype=np.int64)
+            rows = np.full(employee_ids.size, -1, dtype=np.int64)
+            in_range = (employee_ids >= 0) & (employee_ids < self._row_of.size)
+            rows[in_range] = self._row_of[employee_ids[in_range]]
+            scores = np.zeros(rows.size, dtype=np.float32)
+            known = rows >= 0
+            scores[known] = self._matrix[rows[known]] @ user_vector
+        return scores
+
+    def most_similar(self, vector: np.ndarray, limit: int = 20, exclude: Optional[int] = None) -> List[Tuple[int, float]]:
+        """Approximate nearest employees by skill profile, re-ranked by exact cosine similarity"""
+        if self.ann_index is None:
+            raise RuntimeError("Approximate nearest-neighbour index is disabled")
+        with self._lock:
+            candidates = self.ann_index.candidates(vector)
+            if exclude is not None:
+                candidates = candidates[candidates != exclude]
+            scores = self.similarity(vector, candidates)
+        order = np.argsort(-scores)[:limit]
+        return [(int(candidates[i]), float(scores[i])) for i in order]
+
+    def vector_for(self, employee_id: int) -> Optional[np.ndarray]:
+        with self._lock:
+            row = self._rows.get(employee_id)
+            return None if row is None else self._matrix[row].copy()
@@ -9,8 +9,10 @@ import os
 from dotenv import load_dotenv
 
 from ...shared.database import get_db
+from ...shared.metrics import PASSWORD_HASH_DURATION
 from ...shared.models import User
 from ...shared.schemas import TokenData
+from ...shared.tracing import start_span
 
 load_dotenv()
 
@@ -28,12 +30,14 @@ oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/auth/login")
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against its hash"""
-    return pwd_context.verify(plain_password, hashed_password)
+    with PASSWORD_HASH_DURATION.labels("verify").time(), start_span("bcrypt.verify"):
+        return pwd_context.verify(plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
     """Hash a password"""
-    return pwd_context.hash(password)
+    with PASSWORD_HASH_DURATION.labels("hash").time(), start_span("bcrypt.hash"):
+        return pwd_context.hash(password)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -49,28 +53,36 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return encoded_jwt
 
 
-async def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
-) -> User:
-    """Get the current authenticated user from JWT token"""
-    credentials_exception = HTTPException(
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
 
+
+async def get_current_email(token: str = Depends(oauth2_scheme)) -> str:
+    """Email of the authenticated user from the JWT token, without a database lookup"""
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         email: str = payload.get("sub")
         if email is None:
-            raise credentials_exception
+            raise _credentials_exception()
         token_data = TokenData(email=email)
     except JWTError:
-        raise credentials_exception
+        raise _credentials_exception()
+
+    return token_data.email
 
-    user = db.query(User).filter(User.email == token_data.email).first()
+
+async def get_current_user(
+    email: str = Depends(get_current_email),
+    db: Session = Depends(get_db)
+) -> User:
+    """Get the current authenticated user from JWT token"""
+    with start_span("get_current_user"):
+        user = db.query(User).filter(User.email == email).first()
     if user is None:
-        raise credentials_exception
+        raise _credentials_exception()
 
     return user
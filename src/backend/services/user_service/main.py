@@ -1,5 +1,6 @@
-from fastapi import FastAPI, Depends, HTTPException, status
+from fastapi import FastAPI, Depends, HTTPException, Request, Response, status
 from fastapi.middleware.cors import CORSMiddleware
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 from typing import List
 import os
@@ -7,6 +8,11 @@ from dotenv import load_dotenv
 
 from ...shared.database import engine, get_db, Base
 from ...shared.models import User, UserProfile
+from ...shared.metrics import instrument_app
+from ...shared.profiling import enable_profiling
+from ...shared.tracing import enable_tracing
+from ...shared.http_cache import make_etag, etag_matches, cache_headers, not_modified
+from ...shared.responses import orm_response
 from ...shared.schemas import (
     UserCreate,
     UserResponse,
@@ -19,11 +25,16 @@ from .auth import (
     get_password_hash,
     verify_password,
     create_access_token,
+    get_current_email,
     get_current_user
 )
+from .profile_cache import CachedProfile, profile_cache
 
 load_dotenv()
 
+# Cache-Control for GET /api/profile/me; the default makes clients revalidate with If-None-Match
+PROFILE_CACHE_CONTROL = os.getenv("PROFILE_CACHE_CONTROL", "private, no-cache")
+
 # Create tables
 Base.metadata.create_all(bind=engine)
 
@@ -42,6 +53,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Prometheus metrics at GET /metrics
+instrument_app(app, engine)
+
+# Opt-in sampling profiler (PROFILE_SAMPLE_RATE / PROFILE_TOKEN); not installed otherwise
+enable_profiling(app)
+
+# Request, database, S3 and parser tracing (TRACE_EXPORT_FILE / TRACE_OTLP_ENDPOINT); not installed otherwise
+enable_tracing(app, engine)
+
 
 # Health Check
 @app.get("/health")
@@ -71,7 +91,7 @@ async def register_user(user_data: UserCreate, db: Session = Depends(get_db)):
     db.commit()
     db.refresh(new_user)
 
-    return new_user
+    return orm_response(UserResponse, new_user, status_code=status.HTTP_201_CREATED)
 
 
 # User Login
@@ -100,19 +120,49 @@ async def login(user_data: UserCreate, db: Session = Depends(get_db)):
 # Get Current User Profile
 @app.get("/api/profile/me", response_model=UserProfileResponse)
 async def get_my_profile(
-    current_user: User = Depends(get_current_user),
+    request: Request,
+    email: str = Depends(get_current_email),
     db: Session = Depends(get_db)
 ):
-    """Get current user's profile"""
-    profile = db.query(UserProfile).filter(UserProfile.user_id == current_user.id).first()
-
-    if not profile:
+    """
+    Get current user's profile.
+    Served from the profile cache when possible. Supports If-None-Match: a
+    matching ETag returns 304 from the cache, or after a version-only lookup,
+    without loading or serializing the profile.
+    """
+    cached = profile_cache.get(email)
+    if cached is None:
+        version = db.query(UserProfile.id, UserProfile.updated_at).join(
+            User, User.id == UserProfile.user_id
+        ).filter(User.email == email).first()
+
+        if version:
+            etag = make_etag(version.id, version.updated_at)
+            if etag_matches(request.headers.get("If-None-Match"), etag):
+                return not_modified(etag, PROFILE_CACHE_CONTROL)
+
+            profile = db.query(UserProfile).filter(UserProfile.id == version.id).first()
+            cached = profile_cache.store(email, profile) if profile else CachedProfile(None, None)
+        else:
+            # Tell an unknown user (401) apart from a missing profile (404)
+            await get_current_user(email, db)
+            profile_cache.store_missing(email)
+            cached = CachedProfile(None, None)
+
+    if cached.body is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Profile not found. Please create a profile first."
         )
 
-    return profile
+    if etag_matches(request.headers.get("If-None-Match"), cached.etag):
+        return not_modified(cached.etag, PROFILE_CACHE_CONTROL)
+
+    return Response(
+        content=cached.body,
+        media_type="application/json",
+        headers=cache_headers(cached.etag, PROFILE_CACHE_CONTROL)
+    )
 
 
 # Create User Profile
@@ -123,9 +173,9 @@ async def create_profile(
     db: Session = Depends(get_db)
 ):
     """Create user profile"""
-    # Check if profile already exists
-    existing_profile = db.query(UserProfile).filter(UserProfile.user_id == current_user.id).first()
-    if existing_profile:
+    # Check if profile already exists; writes always ask the database, never the cache
+    exists = db.query(UserProfile.id).filter(UserProfile.user_id == current_user.id).first() is not None
+    if exists:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Profile already exists. Use update endpoint to modify."
@@ -137,10 +187,19 @@ async def create_profile(
         **profile_data.model_dump()
     )
     db.add(profile)
-    db.commit()
+    try:
+        db.commit()
+    except IntegrityError:
+        # Created concurrently
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Profile already exists. Use update endpoint to modify."
+        )
     db.refresh(profile)
+    profile_cache.store(current_user.email, profile)
 
-    return profile
+    return orm_response(UserProfileResponse, profile, status_code=status.HTTP_201_CREATED)
 
 
 # Update User Profile
@@ -166,8 +225,9 @@ async def update_profile(
 
     db.commit()
     db.refresh(profile)
+    profile_cache.store(current_user.email, profile)
 
-    return profile
+    return orm_response(UserProfileResponse, profile)
 
 
 # Delete User Profile
@@ -185,8 +245,10 @@ async def delete_profile(
             detail="Profile not found"
         )
 
+    deleted_updated_at = profile.updated_at
     db.delete(profile)
     db.commit()
+    profile_cache.forget(current_user.email, deleted_updated_at)
 
     return None
 
@@ -0,0 +1,65 @@
+from datetime import datetime
+from typing import NamedTuple, Optional
+
+import orjson
+
+from ...shared.cache import VersionedCache, cache_from_env, version_of
+from ...shared.http_cache import make_etag
+from ...shared.models import UserProfile
+from ...shared.responses import trusted_payload
+from ...shared.schemas import UserProfileResponse
+
+
+class CachedProfile(NamedTuple):
+    etag: Optional[str]
+    body: Optional[bytes]  # Serialized UserProfileResponse; None if the user has no profile
+
+
+class ProfileCache:
+    """
+    Read-through cache of serialized profiles keyed by the owner's email (the
+    token subject, so hits need no database lookup at all). Entries are
+    versioned by the profile's updated_at: writers store after commit and a
+    reader populating from an older read can never replace a newer entry.
+    """
+
+    def __init__(self, backend: Optional[VersionedCache]):
+        self.backend = backend
+
+    def get(self, email: str) -> Optional[CachedProfile]:
+        if self.backend is None:
+            return None
+        entry = self.backend.get(email)
+        if entry is None:
+            return None
+        value = entry[1]
+        if value is None:
+            return CachedProfile(None, None)
+        etag, body = value.split(b"\n", 1)
+        return CachedProfile(etag.decode("ascii") or None, body)
+
+    def store(self, email: str, profile: UserProfile) -> CachedProfile:
+        """Cache ``profile`` as just loaded or committed"""
+        etag = make_etag(profile.id, profile.updated_at)
+        body = orjson.dumps(trusted_payload(UserProfileResponse, profile))
+        if self.backend is not None:
+            self.backend.set(email, version_of(profile.updated_at), (etag or "").encode("ascii") + b"\n" + body)
+        return CachedProfile(etag, body)
+
+    def store_missing(self, email: str):
+        """Record that a read found no profile; any write supersedes it"""
+        if self.backend is not None:
+            self.backend.set(email, 0, None)
+
+    def forget(self, email: str, deleted_updated_at: Optional[datetime]):
+        """
+        Tombstone a deleted profile so slower readers cannot cache it again.
+        The tombstone is versioned just after the deleted row's own updated_at,
+        not this host's clock, so a profile created afterwards (on any host)
+        still supersedes it.
+        """
+        if self.backend is not None:
+            self.backend.set(email, version_of(deleted_updated_at) + 1, None)
+
+
+profile_cache = ProfileCache(cache_from_env("profile"))
@@ -0,0 +1,140 @@
+import io
+import json
+from datetime import date, datetime
+from typing import Any, Dict, List, Sequence
+
+from sqlalchemy import JSON, Table, Text, cast, column, or_, select, table, text
+from sqlalchemy.orm import Session
+
+# COPY ... (FORMAT text) escapes; NULL is \N
+_COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def copy_value(value: Any) -> str:
+    """One field in PostgreSQL COPY text format"""
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, bytes):
+        # bytea hex input, with its backslash escaped for the text format
+        return "\\\\x" + value.hex()
+    if isinstance(value, (dict, list)):
+        value = json.dumps(value)
+    elif isinstance(value, (datetime, date)):
+        value = value.isoformat()
+    return str(value).translate(_COPY_ESCAPES)
+
+
+def copy_rows(db: Session, table_name: str, columns: Sequence[str], rows: List[Dict[str, Any]]) -> int:
+    """
+    Stream ``rows`` into ``table_name`` with COPY FROM STDIN on the session's
+    connection (PostgreSQL/psycopg2 only). Rows are encoded into one in-memory
+    buffer, so callers bound memory by the size of the batch they pass.
+    """
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write("\t".join(copy_value(row.get(name)) for name in columns))
+        buffer.write("\n")
+    buffer.seek(0)
+
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.copy_expert(f"COPY {table_name} ({', '.join(columns)}) FROM STDIN", buffer)
+    finally:
+        cursor.close()
+    return len(rows)
+
+
+def load_rows(db: Session, model, rows: List[Dict[str, Any]]) -> int:
+    """
+    Append ``rows`` (all with the same keys) to ``model``'s table without
+    conflict handling: COPY on PostgreSQL, an executemany INSERT elsewhere.
+    """
+    if not rows:
+        return 0
+    if db.get_bind().dialect.name == "postgresql":
+        return copy_rows(db, model.__tablename__, list(rows[0]), rows)
+    db.execute(model.__table__.insert(), rows)
+    return len(rows)
+
+
+def reset_id_sequence(db: Session, model):
+    """Move the id sequence past rows loaded with explicit ids (PostgreSQL only)"""
+    if db.get_bind().dialect.name == "postgresql":
+        table_name = model.__tablename__
+        db.execute(text(
+            f"SELECT setval(pg_get_serial_sequence('{table_name}', 'id'), "
+            f"(SELECT COALESCE(MAX(id), 0) + 1 FROM {table_name}), false)"
+        ))
+
+
+def _changed(target: Table, excluded, update_columns: Sequence[str]):
+    # json has no equality operator in PostgreSQL, so compare its text form
+    def comparable(expression, name):
+        return cast(expression, Text) if isinstance(target.c[name].type, JSON) else expression
+
+    return or_(*(
+        comparable(target.c[name], name).is_distinct_from(comparable(excluded[name], name))
+        for name in update_columns
+        if name != "updated_at"
+    ))
+
+
+def merge_rows(
+    db: Session,
+    model,
+    rows: List[Dict[str, Any]],
+    conflict_columns: Sequence[str],
+    update_columns: Sequence[str],
+) -> int:
+    """
+    Upsert ``rows`` into ``model``'s table on ``conflict_columns``, like
+    ``upsert_rows``, but leave existing rows whose ``update_columns`` are
+    unchanged untouched, so their updated_at is kept and no dead tuples are
+    written. Every row must have the same keys and ``conflict_columns``
+    must be unique within ``rows``. Returns the number of rows inserted or
+    changed.
+
+    On PostgreSQL the rows are COPYed into a temporary staging table and
+    merged with one INSERT ... SELECT ... ON CONFLICT DO UPDATE, then the
+    staging table is dropped. Other databases (SQLite) upsert the rows
+    directly with an executemany.
+    """
+    if not rows:
+        return 0
+
+    target = model.__table__
+    columns = list(rows[0])
+    dialect = db.get_bind().dialect.name
+
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+
+        staging_name = f"staging_{target.name}"
+        # Same column types as the target, but no constraints, indexes or defaults
+        db.execute(text(
+            f"CREATE TEMP TABLE {staging_name} ON COMMIT DROP AS "
+            f"SELECT {', '.join(columns)} FROM {target.name} WITH NO DATA"
+        ))
+        copy_rows(db, staging_name, columns, rows)
+        staging = table(staging_name, *(column(name) for name in columns))
+        statement = insert(target).from_select(columns, select(*(staging.c[name] for name in columns)))
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+
+        statement = insert(target)
+    else:
+        raise NotImplementedError(f"Bulk merge is not supported for {dialect}")
+
+    statement = statement.on_conflict_do_update(
+        index_elements=list(conflict_columns),
+        set_={name: statement.excluded[name] for name in update_columns},
+        where=_changed(target, statement.excluded, update_columns),
+    )
+    if dialect == "postgresql":
+        written = db.execute(statement).rowcount
+        db.execute(text(f"DROP TABLE {staging_name}"))
+    else:
+        written = db.execute(statement, rows).rowcount
+    return written
@@ -0,0 +1,139 @@
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from datetime import datetime
+from typing import Optional, Tuple
+
+# Entries whose value is None are tombstones: they record that the key has no
+# value as of their version, so a slower reader cannot bring back a deleted row.
+Entry = Tuple[int, Optional[bytes]]
+
+
+def version_of(updated_at: Optional[datetime]) -> int:
+    """Cache version for a row: its updated_at in microseconds (0 if unknown)"""
+    if updated_at is None:
+        return 0
+    return int((updated_at - datetime(1970, 1, 1)).total_seconds() * 1_000_000)
+
+
+class VersionedCache(ABC):
+    """
+    Key -> (version, value) store. ``set`` only replaces an entry with a
+    strictly newer version, so writers that commit or populate out of order
+    never overwrite newer data with older.
+    """
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Entry]:
+        """The cached ``(version, value)`` for ``key``, or None if nothing is cached"""
+
+    @abstractmethod
+    def set(self, key: str, version: int, value: Optional[bytes]) -> bool:
+        """Store ``value`` (None for a tombstone) unless a newer version is cached"""
+
+    @abstractmethod
+    def clear(self):
+        """Drop every entry"""
+
+
+class LRUCache(VersionedCache):
+    """
+    In-process cache bounded to ``max_entries``, each kept for at most ``ttl``
+    seconds. Writes only reach the process that made them, so with several
+    workers the TTL bounds how stale other workers can be.
+    """
+
+    def __init__(self, max_entries: int = 10000, ttl: float = 60.0):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Entry]:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                return None
+            version, value, expires_at = item
+            if expires_at < time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return version, value
+
+    def set(self, key: str, version: int, value: Optional[bytes]) -> bool:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is not None and item[0] >= version and item[2] >= time.monotonic():
+                return False
+            self._entries[key] = (version, value, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return True
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+class RedisCache(VersionedCache):
+    """Shared cache in Redis; the version check and write are one atomic script"""
+
+    # Hash fields: v = version, p = payload (absent for tombstones)
+    _SET_IF_NEWER = """
+    local current = redis.call('HGET', KEYS[1], 'v')
+    if current and tonumber(current) >= tonumber(ARGV[1]) then
+        return 0
+    end
+    redis.call('DEL', KEYS[1])
+    if ARGV[2] == '1' then
+        redis.call('HSET', KEYS[1], 'v', ARGV[1], 'p', ARGV[3])
+    else
+        redis.call('HSET', KEYS[1], 'v', ARGV[1])
+    end
+    redis.call('PEXPIRE', KEYS[1], ARGV[4])
+    return 1
+    """
+
+    def __init__(self, client, prefix: str, ttl: float = 3600.0):
+        self.client = client
+        self.prefix = prefix
+        self.ttl = ttl
+        self._set_if_newer = client.register_script(self._SET_IF_NEWER)
+
+    def get(self, key: str) -> Optional[Entry]:
+        version, value = self.client.hmget(self.prefix + key, "v", "p")
+        if version is None:
+            return None
+        return int(version), value
+
+    def set(self, key: str, version: int, value: Optional[bytes]) -> bool:
+        args = [version, "1" if value is not None else "0", value if value is not None else b"", int(self.ttl * 1000)]
+        return bool(self._set_if_newer(keys=[self.prefix + key], args=args))
+
+    def clear(self):
+        for key in self.client.scan_iter(match=self.prefix + "*"):
+            self.client.delete(key)
+
+
+def cache_from_env(name: str) -> Optional[VersionedCache]:
+    """
+    Build the cache configured by ``<NAME>_CACHE_BACKEND`` (memory, redis or
+    none), ``<NAME>_CACHE_TTL`` and ``<NAME>_CACHE_MAX_ENTRIES``.
+    """
+    prefix = name.upper()
+    backend = os.getenv(f"{prefix}_CACHE_BACKEND", "memory").lower()
+    ttl = float(os.getenv(f"{prefix}_CACHE_TTL", "60"))
+    if backend == "none":
+        return None
+    if backend == "redis":
+        import redis
+
+        client = redis.Redis.from_url(os.getenv("REDIS_URL", "redis://localhost:6379"))
+        return RedisCache(client, prefix=f"{name.lower()}:", ttl=ttl)
+    if backend == "memory":
+        return LRUCache(max_entries=int(os.getenv(f"{prefix}_CACHE_MAX_ENTRIES", "10000")), ttl=ttl)
+    raise ValueError(f"Unknown {prefix}_CACHE_BACKEND: {backend}")
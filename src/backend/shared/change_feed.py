@@ -0,0 +1,124 @@
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+ChangeCallback = Callable[[List[Dict[str, Any]], List[int]], None]
+
+# IN lists are chunked so reconciliation never builds an unbounded statement
+FETCH_CHUNK_SIZE = 5000
+
+
+class ChangeFeed:
+    """
+    Follows committed writes to ``model`` made by any process (bulk import,
+    the refresh scheduler, seed, other services) by polling the database, and
+    calls every ``callback(upserted, deleted_ids)`` with the changed rows'
+    ``columns`` and ``id``.
+
+    Inserts and updates are read by ``updated_at``. Each poll re-reads rows
+    updated since the newest ``updated_at`` seen, minus ``overlap`` seconds,
+    so writers with skewed clocks and transactions that commit after a later
+    one are still seen. Rows already applied at the same ``updated_at`` are
+    skipped. Every ``reconcile_interval`` seconds the table's ID set is
+    compared with the IDs seen so far. That catches deletes, and inserts from
+    writers that set an old ``updated_at`` (seed's historical timestamps,
+    raw SQL).
+    """
+
+    def __init__(
+        self,
+        model,
+        columns: Iterable[str],
+        callbacks: Sequence[ChangeCallback],
+        overlap: float = 10.0,
+        reconcile_interval: float = 300.0,
+        batch_size: int = 10000,
+    ):
+        self.model = model
+        self.columns = tuple(dict.fromkeys(columns))
+        self.callbacks = list(callbacks)
+        self.overlap = timedelta(seconds=overlap)
+        self.reconcile_interval = reconcile_interval
+        self.batch_size = batch_size
+        self._ids = np.empty(0, dtype=np.int64)
+        self._watermark: Optional[datetime] = None
+        # updated_at of rows applied inside the overlap window, to skip re-reads
+        self._recent: Dict[int, datetime] = {}
+        self._next_reconcile = 0.0
+
+    def _all_ids(self, db: Session) -> np.ndarray:
+        query = db.query(self.model.id).order_by(self.model.id).yield_per(self.batch_size)
+        return np.fromiter((row_id for (row_id,) in query), dtype=np.int64)
+
+    def _row(self, values: Tuple) -> Dict[str, Any]:
+        row = dict(zip(self.columns, values[2:]))
+        row["id"] = values[0]
+        return row
+
+    def _select(self, db: Session):
+        return db.query(
+            self.model.id, self.model.updated_at, *(getattr(self.model, column) for column in self.columns)
+        )
+
+    def prime(self, db: Session):
+        """Start following from the current state; call before building from the database"""
+        self._watermark = db.query(func.max(self.model.updated_at)).scalar()
+        self._ids = self._all_ids(db)
+        self._recent.clear()
+        if self._watermark is not None:
+            # Rows in the overlap window are part of the build, not changes
+            recent = db.query(self.model.id, self.model.updated_at).filter(
+                self.model.updated_at >= self._watermark - self.overlap
+            )
+            self._recent.update(recent)
+        self._next_reconcile = time.monotonic() + self.reconcile_interval
+
+    def _changed_since_watermark(self, db: Session) -> List[Dict[str, Any]]:
+        query = self._select(db)
+        if self._watermark is not None:
+            query = query.filter(self.model.updated_at >= self._watermark - self.overlap)
+        changed = []
+        for values in query.order_by(self.model.updated_at, self.model.id).yield_per(self.batch_size):
+            row_id, updated_at = values[0], values[1]
+            if updated_at is not None and self._recent.get(row_id) == updated_at:
+                continue
+            changed.append(self._row(values))
+            if updated_at is not None:
+                self._recent[row_id] = updated_at
+                if self._watermark is None or updated_at > self._watermark:
+                    self._watermark = updated_at
+
+        if self._watermark is not None:
+            horizon = self._watermark - self.overlap
+            self._recent = {row_id: updated_at for row_id, updated_at in self._recent.items() if updated_at >= horizon}
+        return changed
+
+    def _reconcile(self, db: Session, changed: List[Dict[str, Any]]) -> List[int]:
+        ids = self._all_ids(db)
+        deleted = np.setdiff1d(self._ids, ids, assume_unique=True).tolist()
+        seen = np.array([row["id"] for row in changed], dtype=np.int64)
+        missing = np.setdiff1d(np.setdiff1d(ids, self._ids, assume_unique=True), seen).tolist()
+        for start in range(0, len(missing), FETCH_CHUNK_SIZE):
+            chunk = missing[start:start + FETCH_CHUNK_SIZE]
+            changed.extend(self._row(values) for values in self._select(db).filter(self.model.id.in_(chunk)))
+        self._ids = ids
+        return deleted
+
+    def poll(self, db: Session) -> Tuple[int, int]:
+        """Apply changes committed since the last poll; returns (upserted, deleted) counts"""
+        changed = self._changed_since_watermark(db)
+        deleted = []
+        if time.monotonic() >= self._next_reconcile:
+            deleted = self._reconcile(db, changed)
+            self._next_reconcile = time.monotonic() + self.reconcile_interval
+        elif changed:
+            self._ids = np.union1d(self._ids, np.array([row["id"] for row in changed], dtype=np.int64))
+
+        if changed or deleted:
+            for callback in self.callbacks:
+                callback(changed, deleted)
+        return len(changed), len(deleted)
@@ -0,0 +1,22 @@
+from typing import Optional
+
+import zstandard
+
+# Resume-sized texts (a few KB of repetitive prose) compress 4-6x at this level
+# in well under a millisecond; higher levels buy little for much slower writes
+ZSTD_LEVEL = 10
+
+
+def compress_text(text: Optional[str]) -> Optional[bytes]:
+    """Encode ``text`` as a UTF-8 zstd frame for a LargeBinary column"""
+    if text is None:
+        return None
+    # Compressor objects are not thread-safe, so each call gets its own
+    return zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress(text.encode("utf-8"))
+
+
+def decompress_text(data: Optional[bytes]) -> Optional[str]:
+    """Decode a value written by ``compress_text``"""
+    if data is None:
+        return None
+    return zstandard.ZstdDecompressor().decompress(data).decode("utf-8")
@@ -0,0 +1,35 @@
+import hashlib
+from datetime import datetime
+from typing import Dict, Optional
+
+from fastapi import Response, status
+
+
+def make_etag(row_id: int, updated_at: Optional[datetime]) -> Optional[str]:
+    """Strong ETag for a row's representation, which changes whenever updated_at does"""
+    if updated_at is None:
+        return None
+    version = f"{row_id}:{updated_at.isoformat()}".encode("utf-8")
+    return f'"{hashlib.blake2b(version, digest_size=12).hexdigest()}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: Optional[str]) -> bool:
+    """Whether an If-None-Match header matches ``etag`` (weak comparison, per RFC 9110)"""
+    if not if_none_match or etag is None:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (candidate.strip() for candidate in if_none_match.split(","))
+    return etag in (candidate[2:] if candidate.startswith("W/") else candidate for candidate in candidates)
+
+
+def cache_headers(etag: Optional[str], cache_control: str) -> Dict[str, str]:
+    """Validator and caching headers for a per-user resource"""
+    headers = {"Cache-Control": cache_control, "Vary": "Authorization"}
+    if etag is not None:
+        headers["ETag"] = etag
+    return headers
+
+
+def not_modified(etag: str, cache_control: str) -> Response:
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=cache_headers(etag, cache_control))
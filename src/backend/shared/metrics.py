@@ -0,0 +1,186 @@
+import os
+import time
+
+from fastapi import FastAPI, Response
+from prometheus_client import CONTENT_TYPE_LATEST, CollectorRegistry, Gauge, Histogram, REGISTRY, generate_latest
+from prometheus_client.core import GaugeMetricFamily
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Request latencies span sub-millisecond cache hits to multi-second uploads
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+FAST_BUCKETS = (0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0)
+
+REQUEST_DURATION = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template and status code",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+REQUESTS_IN_PROGRESS = Gauge(
+    "http_requests_in_progress",
+    "HTTP requests currently being handled",
+    multiprocess_mode="livesum",
+)
+DB_QUERY_DURATION = Histogram(
+    "db_query_duration_seconds",
+    "Database statement execution time by statement type",
+    ["operation"],
+    buckets=FAST_BUCKETS,
+)
+S3_OPERATION_DURATION = Histogram(
+    "s3_operation_duration_seconds",
+    "S3 request latency by operation",
+    ["operation"],
+    buckets=LATENCY_BUCKETS,
+)
+RESUME_PARSE_STAGE_DURATION = Histogram(
+    "resume_parse_stage_duration_seconds",
+    "Time spent in each resume parsing stage",
+    ["stage"],
+    buckets=FAST_BUCKETS + (2.5, 5.0),
+)
+PASSWORD_HASH_DURATION = Histogram(
+    "password_hash_duration_seconds",
+    "bcrypt hashing and verification time",
+    ["operation"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.2, 0.3, 0.5, 1.0, 2.5),
+)
+
+# Requests that matched no route share one label so scanners cannot blow up cardinality
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+def route_path(app: FastAPI, scope) -> str:
+    """Path template of the route that handled ``scope``"""
+    endpoint = scope.get("endpoint")
+    if endpoint is None:
+        return UNMATCHED_ROUTE
+    for route in app.routes:
+        if getattr(route, "endpoint", None) is endpoint:
+            return route.path
+    return UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware recording REQUEST_DURATION and REQUESTS_IN_PROGRESS.
+
+    The route label is the matched route's path template (``/api/resume/{resume_id}``),
+    looked up from the endpoint the router stored in the scope, and histogram
+    children are cached per label set, so a request costs two clock reads,
+    two gauge updates and one observation.
+    """
+
+    def __init__(self, app, fastapi_app: FastAPI):
+        self.app = app
+        self.fastapi_app = fastapi_app
+        self._routes = None
+        self._children = {}
+
+    def _route(self, scope) -> str:
+        if self._routes is None:
+            self._routes = {
+                getattr(route, "endpoint", None): route.path for route in self.fastapi_app.routes
+            }
+        return self._routes.get(scope.get("endpoint"), UNMATCHED_ROUTE)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        REQUESTS_IN_PROGRESS.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            REQUESTS_IN_PROGRESS.dec()
+            key = (scope["method"], self._route(scope), status_code)
+            child = self._children.get(key)
+            if child is None:
+                child = self._children[key] = REQUEST_DURATION.labels(key[0], key[1], str(key[2]))
+            child.observe(elapsed)
+
+
+class PoolCollector:
+    """Connection pool usage of an engine, read at scrape time so it costs nothing per request"""
+
+    def __init__(self, engine: Engine):
+        self.engine = engine
+
+    def collect(self):
+        pool = self.engine.pool
+        gauge = GaugeMetricFamily("db_pool_connections", "Database connection pool usage", labels=["state"])
+        for state in ("checkedout", "checkedin", "overflow", "size"):
+            method = getattr(pool, state, None)
+            if method is not None:
+                # QueuePool counts overflow from -pool_size until the pool is full
+                gauge.add_metric([state], max(0, method()))
+        yield gauge
+
+
+_instrumented_engines = set()
+
+
+def instrument_engine(engine: Engine):
+    """Time every statement executed through ``engine`` into DB_QUERY_DURATION"""
+    if id(engine) in _instrumented_engines:
+        return
+    _instrumented_engines.add(id(engine))
+    children = {}
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - conn.info["query_started"].pop()
+        operation = statement.lstrip()[:6].upper()
+        child = children.get(operation)
+        if child is None:
+            # Unknown statement types share a label
+            label = operation.lower() if operation in ("SELECT", "INSERT", "UPDATE", "DELETE") else "other"
+            child = children[operation] = DB_QUERY_DURATION.labels(label)
+        child.observe(elapsed)
+
+    @event.listens_for(engine, "handle_error")
+    def _error(context):
+        started = context.connection.info.get("query_started") if context.connection is not None else None
+        if started:
+            started.pop()
+
+
+def metrics_registry() -> CollectorRegistry:
+    """The default registry, or one aggregating all workers when PROMETHEUS_MULTIPROC_DIR is set"""
+    if not os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        return REGISTRY
+    from prometheus_client import multiprocess
+
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return registry
+
+
+def instrument_app(app: FastAPI, engine: Engine):
+    """Add request metrics, database timing and a Prometheus ``GET /metrics`` endpoint to ``app``"""
+    app.add_middleware(MetricsMiddleware, fastapi_app=app)
+    instrument_engine(engine)
+    # Pool usage is per engine and process, so it is exported next to the shared registry
+    pool_registry = CollectorRegistry()
+    pool_registry.register(PoolCollector(engine))
+
+    @app.get("/metrics", include_in_schema=False)
+    def metrics():
+        output = generate_latest(metrics_registry()) + generate_latest(pool_registry)
+        return Response(output, media_type=CONTENT_TYPE_LATEST)
@@ -1,5 +1,5 @@
-from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, JSON, ForeignKey, Float
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, Text, JSON, ForeignKey, Float, Index, UniqueConstraint, LargeBinary
+from sqlalchemy.orm import relationship, deferred, undefer, undefer_group
 from datetime import datetime
 from .database import Base
 
@@ -50,7 +50,7 @@ class UserProfile(Base):
     # LinkedIn
     linkedin_url = Column(String)
     linkedin_profile_id = Column(String)
-    linkedin_profile_data = Column(JSON)  # Store raw LinkedIn data
+    linkedin_profile_data = deferred(Column(JSON))  # Store raw LinkedIn data
 
     # Skills & Interests
     skills = Column(JSON)  # Array of skills
@@ -66,6 +66,10 @@ class UserProfile(Base):
 
 class Resume(Base):
     __tablename__ = "resumes"
+    __table_args__ = (
+        # Backs per-user listing with keyset pagination on (created_at, id)
+        Index("ix_resumes_user_id_created_at_id", "user_id", "created_at", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
@@ -77,8 +81,9 @@ class Resume(Base):
     file_type = Column(String)  # PDF, DOCX, etc.
 
     # Parsed Content
-    raw_text = Column(Text)
-    parsed_data = Column(JSON)  # Structured data extracted from resume
+    raw_text_compressed = deferred(Column(LargeBinary), group="resume_content")  # zstd-compressed UTF-8 text
+    raw_text = deferred(Column(Text), group="resume_content")  # Legacy uncompressed text, NULL once migrated
+    parsed_data = deferred(Column(JSON), group="resume_content")  # Parsed fields without an extracted_* column
 
     # Extracted Information
     extracted_name = Column(String)
@@ -117,6 +122,12 @@ class Company(Base):
     website = Column(String)
     specialties = Column(JSON)
 
+    # Refresh State (maintained by the refresh scheduler)
+    source_etag = Column(String)  # Upstream validators for conditional fetches
+    source_last_modified = Column(String)
+    content_hash = Column(String)  # Hash of the last fetched upstream content
+    last_fetched_at = Column(DateTime)
+
     # Metadata
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -140,9 +151,15 @@ class CompanyEmployee(Base):
 
     # Profile Details
     profile_url = Column(String)
-    profile_data = Column(JSON)
+    profile_data = deferred(Column(JSON))
     skills = Column(JSON)
 
+    # Refresh State (maintained by the refresh scheduler)
+    source_etag = Column(String)  # Upstream validators for conditional fetches
+    source_last_modified = Column(String)
+    content_hash = Column(String)  # Hash of the last fetched upstream content
+    last_fetched_at = Column(DateTime)
+
     # Metadata
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
@@ -154,6 +171,10 @@ class CompanyEmployee(Base):
 
 class ConnectionRecommendation(Base):
     __tablename__ = "connection_recommendations"
+    __table_args__ = (
+        # One recommendation per (user, employee); batch recomputes upsert on this key
+        UniqueConstraint("user_id", "employee_id", name="uq_connection_recommendations_user_employee"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
@@ -176,3 +197,11 @@ class ConnectionRecommendation(Base):
 
     # Relationships
     employee = relationship("CompanyEmployee", back_populates="recommendations")
+
+
+# Large payload columns above are deferred: plain queries never fetch them and
+# accessing one lazy-loads it with an extra query. Reads that need them should
+# opt in explicitly, e.g. db.query(Resume).options(RESUME_CONTENT).
+RESUME_CONTENT = undefer_group("resume_content")
+LINKEDIN_PROFILE_DATA = undefer(UserProfile.linkedin_profile_data)
+EMPLOYEE_PROFILE_DATA = undefer(CompanyEmployee.profile_data)
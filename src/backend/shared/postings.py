@@ -0,0 +1,88 @@
+from typing import Optional
+
+import numpy as np
+
+
+def membership(ids: np.ndarray, sorted_ids: np.ndarray) -> np.ndarray:
+    """Boolean mask of the entries of ``ids`` present in ``sorted_ids`` (binary search, no re-sort)"""
+    if sorted_ids.size == 0:
+        return np.zeros(ids.size, dtype=bool)
+    positions = np.searchsorted(sorted_ids, ids)
+    positions[positions == sorted_ids.size] = 0
+    return sorted_ids[positions] == ids
+
+
+class PostingList:
+    """
+    Sorted IDs stored delta-encoded in the narrowest unsigned dtype
+    that fits the largest gap (frame-of-reference compression).
+
+    Incremental adds and removes are buffered and folded into the compressed
+    array the next time the list is read.
+    """
+
+    __slots__ = ("_first", "_deltas", "_added", "_removed")
+
+    def __init__(self, ids: Optional[np.ndarray] = None):
+        self._first = 0
+        self._deltas = np.empty(0, dtype=np.uint8)
+        self._added = set()
+        self._removed = set()
+        if ids is not None:
+            self._encode(ids)
+
+    def _encode(self, ids: np.ndarray):
+        """Compress a sorted, unique array of IDs"""
+        if ids.size == 0:
+            self._first = 0
+            self._deltas = np.empty(0, dtype=np.uint8)
+            return
+
+        deltas = np.diff(ids, prepend=ids[0])
+        max_delta = int(deltas.max())
+        if max_delta < 2 ** 8:
+            dtype = np.uint8
+        elif max_delta < 2 ** 16:
+            dtype = np.uint16
+        else:
+            dtype = np.uint32
+        self._first = int(ids[0])
+        self._deltas = deltas.astype(dtype)
+
+    def _decode(self) -> np.ndarray:
+        ids = np.cumsum(self._deltas, dtype=np.int64)
+        ids += self._first
+        return ids
+
+    def add(self, item_id: int):
+        if item_id in self._removed:
+            self._removed.discard(item_id)
+        else:
+            self._added.add(item_id)
+
+    def remove(self, item_id: int):
+        if item_id in self._added:
+            self._added.discard(item_id)
+        else:
+            self._removed.add(item_id)
+
+    def ids(self) -> np.ndarray:
+        """Return the posting list as a sorted int64 array"""
+        if self._added or self._removed:
+            ids = self._decode()
+            if self._removed:
+                ids = ids[~np.isin(ids, np.fromiter(self._removed, dtype=np.int64))]
+            if self._added:
+                ids = np.union1d(ids, np.fromiter(self._added, dtype=np.int64))
+            self._added.clear()
+            self._removed.clear()
+            self._encode(ids)
+            return ids
+        return self._decode()
+
+    def __len__(self) -> int:
+        return self._deltas.size + len(self._added) - len(self._removed)
+
+    @property
+    def nbytes(self) -> int:
+        return self._deltas.nbytes
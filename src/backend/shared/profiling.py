@@ -0,0 +1,306 @@
+import asyncio
+import hmac
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+import uuid
+from collections import Counter
+
+from fastapi import FastAPI
+from fastapi.concurrency import run_in_threadpool
+
+from .metrics import route_path
+
+PROFILE_TOKEN_HEADER = b"x-profile-token"
+REQUEST_ID_HEADER = b"x-request-id"
+PROFILE_FORMATS = ("speedscope", "collapsed")
+
+# Deeper stacks are truncated at the leaf end
+MAX_STACK_DEPTH = 256
+
+_HANDLE_RUN_CODE = asyncio.events.Handle._run.__code__
+
+
+def _code_key(code) -> tuple:
+    # co_qualname is new in Python 3.11; older interpreters only have the bare function name
+    return (getattr(code, "co_qualname", code.co_name), code.co_filename, code.co_firstlineno)
+
+
+def _frame_key(frame) -> tuple:
+    return _code_key(frame.f_code)
+
+
+def _thread_stack(frame, stop_code=None) -> list:
+    """Root-first frame keys of a thread, cut below ``stop_code`` (exclusive) when it is on the stack"""
+    frames = []
+    while frame is not None and frame.f_code is not stop_code:
+        frames.append(frame)
+        frame = frame.f_back
+    return [_frame_key(f) for f in reversed(frames[-MAX_STACK_DEPTH:])]
+
+
+def _coroutine_frames(coro) -> list:
+    """Frame keys of a suspended coroutine chain, outermost first"""
+    stack = []
+    while coro is not None and len(stack) < MAX_STACK_DEPTH:
+        frame = getattr(coro, "cr_frame", None) or getattr(coro, "gi_frame", None) or getattr(coro, "ag_frame", None)
+        if frame is None:
+            break
+        stack.append(_frame_key(frame))
+        coro = getattr(coro, "cr_await", None) or getattr(coro, "gi_yieldfrom", None) or getattr(coro, "ag_await", None)
+    return stack
+
+
+class _Sampler(threading.Thread):
+    """
+    Samples the wall-clock stack of one request every ``interval`` seconds.
+
+    The request runs as a task on the event loop thread. When that task (or a
+    task it awaits, including the first pending task of a gather) is the one
+    running, the loop thread's real stack is recorded. Otherwise the await
+    chain is recorded, ending in a pseudo-frame for what it is waiting on;
+    when that is an anyio worker thread (run_in_threadpool, sync
+    dependencies), the worker's stack is followed instead. ``<runnable>``
+    means the task was ready but the loop was busy with another request.
+    """
+
+    def __init__(self, task: asyncio.Task, loop, interval: float, max_seconds: float, root_code):
+        super().__init__(name="request-profiler", daemon=True)
+        self.task = task
+        self.loop = loop
+        self.loop_thread = threading.get_ident()
+        self.interval = interval
+        self.max_seconds = max_seconds
+        self.root_code = root_code
+        self.samples = []
+        self.started = time.perf_counter()
+        self._stop_event = threading.Event()
+
+    def stop(self):
+        self._stop_event.set()
+        self.join()
+
+    def run(self):
+        last = self.started
+        while not self._stop_event.wait(self.interval):
+            now = time.perf_counter()
+            if now - self.started > self.max_seconds:
+                break
+            stack = self._sample()
+            if stack:
+                self.samples.append((tuple(stack), now - last))
+            last = now
+
+    def _sample(self) -> list:
+        frames = sys._current_frames()
+        current = asyncio.current_task(self.loop)
+        task, stack = self.task, []
+        while task is not None and len(stack) < MAX_STACK_DEPTH:
+            if task is current:
+                # Running on the loop: the real stack above the loop's callback dispatch
+                loop_frame = frames.get(self.loop_thread)
+                return self._from_root(stack + _thread_stack(loop_frame, stop_code=_HANDLE_RUN_CODE))
+            stack += _coroutine_frames(task.get_coro())
+            waiter = getattr(task, "_fut_waiter", None)
+            if waiter is None:
+                stack.append(("<runnable>", "", 0))
+                break
+            if isinstance(waiter, asyncio.Task):
+                task = waiter
+                continue
+            children = getattr(waiter, "_children", None)
+            if children:
+                task = next((child for child in children if isinstance(child, asyncio.Task) and not child.done()), None)
+                if task is not None:
+                    continue
+            worker = self._worker_stack(waiter, frames)
+            stack += worker or [(f"<awaiting {type(waiter).__name__}>", "", 0)]
+            break
+        return self._from_root(stack)
+
+    def _worker_stack(self, future, frames) -> list:
+        # anyio's WorkerThread.run holds the future it will resolve in its locals
+        for thread_id, frame in frames.items():
+            if thread_id == self.loop_thread:
+                continue
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                if code.co_name == "run" and "anyio" in code.co_filename:
+                    if frame.f_locals.get("future") is future:
+                        return [_frame_key(f) for f in reversed(stack[-MAX_STACK_DEPTH:])]
+                    break
+                stack.append(frame)
+                frame = frame.f_back
+        return []
+
+    def _from_root(self, stack: list) -> list:
+        """Drop the server and outer middleware frames below the profiling middleware"""
+        root = _code_key(self.root_code)
+        for index, key in enumerate(stack):
+            if key == root:
+                return stack[index + 1:]
+        return stack
+
+
+def speedscope_profile(samples: list, name: str) -> dict:
+    """A speedscope "sampled" profile with weights in milliseconds"""
+    frame_index = {}
+    stacks = [[frame_index.setdefault(key, len(frame_index)) for key in stack] for stack, _ in samples]
+    weights = [round(weight * 1000, 3) for _, weight in samples]
+    return {
+        "$schema": "https://www.speedscope.app/file-format-schema.json",
+        "name": name,
+        "exporter": "request-profiler",
+        "activeProfileIndex": 0,
+        "shared": {
+            "frames": [
+                {"name": qualname, "file": filename, "line": line} if filename else {"name": qualname}
+                for qualname, filename, line in frame_index
+            ],
+        },
+        "profiles": [{
+            "type": "sampled",
+            "name": name,
+            "unit": "milliseconds",
+            "startValue": 0,
+            "endValue": round(sum(weights), 3),
+            "samples": stacks,
+            "weights": weights,
+        }],
+    }
+
+
+def collapsed_stacks(samples: list) -> str:
+    """Brendan Gregg's collapsed format (flamegraph.pl, speedscope), weighted in microseconds"""
+    totals = Counter()
+    for stack, weight in samples:
+        names = (
+            f"{qualname} ({os.path.basename(filename)}:{line})" if filename else qualname
+            for qualname, filename, line in stack
+        )
+        totals[";".join(name.replace(";", ":") for name in names)] += round(weight * 1_000_000)
+    return "".join(f"{stack} {micros}\n" for stack, micros in totals.items() if stack)
+
+
+def _slug(value: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", value).strip("_") or "root"
+
+
+class ProfilingMiddleware:
+    """
+    Pure ASGI middleware that profiles a random PROFILE_SAMPLE_RATE fraction of
+    requests, and any request carrying a matching X-Profile-Token header.
+
+    Each profiled request writes one file to ``output_dir`` named after the
+    service, route template and request ID (X-Request-ID, or a generated one),
+    and the response carries that ID in X-Profile-Id. At most ``max_concurrent``
+    requests are profiled at once; further candidates run unprofiled.
+    """
+
+    def __init__(
+        self,
+        app,
+        fastapi_app: FastAPI,
+        output_dir: str,
+        sample_rate: float = 0.0,
+        token: str = "",
+        interval: float = 0.005,
+        output_format: str = "speedscope",
+        max_concurrent: int = 2,
+        max_seconds: float = 60.0,
+    ):
+        if output_format not in PROFILE_FORMATS:
+            raise ValueError(f"Unknown profile format {output_format!r}, expected one of {PROFILE_FORMATS}")
+        self.app = app
+        self.fastapi_app = fastapi_app
+        self.service = _slug(fastapi_app.title.lower())
+        self.output_dir = output_dir
+        self.sample_rate = sample_rate
+        self.token = token.encode()
+        self.interval = interval
+        self.output_format = output_format
+        self.max_concurrent = max_concurrent
+        self.max_seconds = max_seconds
+        self._active = 0
+
+    def _requested(self, scope) -> bool:
+        if self.token:
+            for name, value in scope["headers"]:
+                if name == PROFILE_TOKEN_HEADER:
+                    return hmac.compare_digest(value, self.token)
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or self._active >= self.max_concurrent or not self._requested(scope):
+            await self.app(scope, receive, send)
+            return
+
+        request_id = next(
+            (value.decode("latin-1") for name, value in scope["headers"] if name == REQUEST_ID_HEADER), ""
+        )
+        request_id = _slug(request_id)[:64] if request_id else uuid.uuid4().hex[:16]
+
+        async def send_with_id(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [*message.get("headers", []), (b"x-profile-id", request_id.encode())]
+            await send(message)
+
+        self._active += 1
+        sampler = _Sampler(
+            asyncio.current_task(), asyncio.get_running_loop(), self.interval, self.max_seconds,
+            ProfilingMiddleware.__call__.__code__,
+        )
+        sampler.start()
+        try:
+            await self.app(scope, receive, send_with_id)
+        finally:
+            sampler.stop()
+            self._active -= 1
+            await run_in_threadpool(self._write, scope, request_id, sampler)
+
+    def _write(self, scope, request_id: str, sampler: _Sampler):
+        if not sampler.samples:
+            # Finished within one sampling interval
+            return
+        route = route_path(self.fastapi_app, scope)
+        name = f"{self.service} {scope['method']} {route} {request_id}"
+        stamp = time.strftime("%Y%m%dT%H%M%S", time.gmtime())
+        filename = f"{stamp}-{self.service}-{scope['method']}-{_slug(route)}-{request_id}"
+        os.makedirs(self.output_dir, exist_ok=True)
+        if self.output_format == "speedscope":
+            path = os.path.join(self.output_dir, filename + ".speedscope.json")
+            content = json.dumps(speedscope_profile(sampler.samples, name))
+        else:
+            path = os.path.join(self.output_dir, filename + ".collapsed.txt")
+            content = collapsed_stacks(sampler.samples)
+        # Write then rename so collectors never pick up a partial file
+        with open(path + ".tmp", "w", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(path + ".tmp", path)
+
+
+def enable_profiling(app: FastAPI):
+    """
+    Add ProfilingMiddleware to ``app`` when PROFILE_SAMPLE_RATE or PROFILE_TOKEN
+    is set. Otherwise nothing is installed, so requests pay nothing for it.
+    """
+    sample_rate = float(os.getenv("PROFILE_SAMPLE_RATE", "0"))
+    token = os.getenv("PROFILE_TOKEN", "")
+    if sample_rate <= 0 and not token:
+        return
+    app.add_middleware(
+        ProfilingMiddleware,
+        fastapi_app=app,
+        output_dir=os.getenv("PROFILE_DIR", "/tmp/profiles"),
+        sample_rate=sample_rate,
+        token=token,
+        interval=float(os.getenv("PROFILE_INTERVAL_MS", "5")) / 1000,
+        output_format=os.getenv("PROFILE_FORMAT", "speedscope"),
+        max_concurrent=int(os.getenv("PROFILE_MAX_CONCURRENT", "2")),
+        max_seconds=float(os.getenv("PROFILE_MAX_SECONDS", "60")),
+    )
@@ -0,0 +1,51 @@
+import os
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple, Type
+
+from fastapi import Response
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
+
+# Opt-in: encode ORM reads with orjson straight from the loaded attributes
+FAST_JSON_RESPONSES = os.getenv("FAST_JSON_RESPONSES", "false").lower() == "true"
+
+
+@lru_cache(maxsize=None)
+def _field_names(schema: Type[BaseModel]) -> Tuple[str, ...]:
+    return tuple(schema.model_fields)
+
+
+def trusted_payload(schema: Type[BaseModel], obj: Any, **overrides) -> Dict[str, Any]:
+    """
+    ``schema``'s fields read directly off ``obj`` without validation. Only for
+    objects loaded from our own tables, whose columns already have the
+    schema's types; values are left for orjson to encode (datetimes natively).
+    """
+    payload = {field: getattr(obj, field) for field in _field_names(schema)}
+    payload.update(overrides)
+    return payload
+
+
+def orm_response(
+    schema: Type[BaseModel],
+    obj: Any,
+    status_code: int = 200,
+    response: Optional[Response] = None,
+    **overrides,
+):
+    """
+    Return ``obj`` as ``schema`` from an endpoint declared with
+    ``response_model=schema``.
+
+    With FAST_JSON_RESPONSES enabled this builds an ORJSONResponse from
+    ``trusted_payload``, which FastAPI sends as is, skipping the response_model
+    validation and stdlib json encoding. Otherwise the object goes through the
+    usual response_model path. Headers set on the endpoint's injected
+    ``response`` are kept either way.
+    """
+    if FAST_JSON_RESPONSES:
+        headers = dict(response.headers) if response is not None else None
+        return ORJSONResponse(trusted_payload(schema, obj, **overrides), status_code=status_code, headers=headers)
+    if overrides:
+        return schema.model_validate(obj).model_copy(update=overrides)
+    return obj
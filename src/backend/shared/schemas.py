@@ -1,4 +1,6 @@
-from pydantic import BaseModel, EmailStr, Field, HttpUrl
+import json
+
+from pydantic import BaseModel, EmailStr, Field, HttpUrl, field_validator
 from typing import Optional, List, Dict, Any
 from datetime import datetime
 
@@ -129,6 +131,22 @@ class ResumeResponse(BaseModel):
     extracted_skills: Optional[List[str]]
     extracted_education: Optional[List[Dict[str, Any]]]
     extracted_experience: Optional[List[Dict[str, Any]]]
+    parsed_data: Optional[Dict[str, Any]] = None
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class ResumeSummary(BaseModel):
+    """Resume metadata for listings; parsed content is only returned by GET /api/resume/{id}"""
+    id: int
+    filename: str
+    file_size: int
+    file_type: str
+    is_primary: bool
+    processing_status: str
     created_at: datetime
     updated_at: datetime
 
@@ -136,6 +154,16 @@ class ResumeResponse(BaseModel):
         from_attributes = True
 
 
+class ResumeListResponse(BaseModel):
+    items: List[ResumeSummary]
+    next_cursor: Optional[str] = None
+
+
+class ResumeTextResponse(BaseModel):
+    id: int
+    raw_text: Optional[str] = None
+
+
 # LinkedIn Autofill Schemas
 class LinkedInProfileRequest(BaseModel):
     linkedin_url: str = Field(..., description="LinkedIn profile URL")
@@ -157,18 +185,123 @@ class LinkedInProfileData(BaseModel):
     profile_picture_url: Optional[str] = None
 
 
+class LinkedInBatchRequest(BaseModel):
+    linkedin_urls: List[str] = Field(..., min_length=1, description="LinkedIn profile URLs")
+
+
+class LinkedInBatchResult(BaseModel):
+    """One streamed result of a batch extraction: a distinct profile and every submitted URL for it"""
+    profile_id: Optional[str] = None
+    linkedin_urls: List[str]
+    profile: Optional[LinkedInProfileData] = None
+    elapsed_ms: float
+    error: Optional[str] = None
+
+
 class AutofillProfileRequest(BaseModel):
     linkedin_url: Optional[str] = None
     use_resume: bool = False
     resume_id: Optional[int] = None
 
 
+class AutofillSource(BaseModel):
+    source: str  # linkedin or resume
+    status: str  # ok, timeout or error
+    elapsed_ms: float
+    error: Optional[str] = None
+
+
 class AutofillProfileResponse(BaseModel):
     success: bool
     profile_data: Optional[UserProfileCreate] = None
     linkedin_data: Optional[LinkedInProfileData] = None
     resume_data: Optional[ParsedResumeData] = None
     message: str
+    sources: List[AutofillSource] = []
+
+
+# Company Schemas
+class CompanySearchResult(BaseModel):
+    id: int
+    name: str
+    employee_count: int
+
+
+def _split_list(value):
+    """CSV cells hold lists as JSON arrays or semicolon-separated text"""
+    if isinstance(value, str):
+        value = value.strip()
+        if not value:
+            return None
+        if value.startswith("["):
+            return json.loads(value)
+        return [item.strip() for item in value.split(";") if item.strip()]
+    return value
+
+
+class CompanyImportRow(BaseModel):
+    """One company in a bulk import file"""
+    linkedin_company_id: str = Field(..., min_length=1)
+    name: str = Field(..., min_length=1)
+    industry: Optional[str] = None
+    company_size: Optional[str] = None
+    headquarters: Optional[str] = None
+    description: Optional[str] = None
+    website: Optional[str] = None
+    specialties: Optional[List[str]] = None
+
+    _split_specialties = field_validator("specialties", mode="before")(_split_list)
+
+
+class CompanyEmployeeImportRow(BaseModel):
+    """One employee in a bulk import file, linked to its company by LinkedIn ID"""
+    linkedin_profile_id: str = Field(..., min_length=1)
+    linkedin_company_id: Optional[str] = None
+    name: str = Field(..., min_length=1)
+    headline: Optional[str] = None
+    position: Optional[str] = None
+    department: Optional[str] = None
+    profile_url: Optional[str] = None
+    skills: Optional[List[str]] = None
+    profile_data: Optional[Dict[str, Any]] = None
+
+    _split_skills = field_validator("skills", mode="before")(_split_list)
+
+    @field_validator("profile_data", mode="before")
+    @classmethod
+    def _parse_profile_data(cls, value):
+        if isinstance(value, str):
+            return json.loads(value) if value.strip() else None
+        return value
+
+
+# Recommendation Schemas
+class EmployeeCandidatesResponse(BaseModel):
+    count: int
+    employee_ids: List[int]
+
+
+class SimilarEmployee(BaseModel):
+    employee_id: int
+    similarity: float
+
+
+class RecommendationScore(BaseModel):
+    employee_id: int
+    total_score: float
+    industry_score: float
+    skill_score: float
+    experience_score: float
+    geographic_score: float
+    mutual_connections_score: float
+
+
+class CompanyRecommendations(BaseModel):
+    """One streamed result: a company's top-K recommendations for the current user"""
+    company_id: int
+    recommendations: List[RecommendationScore] = []
+    elapsed_ms: float
+    error: Optional[str] = None
 
 
 # Authentication Schemas
@@ -0,0 +1,417 @@
+import atexit
+import contextvars
+import json
+import multiprocessing.util
+import os
+import queue
+import re
+import secrets
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+import httpx
+from fastapi import FastAPI
+from prometheus_client import Counter
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from .metrics import route_path
+
+# OTLP span kinds
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+SPAN_KIND_CLIENT = 3
+
+# W3C Trace Context: version-traceid-parentid-flags
+TRACEPARENT_HEADER = b"traceparent"
+TRACEPARENT_PATTERN = re.compile(r"^00-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+INVALID_TRACE_ID = "0" * 32
+
+# Statements are exported without parameters, truncated to this length
+MAX_STATEMENT_LENGTH = 1000
+
+TRACE_SPANS = Counter(
+    "trace_spans_total",
+    "Finished trace spans by export outcome",
+    ["outcome"],
+)
+
+
+class Span:
+    """
+    A timed operation within a trace. Spans of unsampled traces are not
+    recording: they carry the trace ID for propagation and ignore everything else.
+    """
+
+    __slots__ = (
+        "trace_id", "span_id", "parent_id", "name", "kind", "recording",
+        "service", "start_ns", "end_ns", "attributes", "error",
+    )
+
+    def __init__(
+        self,
+        trace_id: str,
+        span_id: str,
+        parent_id: Optional[str] = None,
+        name: str = "",
+        kind: int = SPAN_KIND_INTERNAL,
+        recording: bool = True,
+        attributes: Optional[Dict] = None,
+        service: str = "",
+    ):
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.parent_id = parent_id
+        self.name = name
+        self.kind = kind
+        self.recording = recording
+        self.service = service
+        self.start_ns = time.time_ns() if recording else 0
+        self.end_ns = 0
+        self.attributes = attributes or {}
+        self.error = None
+
+    def set_attribute(self, key: str, value):
+        if self.recording:
+            self.attributes[key] = value
+
+    def record_error(self, error: BaseException):
+        if self.recording:
+            self.error = f"{type(error).__name__}: {error}"
+
+    def end(self):
+        if self.recording and not self.end_ns:
+            self.end_ns = time.time_ns()
+            if _exporter is not None:
+                _exporter.submit(self)
+
+    @property
+    def traceparent(self) -> str:
+        return f"00-{self.trace_id}-{self.span_id}-{'01' if self.recording else '00'}"
+
+
+# Outside a traced request everything is a no-op
+INVALID_SPAN = Span(INVALID_TRACE_ID, "0" * 16, recording=False)
+
+_current_span = contextvars.ContextVar("current_span", default=INVALID_SPAN)
+_exporter = None
+
+
+def current_span() -> Span:
+    return _current_span.get()
+
+
+def _new_span_id() -> str:
+    return secrets.token_hex(8)
+
+
+@contextmanager
+def start_span(name: str, kind: int = SPAN_KIND_INTERNAL, attributes: Optional[Dict] = None):
+    """
+    Time the enclosed block as a child of the current span. In unsampled
+    traces this yields the current (non-recording) span and costs a context
+    variable lookup.
+    """
+    parent = _current_span.get()
+    if not parent.recording:
+        yield parent
+        return
+    span = Span(parent.trace_id, _new_span_id(), parent.span_id, name, kind, attributes=attributes, service=parent.service)
+    token = _current_span.set(span)
+    try:
+        yield span
+    except BaseException as e:
+        span.record_error(e)
+        raise
+    finally:
+        _current_span.reset(token)
+        span.end()
+
+
+def inject_headers(headers: Optional[Dict[str, str]] = None) -> Dict[str, str]:
+    """``headers`` plus a traceparent for the current span, for outgoing requests"""
+    headers = dict(headers or {})
+    span = _current_span.get()
+    if span.trace_id != INVALID_TRACE_ID:
+        headers["traceparent"] = span.traceparent
+    return headers
+
+
+def otlp_payload(spans: list) -> dict:
+    """An OTLP/JSON ExportTraceServiceRequest for ``spans``, one resource per service"""
+
+    def value(v):
+        if isinstance(v, bool):
+            return {"boolValue": v}
+        if isinstance(v, int):
+            return {"intValue": str(v)}
+        if isinstance(v, float):
+            return {"doubleValue": v}
+        return {"stringValue": str(v)}
+
+    by_service = {}
+    for span in spans:
+        by_service.setdefault(span.service, []).append(span)
+
+    return {"resourceSpans": [{
+        "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": service}}]},
+        "scopeSpans": [{
+            "scope": {"name": "shared.tracing"},
+            "spans": [
+                {
+                    "traceId": span.trace_id,
+                    "spanId": span.span_id,
+                    **({"parentSpanId": span.parent_id} if span.parent_id else {}),
+                    "name": span.name,
+                    "kind": span.kind,
+                    "startTimeUnixNano": str(span.start_ns),
+                    "endTimeUnixNano": str(span.end_ns),
+                    "attributes": [{"key": k, "value": value(v)} for k, v in span.attributes.items()],
+                    "status": {"code": 2, "message": span.error} if span.error else {"code": 0},
+                }
+                for span in service_spans
+            ],
+        }],
+    } for service, service_spans in by_service.items()]}
+
+
+class SpanExporter(threading.Thread):
+    """
+    Batches finished spans on a background thread and writes them as OTLP/JSON,
+    one ExportTraceServiceRequest per line to ``file_path`` and/or POSTed to
+    ``{endpoint}/v1/traces``. A batch is exported as soon as ``batch_size``
+    spans are queued or ``interval`` seconds after its first span, whichever
+    comes first. Spans are dropped, never blocked on, when the queue is full
+    or the collector is unreachable.
+    """
+
+    def __init__(
+        self,
+        file_path: Optional[str] = None,
+        endpoint: Optional[str] = None,
+        batch_size: int = 512,
+        interval: float = 2.0,
+        max_queue: int = 10000,
+    ):
+        super().__init__(name="span-exporter", daemon=True)
+        self.config = dict(file_path=file_path, endpoint=endpoint, batch_size=batch_size, interval=interval, max_queue=max_queue)
+        self.file_path = file_path
+        self.endpoint = endpoint.rstrip("/") + "/v1/traces" if endpoint else None
+        self.batch_size = batch_size
+        self.interval = interval
+        self.queue = queue.Queue(max_queue)
+        self._stopping = threading.Event()
+        self._finalizer = None
+        self._pid = os.getpid()
+
+    def submit(self, span: Span):
+        if self._finalizer is None:
+            # Registered on first use: a multiprocessing child clears inherited finalizers after fork
+            self._finalizer = multiprocessing.util.Finalize(self, self.shutdown, exitpriority=10)
+        try:
+            self.queue.put_nowait(span)
+        except queue.Full:
+            TRACE_SPANS.labels("dropped").inc()
+
+    def run(self):
+        client = httpx.Client(timeout=5.0) if self.endpoint else None
+        try:
+            while not (self._stopping.is_set() and self.queue.empty()):
+                try:
+                    batch = [self.queue.get(timeout=0.1)]
+                except queue.Empty:
+                    continue
+                deadline = time.monotonic() + self.interval
+                while len(batch) < self.batch_size:
+                    try:
+                        timeout = 0.0 if self._stopping.is_set() else max(0.0, deadline - time.monotonic())
+                        batch.append(self.queue.get(timeout=timeout))
+                    except queue.Empty:
+                        break
+                self.export(batch, client)
+        finally:
+            if client is not None:
+                client.close()
+
+    def export(self, batch: list, client: Optional[httpx.Client] = None):
+        payload = otlp_payload(batch)
+        try:
+            if self.file_path:
+                with open(self.file_path, "a", encoding="utf-8") as f:
+                    f.write(json.dumps(payload) + "\n")
+            if client is not None:
+                client.post(self.endpoint, json=payload).raise_for_status()
+        except (OSError, httpx.HTTPError):
+            TRACE_SPANS.labels("failed").inc(len(batch))
+            return
+        TRACE_SPANS.labels("exported").inc(len(batch))
+
+    def shutdown(self):
+        """Export what is queued, then stop. Safe to call more than once"""
+        if os.getpid() != self._pid:
+            # A forked child's copy of the parent's queue; the parent exports it
+            return
+        self._stopping.set()
+        if self.is_alive():
+            self.join(timeout=self.interval + 5)
+        elif not self.queue.empty():
+            # Never started: export from the caller
+            self.run()
+
+
+def _start_exporter(**config) -> SpanExporter:
+    """
+    Start the process-wide exporter. Its queue is flushed at interpreter exit
+    and when a multiprocessing worker exits (which skips atexit), so scripts
+    and pool workers that never see a FastAPI shutdown event keep their spans.
+    """
+    global _exporter
+    _exporter = SpanExporter(**config)
+    _exporter.start()
+    atexit.register(_exporter.shutdown)
+    return _exporter
+
+
+def _restart_exporter_after_fork():
+    # The exporter thread does not survive fork; give the child its own
+    if _exporter is not None:
+        _start_exporter(**_exporter.config)
+
+
+os.register_at_fork(after_in_child=_restart_exporter_after_fork)
+
+
+def _sampled(trace_id: str, rate: float) -> bool:
+    # Decided from the trace ID so every service makes the same choice for a trace
+    return int(trace_id[16:], 16) < rate * 2 ** 64
+
+
+class TracingMiddleware:
+    """
+    Pure ASGI middleware that starts a server span per request. An incoming
+    ``traceparent`` header continues the caller's trace and its sampled flag
+    is followed; otherwise a new trace is sampled at ``sample_rate``. Every
+    response carries X-Trace-Id, sampled or not.
+    """
+
+    def __init__(self, app, fastapi_app: FastAPI, service: str, sample_rate: float):
+        self.app = app
+        self.fastapi_app = fastapi_app
+        self.service = service
+        self.sample_rate = sample_rate
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        parent = None
+        for name, value in scope["headers"]:
+            if name == TRACEPARENT_HEADER:
+                parent = TRACEPARENT_PATTERN.match(value.decode("latin-1").strip().lower())
+                break
+        if parent and parent.group(1) != INVALID_TRACE_ID:
+            trace_id, parent_id, sampled = parent.group(1), parent.group(2), int(parent.group(3), 16) & 1
+        else:
+            trace_id = secrets.token_hex(16)
+            parent_id, sampled = None, _sampled(trace_id, self.sample_rate)
+        span = Span(trace_id, _new_span_id(), parent_id, kind=SPAN_KIND_SERVER, recording=bool(sampled), service=self.service)
+        token = _current_span.set(span)
+
+        status_code = 500
+
+        async def send_with_trace(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                message["headers"] = [*message.get("headers", []), (b"x-trace-id", trace_id.encode())]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_trace)
+        except BaseException as e:
+            span.record_error(e)
+            raise
+        finally:
+            _current_span.reset(token)
+            if span.recording:
+                route = route_path(self.fastapi_app, scope)
+                span.name = f"{scope['method']} {route}"
+                span.attributes.update({
+                    "http.request.method": scope["method"],
+                    "http.route": route,
+                    "http.response.status_code": status_code,
+                })
+                if status_code >= 500 and not span.error:
+                    span.error = f"HTTP {status_code}"
+                span.end()
+
+
+_traced_engines = set()
+
+
+def trace_engine(engine: Engine):
+    """Record every statement executed through ``engine`` as a client span of the current span"""
+    if id(engine) in _traced_engines:
+        return
+    _traced_engines.add(id(engine))
+    system = engine.dialect.name
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        parent = _current_span.get()
+        if not parent.recording:
+            return
+        operation = statement.lstrip()[:6].upper()
+        conn.info.setdefault("trace_spans", []).append(Span(
+            parent.trace_id, _new_span_id(), parent.span_id, f"{system} {operation}", SPAN_KIND_CLIENT,
+            attributes={"db.system": system, "db.statement": statement[:MAX_STATEMENT_LENGTH]}, service=parent.service,
+        ))
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        if _current_span.get().recording:
+            span = conn.info["trace_spans"].pop()
+            if cursor.rowcount >= 0:
+                span.set_attribute("db.rowcount", cursor.rowcount)
+            span.end()
+
+    @event.listens_for(engine, "handle_error")
+    def _error(context):
+        spans = context.connection.info.get("trace_spans") if context.connection is not None else None
+        if spans and _current_span.get().recording:
+            span = spans.pop()
+            span.record_error(context.original_exception)
+            span.end()
+
+
+def enable_tracing(app: FastAPI, engine: Engine):
+    """
+    Add request, database and (through start_span) S3 and parser tracing to
+    ``app`` when TRACE_EXPORT_FILE or TRACE_OTLP_ENDPOINT is set; otherwise
+    nothing is installed.
+    """
+    file_path = os.getenv("TRACE_EXPORT_FILE") or None
+    endpoint = os.getenv("TRACE_OTLP_ENDPOINT") or None
+    if not file_path and not endpoint:
+        return
+    if _exporter is None:
+        _start_exporter(
+            file_path=file_path,
+            endpoint=endpoint,
+            batch_size=int(os.getenv("TRACE_EXPORT_BATCH_SIZE", "512")),
+            interval=float(os.getenv("TRACE_EXPORT_INTERVAL_SECONDS", "2")),
+        )
+    app.add_middleware(
+        TracingMiddleware,
+        fastapi_app=app,
+        service=os.getenv("TRACE_SERVICE_NAME") or re.sub(r"\W+", "-", app.title.lower()),
+        sample_rate=float(os.getenv("TRACE_SAMPLE_RATE", "0.01")),
+    )
+    trace_engine(engine)
+
+    @app.on_event("shutdown")
+    def flush_spans():
+        _exporter.shutdown()
@@ -0,0 +1,39 @@
+from typing import Any, Dict, List, Sequence
+
+from sqlalchemy.orm import Session
+
+
+def upsert_rows(
+    db: Session,
+    model,
+    rows: List[Dict[str, Any]],
+    conflict_columns: Sequence[str],
+    update_columns: Sequence[str],
+) -> int:
+    """
+    Insert ``rows`` into ``model``'s table with a single compiled statement, updating
+    ``update_columns`` where a row already exists for ``conflict_columns``
+    (which must be covered by a unique constraint).
+
+    Uses INSERT ... ON CONFLICT DO UPDATE on PostgreSQL and SQLite. The
+    statement is compiled once and executed for all rows as an executemany,
+    which SQLAlchemy batches into multi-row VALUES on the wire.
+    """
+    if not rows:
+        return 0
+
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert
+    else:
+        raise NotImplementedError(f"Bulk upsert is not supported for {dialect}")
+
+    statement = insert(model.__table__)
+    statement = statement.on_conflict_do_update(
+        index_elements=list(conflict_columns),
+        set_={column: statement.excluded[column] for column in update_columns},
+    )
+    db.execute(statement, rows)
+    return len(rows)
@@ -0,0 +1,129 @@
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.backend.shared.change_feed import ChangeFeed
+from src.backend.shared.models import Company, CompanyEmployee
+
+T0 = datetime(2024, 1, 1, 12, 0, 0)
+
+
+class Recorder:
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, upserted, deleted):
+        self.calls.append(({row["id"]: row for row in upserted}, sorted(deleted)))
+
+
+@pytest.fixture
+def company(db):
+    company = Company(name="Acme")
+    db.add(company)
+    db.commit()
+    return company
+
+
+def add_employee(db, company, name, updated_at, skills=None):
+    employee = CompanyEmployee(company_id=company.id, name=name, skills=skills, created_at=updated_at,
+                               updated_at=updated_at)
+    db.add(employee)
+    db.commit()
+    return employee
+
+
+def make_feed(recorder, reconcile_interval=3600.0):
+    return ChangeFeed(CompanyEmployee, ("company_id", "skills"), [recorder], overlap=10.0,
+                      reconcile_interval=reconcile_interval)
+
+
+def test_prime_skips_existing_rows(db, company):
+    add_employee(db, company, "a", T0, ["python"])
+    recorder = Recorder()
+    feed = make_feed(recorder)
+    feed.prime(db)
+
+    assert feed.poll(db) == (0, 0)
+    assert recorder.calls == []
+
+
+def test_inserts_and_updates_are_applied_once(db, company):
+    employee = add_employee(db, company, "a", T0, ["python"])
+    recorder = Recorder()
+    feed = make_feed(recorder)
+    feed.prime(db)
+
+    inserted = add_employee(db, company, "b", T0 + timedelta(seconds=5), ["sql"])
+    employee.skills = ["python", "go"]
+    employee.updated_at = T0 + timedelta(seconds=6)
+    db.commit()
+
+    assert feed.poll(db) == (2, 0)
+    upserted, deleted = recorder.calls[0]
+    assert upserted[inserted.id] == {"id": inserted.id, "company_id": company.id, "skills": ["sql"]}
+    assert upserted[employee.id]["skills"] == ["python", "go"]
+    assert deleted == []
+
+    # Rows re-read inside the overlap window are not applied again
+    assert feed.poll(db) == (0, 0)
+    assert len(recorder.calls) == 1
+
+
+def test_late_commit_behind_the_watermark_is_seen(db, company):
+    add_employee(db, company, "a", T0)
+    recorder = Recorder()
+    feed = make_feed(recorder)
+    feed.prime(db)
+    add_employee(db, company, "b", T0 + timedelta(seconds=30))
+    feed.poll(db)
+
+    # Stamped before the newest row seen, but within the overlap
+    late = add_employee(db, company, "late", T0 + timedelta(seconds=25))
+
+    assert feed.poll(db) == (1, 0)
+    assert list(recorder.calls[-1][0]) == [late.id]
+
+
+def test_deletes_and_old_timestamped_inserts_are_found_by_reconciliation(db, company):
+    doomed = add_employee(db, company, "doomed", T0)
+    add_employee(db, company, "kept", T0)
+    recorder = Recorder()
+    feed = make_feed(recorder, reconcile_interval=0.0)
+    feed.prime(db)
+
+    db.delete(doomed)
+    db.commit()
+    # Seed-style historical timestamp, far behind the watermark
+    backdated = add_employee(db, company, "backdated", T0 - timedelta(days=365), ["cobol"])
+
+    assert feed.poll(db) == (1, 1)
+    upserted, deleted = recorder.calls[0]
+    assert list(upserted) == [backdated.id]
+    assert upserted[backdated.id]["skills"] == ["cobol"]
+    assert deleted == [doomed.id]
+
+    assert feed.poll(db) == (0, 0)
+
+
+def test_deletes_wait_for_reconciliation(db, company):
+    doomed = add_employee(db, company, "doomed", T0)
+    recorder = Recorder()
+    feed = make_feed(recorder, reconcile_interval=3600.0)
+    feed.prime(db)
+    db.delete(doomed)
+    db.commit()
+
+    assert feed.poll(db) == (0, 0)
+    feed._next_reconcile = 0.0
+    assert feed.poll(db) == (0, 1)
+
+
+def test_empty_table_then_first_insert(db, company):
+    recorder = Recorder()
+    feed = make_feed(recorder)
+    feed.prime(db)
+
+    first = add_employee(db, company, "first", T0)
+
+    assert feed.poll(db) == (1, 0)
+    assert list(recorder.calls[0][0]) == [first.id]
@@ -0,0 +1,98 @@
+import pytest
+
+from src.backend.services.company_service.company_autocomplete import (
+    CompanyAutocomplete,
+    load_employee_counts,
+    normalize_name,
+    prefix_keys,
+)
+from src.backend.shared.models import Company, CompanyEmployee
+
+COMPANIES = [
+    (1, "Acme Corporation"),
+    (2, "Acme Labs"),
+    (3, "Globex"),
+    (4, "Société Générale"),
+    (5, "Initech"),
+    (6, "The Acme Group"),
+]
+COUNTS = {1: 50, 2: 500, 3: 10, 4: 5, 5: 1, 6: 100}
+
+
+@pytest.fixture
+def autocomplete():
+    autocomplete = CompanyAutocomplete()
+    autocomplete.bulk_load(COMPANIES, employee_counts=COUNTS)
+    return autocomplete
+
+
+def names(results) -> list:
+    return [result["name"] for result in results]
+
+
+def test_normalization_and_prefix_keys():
+    assert normalize_name("  Société-Générale, S.A. ") == "societe generale s a"
+    assert prefix_keys("the acme group") == ["the acme group", "acme group", "group"]
+
+
+def test_word_prefix_matches_rank_by_employee_count(autocomplete):
+    assert names(autocomplete.search("acme")) == ["Acme Labs", "The Acme Group", "Acme Corporation"]
+    assert names(autocomplete.search("societe")) == ["Société Générale"]
+    assert autocomplete.search("glo")[0] == {"id": 3, "name": "Globex", "employee_count": 10}
+    assert autocomplete.search("") == []
+    assert names(autocomplete.search("acme", limit=1)) == ["Acme Labs"]
+
+
+def test_infix_and_typo_matches_follow_prefix_matches(autocomplete):
+    assert names(autocomplete.search("lobex")) == ["Globex"]
+    assert names(autocomplete.search("initek")) == ["Initech"]
+    assert autocomplete.search("zzzz") == []
+
+
+def test_add_rename_and_remove_invalidate_results(autocomplete):
+    assert names(autocomplete.search("acme")) == ["Acme Labs", "The Acme Group", "Acme Corporation"]
+
+    autocomplete.add(2, "Umbrella Labs")
+    autocomplete.add(7, "Acme Rockets")
+    autocomplete.remove(6)
+
+    assert names(autocomplete.search("acme")) == ["Acme Corporation", "Acme Rockets"]
+    assert names(autocomplete.search("umbrella")) == ["Umbrella Labs"]
+    assert autocomplete.search("group") == []
+    assert len(autocomplete) == 6
+
+
+def test_apply_changes(autocomplete):
+    autocomplete.apply_changes([{"id": 3, "name": "Globex International"}, {"id": 8, "name": "Hooli"}], [5])
+
+    assert names(autocomplete.search("international")) == ["Globex International"]
+    assert names(autocomplete.search("hooli")) == ["Hooli"]
+    assert autocomplete.search("initech") == []
+
+
+def test_wide_prefixes_match_an_unbounded_scan():
+    companies = [(company_id, f"A{chr(97 + company_id % 26)} Company {company_id}") for company_id in range(1, 400)]
+    counts = {company_id: (company_id * 37) % 101 for company_id, _ in companies}
+    narrow = CompanyAutocomplete(scan_limit=10)
+    exhaustive = CompanyAutocomplete(scan_limit=10 ** 6)
+    for autocomplete in (narrow, exhaustive):
+        autocomplete.bulk_load(companies, employee_counts=counts)
+
+    for query in ("a", "ab", "company", "c"):
+        assert narrow.search(query, limit=50) == exhaustive.search(query, limit=50)
+
+
+def test_build_from_db_counts_employees(db):
+    acme, globex = Company(name="Acme"), Company(name="Globex")
+    db.add_all([acme, globex])
+    db.flush()
+    db.add_all(CompanyEmployee(company_id=acme.id, name=f"e{i}") for i in range(3))
+    db.add(CompanyEmployee(company_id=None, name="unemployed"))
+    db.commit()
+
+    autocomplete = CompanyAutocomplete()
+    autocomplete.build_from_db(db)
+
+    assert load_employee_counts(db) == {acme.id: 3}
+    assert autocomplete.search("a") == [{"id": acme.id, "name": "Acme", "employee_count": 3}]
+    assert autocomplete.search("glob")[0]["employee_count"] == 0
@@ -0,0 +1,88 @@
+import numpy as np
+import pytest
+
+from src.backend.services.recommendation_service.employee_index import EmployeeIndex, employee_terms, title_tokens
+
+EMPLOYEES = [
+    # (id, company_id, skills, position, headline, department)
+    (1, 10, ["Python", "SQL"], "Sr. Software Eng", None, "Engineering"),
+    (2, 10, ["java"], "Engineering Manager", None, "Engineering"),
+    (3, 20, ["python", "Machine  Learning"], "Data Scientist", "ML at Globex", "Data"),
+    (4, 20, [], "VP of Sales", None, "Sales"),
+    (5, 30, ["sql"], None, "Senior Analyst", None),
+]
+
+
+@pytest.fixture
+def index():
+    index = EmployeeIndex()
+    index.bulk_load(EMPLOYEES)
+    return index
+
+
+def ids(array) -> list:
+    return np.asarray(array).tolist()
+
+
+def test_terms_are_normalized():
+    assert title_tokens("Sr. Software Eng") == ("senior", "software", "engineer")
+    assert title_tokens("VP of Sales") == ("vice-president", "sales")
+    assert employee_terms(7, ["Machine  Learning", " ", None], "Dev", None, " Data ") == [
+        "company:7", "dept:data", "skill:machine learning", "title:developer",
+    ]
+
+
+def test_retrieve_any_and_all(index):
+    assert ids(index.retrieve(skills=["python", "SQL"])) == [1, 3, 5]
+    assert ids(index.retrieve(skills=["python", "SQL"], match="all")) == [1]
+    assert ids(index.retrieve(skills=["java"], title="Senior Engineer")) == [1, 2, 5]
+    assert ids(index.retrieve(title="senior engineer", match="all")) == [1]
+    assert ids(index.retrieve(departments=["engineering"])) == [1, 2]
+    assert ids(index.retrieve(skills=["cobol"])) == []
+    assert ids(index.retrieve(skills=["cobol", "python"], match="all")) == []
+
+
+def test_retrieve_restricted_to_company(index):
+    assert ids(index.retrieve(skills=["python"], company_id=10)) == [1]
+    assert ids(index.retrieve(skills=["python", "java"], company_id=10, match="all")) == []
+    assert ids(index.retrieve(company_id=20)) == [3, 4]
+    assert ids(index.retrieve()) == []
+
+
+def test_unknown_match_mode(index):
+    with pytest.raises(ValueError):
+        index.retrieve(skills=["python"], match="most")
+
+
+def test_add_replaces_previous_terms(index):
+    index.add(1, company_id=20, skills=["rust"], position="Engineer", headline=None, department=None)
+
+    assert ids(index.retrieve(skills=["python"])) == [3]
+    assert ids(index.retrieve(skills=["rust"])) == [1]
+    assert ids(index.retrieve(company_id=10)) == [2]
+    assert ids(index.retrieve(company_id=20)) == [1, 3, 4]
+    assert len(index) == len(EMPLOYEES)
+
+
+def test_apply_changes(index):
+    index.apply_changes(
+        [{"id": 6, "company_id": 30, "skills": ["python"], "position": "Engineer"},
+         {"id": 5, "company_id": 30, "skills": ["excel"]}],
+        [3, 404],
+    )
+
+    assert ids(index.retrieve(skills=["python"])) == [1, 6]
+    assert ids(index.retrieve(skills=["sql"])) == [1]
+    assert ids(index.retrieve(company_id=30)) == [5, 6]
+    assert 3 not in index and 6 in index
+
+
+def test_incremental_matches_bulk_load(index):
+    incremental = EmployeeIndex()
+    for employee_id, company_id, skills, position, headline, department in EMPLOYEES:
+        incremental.add(employee_id, company_id=company_id, skills=skills, position=position,
+                        headline=headline, department=department)
+
+    for term in ("skill:python", "skill:sql", "title:engineer", "dept:engineering", "company:20"):
+        assert ids(incremental.postings(term)) == ids(index.postings(term))
+    assert incremental.stats()["postings"] == index.stats()["postings"]
@@ -0,0 +1,107 @@
+import numpy as np
+import pytest
+
+from src.backend.services.recommendation_service import feature_store
+from src.backend.services.recommendation_service.feature_store import FeatureStore, build_snapshot, context_versions
+from src.backend.services.recommendation_service.gazetteer import DEFAULT_DATA_DIR
+from src.backend.services.recommendation_service.industry_matrix import DEFAULT_INDUSTRIES_PATH
+from src.backend.services.recommendation_service.scoring import (
+    CompanyScorer,
+    ScoringContext,
+    company_employee_features,
+    user_profile_features,
+)
+from src.backend.services.recommendation_service.skill_embeddings import SkillEmbeddings
+from src.backend.shared.models import Company, CompanyEmployee
+
+EMPLOYEES = [
+    # (company, name, position, skills, location)
+    ("Acme", "a", "Senior Engineer", ["python", "sql", "aws"], "San Francisco, CA"),
+    ("Acme", "b", "Engineering Manager", ["java", "kubernetes"], "Austin, TX"),
+    ("Acme", "c", "Intern", [], None),
+    ("Globex", "d", "Data Scientist", ["python", "machine learning", "statistics", "sql"], "Berlin, Germany"),
+    ("Globex", "e", "Director of Sales", ["negotiation"], "Fresno, CA"),
+]
+
+
+@pytest.fixture(scope="module")
+def context():
+    return ScoringContext.load(DEFAULT_INDUSTRIES_PATH, DEFAULT_DATA_DIR, "/nonexistent/skill_embeddings.npz")
+
+
+@pytest.fixture
+def companies(db):
+    companies = {name: Company(name=name, industry="Software") for name in ("Acme", "Globex")}
+    db.add_all(companies.values())
+    db.flush()
+    for company, name, position, skills, location in EMPLOYEES:
+        db.add(CompanyEmployee(
+            company_id=companies[company].id, name=name, position=position, skills=skills,
+            profile_data={"location": location, "experience_years": 5},
+        ))
+    db.commit()
+    return companies
+
+
+def test_snapshot_scores_like_the_database(db, companies, context, tmp_path, monkeypatch):
+    # Several flushes of the streamed skill postings
+    monkeypatch.setattr(feature_store, "SKILL_CHUNK_SIZE", 2)
+    version = build_snapshot(db, tmp_path, context)
+    snapshot = FeatureStore(tmp_path).current
+
+    assert snapshot.version == version == 1
+    assert len(snapshot) == len(EMPLOYEES)
+    assert snapshot.skill_indices.size == sum(len(skills) for *_, skills, _ in EMPLOYEES)
+    assert not list(snapshot.path.glob("*.raw"))
+
+    users = user_profile_features([
+        (1, "Software", "San Francisco, CA", 6, "Staff Engineer", ["python", "sql"]),
+        (2, "Software", "Berlin, Germany", 2, "Analyst", ["statistics"]),
+    ], context)
+    for company in companies.values():
+        from_snapshot = list(snapshot.company_scorer(company.id, context).top_matches(users))
+        from_db = list(CompanyScorer(company_employee_features(db, company.id, context), context).top_matches(users))
+        key = lambda match: (match["user_id"], match["employee_id"])
+        assert sorted(from_snapshot, key=key) == pytest.approx(sorted(from_db, key=key))
+
+
+def test_rows_for_and_missing_companies(db, companies, context, tmp_path):
+    build_snapshot(db, tmp_path, context)
+    snapshot = FeatureStore(tmp_path).current
+    employee_ids = [employee_id for (employee_id,) in db.query(CompanyEmployee.id).order_by(CompanyEmployee.id)]
+
+    rows = snapshot.rows_for(np.array(employee_ids + [10 ** 6]))
+
+    assert snapshot.employee_ids[rows[:-1]].tolist() == employee_ids
+    assert rows[-1] == -1
+    assert len(snapshot.company_features(10 ** 6).ids) == 0
+
+
+def test_manifest_records_the_scoring_tables(db, companies, context, tmp_path):
+    build_snapshot(db, tmp_path, context)
+    snapshot = FeatureStore(tmp_path).current
+
+    assert context_versions(context).items() <= snapshot.manifest.items()
+    assert snapshot.matches(context)
+    other_embeddings = ScoringContext(context.industries, context.gazetteer, SkillEmbeddings.build(["python"]))
+    assert not snapshot.matches(other_embeddings)
+    narrower = ScoringContext(context.industries, context.gazetteer, SkillEmbeddings.build([], dimensions=32))
+    assert not snapshot.matches(narrower)
+
+
+def test_publish_swaps_versions_and_keeps_the_newest(db, companies, context, tmp_path):
+    store = FeatureStore(tmp_path, check_interval=0)
+    build_snapshot(db, tmp_path, context, keep=2)
+    first = store.current
+
+    db.add(CompanyEmployee(company_id=companies["Acme"].id, name="f", position="Engineer", skills=["go"]))
+    db.commit()
+    build_snapshot(db, tmp_path, context, keep=2)
+    build_snapshot(db, tmp_path, context, keep=2)
+
+    assert first.version == 1
+    # The old snapshot stays readable while referenced
+    assert len(first) == len(EMPLOYEES)
+    assert store.current.version == 3
+    assert len(store.current) == len(EMPLOYEES) + 1
+    assert sorted(path.name for path in tmp_path.glob("v*")) == ["v000002", "v000003"]
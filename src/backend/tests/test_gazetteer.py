@@ -0,0 +1,92 @@
+import numpy as np
+import pytest
+
+from src.backend.services.recommendation_service.gazetteer import (
+    CITY,
+    COUNTRY,
+    DEFAULT_DATA_DIR,
+    REGION,
+    UNKNOWN_LOCATION,
+    Gazetteer,
+)
+
+
+@pytest.fixture(scope="module")
+def gazetteer():
+    return Gazetteer()
+
+
+def resolved(gazetteer, location):
+    location_id = gazetteer.resolve(location)
+    return gazetteer.names[location_id], gazetteer.country_code(location_id)
+
+
+@pytest.mark.parametrize("location, expected", [
+    ("San Francisco, CA", ("San Francisco", "US")),
+    ("Austin, TX", ("Austin", "US")),
+    ("Portland, OR", ("Portland", "US")),
+    ("Toronto, ON", ("Toronto", "CA")),
+    ("Berlin, DE", ("Berlin", "DE")),
+    ("Ottawa, ON, CA", ("Ottawa", "CA")),
+])
+def test_city_with_region_or_country_code(gazetteer, location, expected):
+    assert resolved(gazetteer, location) == expected
+
+
+@pytest.mark.parametrize("location, region", [
+    # Cities outside the gazetteer resolve to their state, never to the country sharing its code
+    ("Fresno, CA", "California"),
+    ("Naperville, IL", "Illinois"),
+    ("Wilmington, DE", "Delaware"),
+    ("Bentonville, AR", "Arkansas"),
+    ("Savannah, GA", "Georgia"),
+    ("Portland, Maine", "Maine"),
+])
+def test_unknown_city_resolves_to_its_state(gazetteer, location, region):
+    location_id = gazetteer.resolve(location)
+    assert gazetteer.kinds[location_id] == REGION
+    assert resolved(gazetteer, location) == (region, "US")
+
+
+@pytest.mark.parametrize("location, expected, kind", [
+    ("San Francisco Bay Area", ("San Francisco", "US"), CITY),
+    ("San Francisco Bay Area, CA", ("San Francisco", "US"), CITY),
+    ("Greater Seattle Area", ("Seattle", "US"), CITY),
+    ("California, US", ("California", "US"), REGION),
+    ("Kassel, Germany", ("Germany", "DE"), COUNTRY),
+    ("Germany", ("Germany", "DE"), COUNTRY),
+])
+def test_aliases_noise_words_and_fallbacks(gazetteer, location, expected, kind):
+    assert resolved(gazetteer, location) == expected
+    assert gazetteer.kinds[gazetteer.resolve(location)] == kind
+
+
+@pytest.mark.parametrize("location", [None, "", "Remote", "Atlantis"])
+def test_unresolvable_locations_are_unknown(gazetteer, location):
+    assert gazetteer.resolve(location) == UNKNOWN_LOCATION
+
+
+def test_location_scores(gazetteer):
+    san_francisco = gazetteer.resolve("San Francisco, CA")
+    employees = gazetteer.resolve_many([
+        "San Francisco, CA", "Oakland, CA", "Austin, TX", "Berlin, Germany", None,
+    ])
+
+    scores = gazetteer.location_scores(san_francisco, employees)
+
+    assert scores.tolist() == pytest.approx([1.0, 0.9, 0.7, 0.3, 0.5])
+    assert np.all(gazetteer.location_scores(UNKNOWN_LOCATION, employees) == 0.5)
+
+
+def test_version_identifies_data_files(gazetteer, tmp_path):
+    assert gazetteer.version == Gazetteer().version
+    for name in ("countries.csv", "regions.csv", "locations.csv"):
+        (tmp_path / name).write_text((DEFAULT_DATA_DIR / name).read_text())
+    with open(tmp_path / "locations.csv", "a") as f:
+        f.write("Fresno,CA,US,36.7378,-119.7871,\n")
+
+    extended = Gazetteer(tmp_path)
+
+    assert extended.version != gazetteer.version
+    assert extended.names[extended.resolve("Fresno, CA")] == "Fresno"
+
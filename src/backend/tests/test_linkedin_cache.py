@@ -0,0 +1,162 @@
+import asyncio
+
+import pytest
+
+from src.backend.services.profile_service import linkedin_cache
+from src.backend.services.profile_service.linkedin_cache import LinkedInProfileCache
+from src.backend.shared.schemas import LinkedInProfileData
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(linkedin_cache.time, "monotonic", clock)
+    return clock
+
+
+class Upstream:
+    """Fetch function counting calls; each call waits for ``release`` when gated"""
+
+    def __init__(self, gated=False):
+        self.calls = []
+        self.release = asyncio.Event()
+        if not gated:
+            self.release.set()
+        self.error = None
+
+    async def __call__(self, profile_id):
+        self.calls.append(profile_id)
+        await self.release.wait()
+        if self.error is not None:
+            raise self.error
+        return LinkedInProfileData(first_name="Ada", last_name=f"v{len(self.calls)}", linkedin_profile_id=profile_id)
+
+
+async def settle():
+    """Let started tasks and their done callbacks run"""
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_fresh_entries_are_served_from_the_cache(clock):
+    upstream = Upstream()
+    cache = LinkedInProfileCache(upstream, ttl=60, stale_ttl=600)
+    first = await cache.get("Ada-Lovelace")
+    clock.now += 59
+    again = await cache.get(" ada-lovelace ")
+    assert upstream.calls == ["ada-lovelace"]
+    assert again == first
+    # Callers get copies, so mutating one cannot corrupt the cache
+    again.headline = "changed"
+    assert (await cache.get("ada-lovelace")).headline is None
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_share_one_fetch(clock):
+    upstream = Upstream(gated=True)
+    cache = LinkedInProfileCache(upstream)
+    waiters = [asyncio.create_task(cache.get("ada")) for _ in range(5)]
+    await settle()
+    upstream.release.set()
+    results = await asyncio.gather(*waiters)
+    assert upstream.calls == ["ada"]
+    assert {result.last_name for result in results} == {"v1"}
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_the_shared_fetch(clock):
+    upstream = Upstream(gated=True)
+    cache = LinkedInProfileCache(upstream)
+    cancelled = asyncio.create_task(cache.get("ada"))
+    waiting = asyncio.create_task(cache.get("ada"))
+    await settle()
+    cancelled.cancel()
+    upstream.release.set()
+    assert (await waiting).last_name == "v1"
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+    assert len(cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_stale_entries_are_served_while_one_refresh_runs(clock):
+    upstream = Upstream()
+    cache = LinkedInProfileCache(upstream, ttl=60, stale_ttl=600)
+    await cache.get("ada")
+
+    upstream.release.clear()
+    clock.now += 61
+    stale = []
+    for _ in range(3):
+        stale.append(await cache.get("ada"))
+        await settle()
+    assert {profile.last_name for profile in stale} == {"v1"}
+    assert upstream.calls == ["ada", "ada"]
+
+    upstream.release.set()
+    await settle()
+    assert (await cache.get("ada")).last_name == "v2"
+    assert len(upstream.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_expired_entries_are_fetched(clock):
+    upstream = Upstream()
+    cache = LinkedInProfileCache(upstream, ttl=60, stale_ttl=600)
+    await cache.get("ada")
+    clock.now += 661
+    assert (await cache.get("ada")).last_name == "v2"
+
+
+@pytest.mark.asyncio
+async def test_failures_are_not_cached(clock):
+    upstream = Upstream()
+    upstream.error = RuntimeError("upstream down")
+    cache = LinkedInProfileCache(upstream)
+    with pytest.raises(RuntimeError):
+        await cache.get("ada")
+    assert len(cache) == 0
+
+    upstream.error = None
+    assert (await cache.get("ada")).last_name == "v2"
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_the_stale_entry(clock):
+    upstream = Upstream()
+    cache = LinkedInProfileCache(upstream, ttl=60, stale_ttl=600)
+    await cache.get("ada")
+
+    upstream.error = RuntimeError("upstream down")
+    clock.now += 61
+    assert (await cache.get("ada")).last_name == "v1"
+    await settle()
+    assert len(upstream.calls) == 2
+    # Each stale read after a failed refresh tries again
+    assert (await cache.get("ada")).last_name == "v1"
+    await settle()
+    assert len(upstream.calls) == 3
+    await cache.aclose()
+
+
+@pytest.mark.asyncio
+async def test_evicts_least_recently_used(clock):
+    upstream = Upstream()
+    cache = LinkedInProfileCache(upstream, max_entries=2)
+    await cache.get("a")
+    await cache.get("b")
+    await cache.get("a")
+    await cache.get("c")
+    assert len(cache) == 2
+    await cache.get("a")
+    await cache.get("b")
+    assert upstream.calls == ["a", "b", "c", "b"]
@@ -0,0 +1,192 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
+import httpx
+import pytest
+
+from src.backend.services.profile_service import linkedin_client
+from src.backend.services.profile_service.linkedin_client import (
+    LinkedInAPIError,
+    LinkedInClient,
+    TokenBucket,
+    retry_after_seconds,
+)
+
+BASE_URL = "https://api.example.com"
+
+
+class FakeClock:
+    """time.monotonic and asyncio.sleep for the client module; sleeping advances the clock"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+        self._sleep = asyncio.sleep
+
+    def monotonic(self):
+        return self.now
+
+    async def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        self.now += seconds
+        await self._sleep(0)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(linkedin_client.time, "monotonic", clock.monotonic)
+    monkeypatch.setattr(linkedin_client.asyncio, "sleep", clock.sleep)
+    return clock
+
+
+def make_client(handler, **kwargs):
+    client = LinkedInClient(BASE_URL, access_token="secret", rate=1000, burst=1000, **kwargs)
+    client._client = httpx.AsyncClient(base_url=BASE_URL, transport=httpx.MockTransport(handler))
+    return client
+
+
+class Upstream:
+    """MockTransport handler replying with the given responses in order"""
+
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def __call__(self, request):
+        self.requests.append(request)
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_allows_bursts_then_paces(clock):
+    bucket = TokenBucket(rate=2, capacity=3)
+    for _ in range(3):
+        await bucket.acquire()
+    assert clock.sleeps == []
+
+    await bucket.acquire()
+    assert clock.sleeps == [pytest.approx(0.5)]
+
+    clock.now += 10
+    for _ in range(3):
+        await bucket.acquire()
+    # Refill is capped at capacity however long the bucket sat idle
+    assert len(clock.sleeps) == 1
+    await bucket.acquire()
+    assert len(clock.sleeps) == 2
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_serves_waiters_in_order(clock):
+    bucket = TokenBucket(rate=1, capacity=1)
+    order = []
+
+    async def worker(i):
+        await bucket.acquire()
+        order.append(i)
+
+    await asyncio.gather(*(worker(i) for i in range(4)))
+    assert order == [0, 1, 2, 3]
+    assert clock.now == pytest.approx(1003.0)
+
+
+def test_retry_after_seconds():
+    assert retry_after_seconds(httpx.Response(429)) is None
+    assert retry_after_seconds(httpx.Response(429, headers={"Retry-After": "7"})) == 7.0
+    assert retry_after_seconds(httpx.Response(429, headers={"Retry-After": "-3"})) == 0.0
+    assert retry_after_seconds(httpx.Response(429, headers={"Retry-After": "soon"})) is None
+    when = format_datetime(datetime.now(timezone.utc) + timedelta(seconds=120), usegmt=True)
+    assert 100 < retry_after_seconds(httpx.Response(429, headers={"Retry-After": when})) <= 120
+
+
+@pytest.mark.asyncio
+async def test_retries_throttled_and_server_errors(clock):
+    upstream = Upstream(
+        httpx.Response(429, headers={"Retry-After": "5"}),
+        httpx.Response(503),
+        httpx.Response(200, json={"id": "abc"}),
+    )
+    client = make_client(upstream, backoff_base=1.0)
+    assert await client.get_json("/profiles/abc") == {"id": "abc"}
+    assert len(upstream.requests) == 3
+    assert clock.sleeps[0] == 5.0  # Retry-After honoured
+    assert 0 <= clock.sleeps[1] <= 2.0  # jittered backoff for attempt 1
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_retry_after_is_capped(clock):
+    upstream = Upstream(httpx.Response(429, headers={"Retry-After": "3600"}), httpx.Response(200, json={}))
+    client = make_client(upstream, backoff_max=30.0)
+    await client.get_json("/profiles/abc")
+    assert clock.sleeps == [30.0]
+
+
+@pytest.mark.asyncio
+async def test_retries_transport_errors(clock):
+    upstream = Upstream(httpx.ConnectError("refused"), httpx.Response(200, json={"id": "abc"}))
+    client = make_client(upstream)
+    assert await client.get_json("/profiles/abc") == {"id": "abc"}
+    assert len(upstream.requests) == 2
+
+
+@pytest.mark.asyncio
+async def test_gives_up_after_max_retries(clock):
+    upstream = Upstream(*[httpx.Response(502) for _ in range(3)])
+    client = make_client(upstream, max_retries=2)
+    with pytest.raises(LinkedInAPIError) as error:
+        await client.get_json("/profiles/abc")
+    assert error.value.status_code == 502
+    assert len(upstream.requests) == 3
+
+    upstream = Upstream(*[httpx.ConnectError("refused") for _ in range(3)])
+    client = make_client(upstream, max_retries=2)
+    with pytest.raises(LinkedInAPIError, match="unreachable"):
+        await client.get_json("/profiles/abc")
+
+
+@pytest.mark.asyncio
+async def test_client_errors_are_not_retried(clock):
+    upstream = Upstream(httpx.Response(404))
+    client = make_client(upstream)
+    with pytest.raises(LinkedInAPIError) as error:
+        await client.get_json("/profiles/missing")
+    assert error.value.status_code == 404
+    assert len(upstream.requests) == 1
+    assert clock.sleeps == []
+
+
+@pytest.mark.asyncio
+async def test_get_if_modified(clock):
+    last_modified = "Mon, 01 Jan 2024 12:00:00 GMT"
+    upstream = Upstream(
+        httpx.Response(200, json={"id": "abc"}, headers={"ETag": '"v1"', "Last-Modified": last_modified}),
+        httpx.Response(304),
+    )
+    client = make_client(upstream)
+
+    response = await client.get_if_modified("/profiles/abc")
+    assert response.json() == {"id": "abc"}
+    assert "If-None-Match" not in upstream.requests[0].headers
+
+    assert await client.get_if_modified("/profiles/abc", response.headers["ETag"], last_modified) is None
+    conditional = upstream.requests[1].headers
+    assert conditional["If-None-Match"] == '"v1"'
+    assert conditional["If-Modified-Since"] == last_modified
+
+
+def test_from_env(monkeypatch):
+    monkeypatch.delenv("LINKEDIN_API_URL", raising=False)
+    assert LinkedInClient.from_env() is None
+
+    monkeypatch.setenv("LINKEDIN_API_URL", BASE_URL + "/")
+    monkeypatch.setenv("LINKEDIN_API_RATE_LIMIT", "60")
+    monkeypatch.setenv("LINKEDIN_API_WINDOW", "60")
+    client = LinkedInClient.from_env()
+    assert client.base_url == BASE_URL
+    assert client.bucket.rate == 1.0
@@ -0,0 +1,44 @@
+import numpy as np
+import pytest
+
+from src.backend.shared.postings import PostingList, membership
+
+
+@pytest.mark.parametrize("gap, dtype", [(1, np.uint8), (300, np.uint16), (70000, np.uint32)])
+def test_narrowest_delta_dtype(gap, dtype):
+    ids = np.arange(5, dtype=np.int64) * gap + 1000
+    posting = PostingList(ids)
+
+    assert posting._deltas.dtype == dtype
+    assert posting.ids().tolist() == ids.tolist()
+    assert len(posting) == ids.size
+    assert posting.nbytes == ids.size * np.dtype(dtype).itemsize
+
+
+def test_buffered_adds_and_removes_fold_on_read():
+    posting = PostingList(np.array([2, 4, 6], dtype=np.int64))
+    posting.add(5)
+    posting.remove(4)
+    posting.add(4)      # cancels the pending remove
+    posting.add(100)
+    posting.remove(100)  # cancels the pending add
+    posting.remove(2)
+
+    assert len(posting) == 3
+    assert posting.ids().tolist() == [4, 5, 6]
+    assert posting.ids().tolist() == [4, 5, 6]
+
+
+def test_empty_posting():
+    posting = PostingList()
+    assert posting.ids().tolist() == []
+    posting.add(3)
+    assert posting.ids().tolist() == [3]
+    posting.remove(3)
+    assert posting.ids().tolist() == [] and len(posting) == 0
+
+
+def test_membership():
+    sorted_ids = np.array([1, 3, 5], dtype=np.int64)
+    assert membership(np.array([0, 1, 4, 5, 9]), sorted_ids).tolist() == [False, True, False, True, False]
+    assert membership(np.array([1, 2]), np.empty(0, dtype=np.int64)).tolist() == [False, False]
@@ -0,0 +1,213 @@
+from datetime import datetime, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.backend.shared.cache import LRUCache, VersionedCache, version_of
+from src.backend.shared.database import get_db
+from src.backend.shared.models import User, UserProfile
+from src.backend.services.user_service.auth import create_access_token
+from src.backend.services.user_service.main import app
+from src.backend.services.user_service.profile_cache import CachedProfile, ProfileCache, profile_cache
+
+T0 = datetime(2024, 1, 1, 12, 0, 0)
+EMAIL = "ada@example.com"
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr("src.backend.shared.cache.time.monotonic", clock)
+    return clock
+
+
+def test_version_of():
+    assert version_of(None) == 0
+    assert version_of(datetime(1970, 1, 1)) == 0
+    assert version_of(T0 + timedelta(microseconds=1)) == version_of(T0) + 1
+
+
+def test_versioned_cache_is_abstract():
+    with pytest.raises(TypeError):
+        VersionedCache()
+
+
+def test_lru_only_replaces_with_newer_versions(clock):
+    cache = LRUCache(ttl=60)
+    assert cache.get("a") is None
+    assert cache.set("a", 2, b"two")
+    assert not cache.set("a", 1, b"one")
+    assert not cache.set("a", 2, b"again")
+    assert cache.get("a") == (2, b"two")
+    assert cache.set("a", 3, None)
+    assert cache.get("a") == (3, None)
+
+
+def test_lru_expires_entries(clock):
+    cache = LRUCache(ttl=60)
+    cache.set("a", 2, b"two")
+    clock.now += 61
+    assert cache.get("a") is None
+    cache.set("a", 2, b"two")
+    clock.now += 61
+    # An expired entry no longer blocks older versions
+    assert cache.set("a", 1, b"one")
+    assert cache.get("a") == (1, b"one")
+
+
+def test_lru_evicts_least_recently_used(clock):
+    cache = LRUCache(max_entries=2)
+    cache.set("a", 1, b"a")
+    cache.set("b", 1, b"b")
+    cache.get("a")
+    cache.set("c", 1, b"c")
+    assert cache.get("b") is None
+    assert cache.get("a") == (1, b"a")
+    assert cache.get("c") == (1, b"c")
+
+
+def make_profile(db, email=EMAIL, updated_at=T0):
+    user = User(email=email, hashed_password="x")
+    db.add(user)
+    db.commit()
+    profile = UserProfile(user_id=user.id, first_name="Ada", last_name="Lovelace", created_at=updated_at,
+                          updated_at=updated_at)
+    db.add(profile)
+    db.commit()
+    return profile
+
+
+def test_store_and_get(db, clock):
+    cache = ProfileCache(LRUCache())
+    profile = make_profile(db)
+    stored = cache.store(EMAIL, profile)
+    assert stored.etag and b'"first_name":"Ada"' in stored.body
+    assert cache.get(EMAIL) == stored
+    assert cache.get("other@example.com") is None
+
+
+def test_disabled_cache(db):
+    cache = ProfileCache(None)
+    stored = cache.store(EMAIL, make_profile(db))
+    assert stored.body is not None
+    assert cache.get(EMAIL) is None
+
+
+def test_store_missing_is_superseded_by_any_profile(db, clock):
+    cache = ProfileCache(LRUCache())
+    cache.store_missing(EMAIL)
+    assert cache.get(EMAIL) == CachedProfile(None, None)
+    profile = make_profile(db)
+    cache.store(EMAIL, profile)
+    assert cache.get(EMAIL).body is not None
+
+
+def test_tombstone_blocks_the_deleted_version(db, clock):
+    cache = ProfileCache(LRUCache())
+    profile = make_profile(db)
+    cache.store(EMAIL, profile)
+    cache.forget(EMAIL, profile.updated_at)
+    assert cache.get(EMAIL) == CachedProfile(None, None)
+
+    # A slow reader that loaded the profile before the delete cannot bring it back
+    cache.store(EMAIL, profile)
+    assert cache.get(EMAIL) == CachedProfile(None, None)
+    # Neither can a reader that found no profile
+    cache.store_missing(EMAIL)
+    assert cache.get(EMAIL) == CachedProfile(None, None)
+
+    # A profile created afterwards supersedes the tombstone
+    profile.updated_at = T0 + timedelta(seconds=1)
+    db.commit()
+    cache.store(EMAIL, profile)
+    assert cache.get(EMAIL).body is not None
+
+
+@pytest.fixture
+def client(session_factory, monkeypatch):
+    def override_get_db():
+        session = session_factory()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    monkeypatch.setattr(profile_cache, "backend", LRUCache())
+    app.dependency_overrides[get_db] = override_get_db
+    session = session_factory()
+    session.add(User(email=EMAIL, hashed_password="x"))
+    session.commit()
+    session.close()
+
+    client = TestClient(app)
+    client.headers["Authorization"] = f"Bearer {create_access_token(data={'sub': EMAIL})}"
+    yield client
+    app.dependency_overrides.clear()
+
+
+PROFILE = {"first_name": "Ada", "last_name": "Lovelace", "industry": "Technology"}
+
+
+def test_get_profile_etag_and_not_modified(client):
+    assert client.get("/api/profile/me").status_code == 404
+    assert client.post("/api/profile", json=PROFILE).status_code == 201
+
+    response = client.get("/api/profile/me")
+    assert response.status_code == 200
+    assert response.json()["industry"] == "Technology"
+    etag = response.headers["ETag"]
+
+    response = client.get("/api/profile/me", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+
+    # A version-only lookup also answers 304 when the entry is not cached
+    profile_cache.backend.clear()
+    assert client.get("/api/profile/me", headers={"If-None-Match": etag}).status_code == 304
+
+    response = client.put("/api/profile", json={"industry": "Finance"})
+    assert response.status_code == 200
+    response = client.get("/api/profile/me", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.json()["industry"] == "Finance"
+    assert response.headers["ETag"] != etag
+
+
+def test_create_checks_the_database_not_the_cache(client, session_factory):
+    assert client.post("/api/profile", json=PROFILE).status_code == 201
+    assert client.post("/api/profile", json=PROFILE).status_code == 400
+
+    # Deleted out of band while the cache still holds the profile
+    session = session_factory()
+    session.query(UserProfile).delete()
+    session.commit()
+    session.close()
+    assert client.get("/api/profile/me").status_code == 200
+    assert client.post("/api/profile", json=PROFILE).status_code == 201
+
+
+def test_delete_then_recreate(client):
+    assert client.delete("/api/profile").status_code == 404
+    assert client.post("/api/profile", json=PROFILE).status_code == 201
+    assert client.get("/api/profile/me").status_code == 200
+
+    assert client.delete("/api/profile").status_code == 204
+    assert client.get("/api/profile/me").status_code == 404
+
+    assert client.post("/api/profile", json={**PROFILE, "industry": "Finance"}).status_code == 201
+    response = client.get("/api/profile/me")
+    assert response.status_code == 200
+    assert response.json()["industry"] == "Finance"
+
+
+def test_unknown_user_is_unauthorized(client):
+    client.headers["Authorization"] = f"Bearer {create_access_token(data={'sub': 'nobody@example.com'})}"
+    assert client.get("/api/profile/me").status_code == 401
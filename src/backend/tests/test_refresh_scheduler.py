@@ -0,0 +1,183 @@
+from datetime import datetime, timedelta
+
+import httpx
+import pytest
+
+from src.backend.services.company_service.refresh_scheduler import (
+    RefreshCandidate,
+    RefreshStats,
+    apply_results,
+    content_hash,
+    employee_fields,
+    refresh_priority,
+    select_candidates,
+)
+from src.backend.services.profile_service.linkedin_client import LinkedInAPIError
+from src.backend.shared.models import Company, CompanyEmployee, ConnectionRecommendation
+
+PASS_STARTED = datetime(2024, 1, 1, 0, 0)
+CREATED = datetime(2023, 6, 1)
+
+PROFILE = {"first_name": "Ada", "last_name": "Lovelace", "headline": "Engineer",
+           "current_position": "Staff Engineer", "skills": ["python", "sql"]}
+
+
+@pytest.fixture
+def employee(db):
+    company = Company(name="Acme", linkedin_company_id="acme")
+    db.add(company)
+    db.flush()
+    employee = CompanyEmployee(
+        company_id=company.id, linkedin_profile_id="ada", name="Ada Lovelace", position="Engineer",
+        skills=["python"], source_etag='"v1"', content_hash="old", created_at=CREATED, updated_at=CREATED,
+    )
+    db.add(employee)
+    db.commit()
+    return employee
+
+
+def candidate_for(employee, stored_hash=None) -> RefreshCandidate:
+    return RefreshCandidate(
+        CompanyEmployee, employee.id, employee.linkedin_profile_id, employee.source_etag, None,
+        stored_hash or employee.content_hash, employee.updated_at, 86400.0, 0, 0.0,
+    )
+
+
+def ok(data, etag='"v2"') -> httpx.Response:
+    return httpx.Response(200, json=data, headers={"ETag": etag})
+
+
+def reload(db, employee) -> CompanyEmployee:
+    db.expire_all()
+    return db.get(CompanyEmployee, employee.id)
+
+
+def test_not_modified_only_records_the_check(db, employee):
+    stats = RefreshStats()
+    apply_results(db, [(candidate_for(employee), None, None)], stats)
+
+    row = reload(db, employee)
+    assert stats == {"not_modified": 1}
+    assert row.last_fetched_at > PASS_STARTED
+    assert row.updated_at == CREATED
+    assert row.position == "Engineer"
+    assert row.source_etag == '"v1"'
+
+
+def test_unchanged_content_keeps_updated_at_and_stores_new_validators(db, employee):
+    stats = RefreshStats()
+    same_hash = content_hash(employee_fields(PROFILE))
+    apply_results(db, [(candidate_for(employee, same_hash), ok(PROFILE), None)], stats)
+
+    row = reload(db, employee)
+    assert stats == {"unchanged": 1}
+    assert row.updated_at == CREATED
+    assert row.source_etag == '"v2"'
+    assert row.position == "Engineer"
+
+
+def test_changed_content_is_written_and_stamped_at_write_time(db, employee):
+    stats = RefreshStats()
+    before_write = datetime.utcnow()
+    apply_results(db, [(candidate_for(employee), ok(PROFILE), None)], stats)
+
+    row = reload(db, employee)
+    assert stats == {"changed": 1}
+    assert row.position == "Staff Engineer"
+    assert row.skills == ["python", "sql"]
+    assert row.content_hash == content_hash(employee_fields(PROFILE))
+    assert row.source_etag == '"v2"'
+    # A pass can run for hours; followers of updated_at must see the write as new
+    assert row.updated_at >= before_write
+    assert row.last_fetched_at == row.updated_at
+
+
+def test_errors_only_record_the_check_when_gone_upstream(db, employee):
+    stats = RefreshStats()
+    apply_results(db, [(candidate_for(employee), None, LinkedInAPIError("boom", status_code=503))], stats)
+    assert reload(db, employee).last_fetched_at is None
+
+    apply_results(db, [(candidate_for(employee), None, LinkedInAPIError("gone", status_code=404))], stats)
+    row = reload(db, employee)
+    assert stats == {"errors": 2}
+    assert row.last_fetched_at is not None
+    assert row.updated_at == CREATED
+
+
+def test_explicit_now_is_used_for_the_whole_batch(db, employee):
+    written = PASS_STARTED + timedelta(hours=5)
+    apply_results(db, [(candidate_for(employee), ok(PROFILE), None)], RefreshStats(), now=written)
+    row = reload(db, employee)
+    assert row.updated_at == written
+    assert row.last_fetched_at == written
+
+
+def add_employee(db, company, profile_id, checked_days_ago=None, recommendations=0, upstream=True):
+    employee = CompanyEmployee(
+        company_id=company.id, name=profile_id, linkedin_profile_id=profile_id if upstream else None,
+        updated_at=PASS_STARTED - timedelta(days=400),
+        last_fetched_at=PASS_STARTED - timedelta(days=checked_days_ago) if checked_days_ago is not None else None,
+    )
+    db.add(employee)
+    db.flush()
+    db.add_all(ConnectionRecommendation(user_id=user_id, employee_id=employee.id, total_score=0.5)
+               for user_id in range(recommendations))
+    return employee
+
+
+@pytest.fixture
+def company(db):
+    # Checked recently, so only employees are due unless a test ages it
+    company = Company(name="Acme", linkedin_company_id="acme", last_fetched_at=PASS_STARTED - timedelta(hours=1))
+    db.add(company)
+    db.flush()
+    return company
+
+
+def test_priority_orders_by_staleness_weighted_by_demand(db, company):
+    add_employee(db, company, "stale", checked_days_ago=10)
+    add_employee(db, company, "popular", checked_days_ago=4, recommendations=20)
+    add_employee(db, company, "fresh", checked_days_ago=2)
+    add_employee(db, company, "never", checked_days_ago=None)
+    add_employee(db, company, "recent", checked_days_ago=0.5, recommendations=100)
+    add_employee(db, company, "no-upstream", checked_days_ago=30, upstream=False)
+    db.commit()
+
+    candidates = select_candidates(db, budget=10, now=PASS_STARTED)
+
+    # 4 days x (1 + ln 21) outranks 10 days x 1; "recent" is younger than min_age
+    assert [c.upstream_id for c in candidates] == ["never", "popular", "stale", "fresh"]
+    popular = candidates[1]
+    assert popular.demand == 20
+    assert popular.age_seconds == pytest.approx(4 * 86400)
+    assert popular.priority == pytest.approx(refresh_priority(4 * 86400, 20))
+    # Never fetched: aged from updated_at
+    assert candidates[0].age_seconds == pytest.approx(400 * 86400)
+
+
+def test_budget_limits_across_employees_and_companies(db, company):
+    company.last_fetched_at = PASS_STARTED - timedelta(days=30)
+    for days in (3, 5, 7):
+        add_employee(db, company, f"employee-{days}", checked_days_ago=days, recommendations=1)
+    db.commit()
+
+    candidates = select_candidates(db, budget=2, now=PASS_STARTED)
+
+    # The company's demand is every recommendation of its employees
+    assert [(c.model, c.upstream_id) for c in candidates] == [(Company, "acme"), (CompanyEmployee, "employee-7")]
+    assert candidates[0].demand == 3
+    assert candidates[0].path == "/companies/acme"
+    assert candidates[1].path == "/profiles/employee-7"
+
+    employees_only = select_candidates(db, budget=2, now=PASS_STARTED, include_companies=False)
+    assert [c.upstream_id for c in employees_only] == ["employee-7", "employee-5"]
+
+
+def test_demand_weight_zero_is_pure_staleness(db, company):
+    add_employee(db, company, "stale", checked_days_ago=10)
+    add_employee(db, company, "popular", checked_days_ago=4, recommendations=20)
+    db.commit()
+
+    candidates = select_candidates(db, budget=10, now=PASS_STARTED, demand_weight=0.0, min_age=timedelta(days=3))
+
+    assert [c.upstream_id for c in candidates] == ["stale", "popular"]
@@ -0,0 +1,79 @@
+import numpy as np
+
+from src.backend.services.recommendation_service.skill_embeddings import (
+    ProfileVectorStore,
+    SimHashIndex,
+    SkillEmbeddings,
+    hash_embedding,
+)
+
+
+def make_store(ann: bool = False) -> ProfileVectorStore:
+    embeddings = SkillEmbeddings.build(["python", "sql", "java", "kubernetes", "react"])
+    return ProfileVectorStore(embeddings, SimHashIndex(embeddings.dimensions) if ann else None)
+
+
+def test_hash_embedding_is_normalized_and_deterministic():
+    vector = hash_embedding("Machine Learning")
+    assert vector.dtype == np.float32
+    assert np.isclose(np.linalg.norm(vector), 1.0)
+    assert np.array_equal(vector, hash_embedding("machine learning"))
+
+
+def test_profile_vector_ignores_order_and_case():
+    embeddings = SkillEmbeddings.build(["python", "sql"])
+    assert np.array_equal(embeddings.profile_vector(["SQL", "python"]), embeddings.profile_vector(["python", "sql"]))
+    assert not embeddings.profile_vector([]).any()
+
+
+def test_removed_row_is_reused_without_touching_live_employees():
+    store = make_store()
+    store.set(1, ["python"])
+    store.set(2, ["sql"])
+    store.set(3, ["java"])
+    employee_3 = store.vector_for(3)
+
+    store.remove(1)
+    store.set(4, ["kubernetes"])
+
+    assert np.array_equal(store.vector_for(3), employee_3)
+    assert np.array_equal(store.vector_for(4), store.embeddings.profile_vector(["kubernetes"]))
+
+    store.remove(4)
+    assert np.array_equal(store.vector_for(3), employee_3)
+    assert store.vector_for(4) is None
+    assert len(store) == 2
+
+
+def test_similarity_scores_unknown_and_removed_employees_zero():
+    store = make_store()
+    store.set(1, ["python"])
+    store.set(2, ["react"])
+    store.remove(2)
+    user = store.embeddings.profile_vector(["python"])
+
+    scores = store.similarity(user, np.array([1, 2, 999999, -1]))
+
+    assert np.isclose(scores[0], 1.0)
+    assert scores[1:].tolist() == [0.0, 0.0, 0.0]
+
+
+def test_apply_changes_upserts_then_deletes():
+    store = make_store()
+    store.apply_changes([{"id": 1, "skills": ["python"]}, {"id": 2, "skills": ["sql"]}], [])
+    store.apply_changes([{"id": 1, "skills": ["java"]}], [2])
+
+    assert np.array_equal(store.vector_for(1), store.embeddings.profile_vector(["java"]))
+    assert store.vector_for(2) is None
+
+
+def test_most_similar_excludes_query_employee():
+    store = make_store(ann=True)
+    store.set(1, ["python", "sql"])
+    store.set(2, ["python", "sql"])
+    store.set(3, ["react"])
+
+    similar = store.most_similar(store.vector_for(1), limit=5, exclude=1)
+
+    assert similar[0][0] == 2
+    assert 1 not in [employee_id for employee_id, _ in similar]